@@ -0,0 +1,20 @@
+import os
+
+# Load the app in the master process, so that the dictionary is built once and shared by every worker copy-on-write.
+# Set GUNICORN_PRELOAD=0 to have each worker load it instead.
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") != "0"
+
+
+def when_ready(server):
+    """Runs in the master once the app is loaded, before any workers are forked"""
+    if server.cfg.preload_app:
+        from lauvinko.lang.dictionary import Dictionary
+        from lauvinko.warmup import warm_up, freeze
+
+        # Compiled first, so that the dictionary which is warmed up is the one read from the lexicon
+        if Dictionary.compile_lexicon():
+            server.log.info("Compiled the dictionary lexicon")
+
+        warm_up()
+        freeze()
+        server.log.info("Warmed up and froze the dictionary before forking")
@@ -0,0 +1,43 @@
+import os
+import time
+from typing import Any, Callable, Optional
+
+# How often a dictionary file is checked for changes, in seconds. 0 checks it every time it is loaded.
+CHECK_INTERVAL = float(os.getenv("DICTIONARY_CHECK_INTERVAL", "1"))
+
+
+class ChangeDetector:
+    """Watches a file for changes by its modification time, statting it at most once every interval seconds,
+    and tells its subscribers about whatever has been rebuilt from it since it last changed.
+    Between checks, the file is assumed to be unchanged, so an edit can take up to interval seconds to be noticed.
+    """
+    def __init__(self, filename: str, interval: float = CHECK_INTERVAL):
+        self.filename = filename
+        self.interval = interval
+        self.checked_at: Optional[float] = None
+        self.subscribers: list[Callable[[Any], None]] = []
+
+    def changed_since(self, mtime: float) -> bool:
+        """Whether the file has been modified since it had mtime, as far as is known"""
+        now = time.monotonic()
+
+        if self.checked_at is not None and now - self.checked_at < self.interval:
+            return False
+
+        self.checked_at = now
+        return os.path.getmtime(self.filename) != mtime
+
+    def expire(self):
+        """Makes the next check stat the file, such as after writing to it"""
+        self.checked_at = None
+
+    def subscribe(self, callback: Callable[[Any], None]):
+        """callback is called with what is rebuilt from the file each time it changes, so that it can flush caches"""
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[Any], None]):
+        self.subscribers.remove(callback)
+
+    def notify(self, value: Any):
+        for callback in list(self.subscribers):
+            callback(value)
@@ -1,13 +1,26 @@
-import datetime
+import contextlib
+import contextvars
+import functools
+import hashlib
 import json
+import os
 import os.path
+import threading
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from lauvinko.lang.lauvinko.morphology import LauvinkoLemma, LauvinkoCase
 from lauvinko.lang.shared.morphology import MorphosyntacticType
 from lauvinko.lang.shared.semantics import KasanicStemCategory, Language
 from lauvinko.lang.proto_kasanic.morphology import pkm, ProtoKasanicLemma
 from lauvinko.lang.lauvinko.diachronic.from_pk import ProtoKasanicOrigin
+from lauvinko.lang.dictionary.changes import ChangeDetector
 from lauvinko.lang.dictionary.entry import DictEntry
+from lauvinko.lang.dictionary.lazy import LazyEntries, JsonEntries
+from lauvinko.lang.dictionary.lexicon import Lexicon, LexiconEntries
+from lauvinko.lang.dictionary.paradigms import ParadigmTable
+from lauvinko.lang.dictionary.query import EntryIndex, EntryQuery
+from lauvinko.lang.dictionary.search import SearchIndex
 
 MODAL_PREFIXES = {
     "if": "tti+L",
@@ -76,40 +89,352 @@ SEX_SUFFIXES = {
 
 DICTIONARY_FILENAME = "lauvinko/lang/dictionary.json"
 
+LANG_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+
+def lexicon_filename(filename: str) -> str:
+    return os.path.splitext(filename)[0] + ".lexicon"
+
+
+def file_version(filename: str) -> str:
+    with open(filename, "rb") as fh:
+        return hashlib.sha1(fh.read()).hexdigest()
+
+
+def current_lexicon(filename: str) -> Optional[Lexicon]:
+    """The lexicon compiled from filename, or None if there is none, or if it was compiled from a different file
+    or by different code
+    """
+    lexicon = Lexicon.open(lexicon_filename(filename))
+
+    if lexicon is None or lexicon.header != (file_version(filename), source_fingerprint()):
+        return None
+
+    return lexicon
+
+
+def entry_digest(json_entry: dict) -> str:
+    return hashlib.sha1(json.dumps(json_entry, sort_keys=True).encode()).hexdigest()
+
+
+@functools.cache
+def source_fingerprint() -> str:
+    """A digest of the code that forms are generated with, so that lexicons compiled by older code are not used"""
+    digest = hashlib.sha1()
+
+    for dirpath, dirnames, filenames in os.walk(LANG_DIR):
+        dirnames.sort()
+
+        for name in sorted(filenames):
+            if name.endswith(".py"):
+                with open(os.path.join(dirpath, name), "rb") as fh:
+                    digest.update(fh.read())
+
+    return digest.hexdigest()
+
+
+@functools.cache
+def closed_class_entries() -> Mapping[str, DictEntry]:
+    """The entries of the closed classes, which are built from the tables above once per process, along with all of
+    their forms, and added to every dictionary by reference
+    """
+    entries = {}
+
+    fill_in_prefix_set(
+        entries,
+        MODAL_PREFIXES,
+        MorphosyntacticType.MODAL_PREFIX,
+        wrap_ident=False,
+    )
+    fill_in_prefix_set(
+        entries,
+        TERTIARY_ASPECT_PREFIXES,
+        MorphosyntacticType.TERTIARY_ASPECT_PREFIX,
+    )
+    fill_in_prefix_set(
+        entries,
+        TOPIC_AGREEMENT_PREFIXES,
+        MorphosyntacticType.TOPIC_AGREEMENT_PREFIX,
+    )
+    fill_in_prefix_set(
+        entries,
+        TOPIC_CASE_PREFIXES,
+        MorphosyntacticType.TOPIC_CASE_PREFIX,
+    )
+    fill_in_prefix_set(
+        entries,
+        SEX_SUFFIXES,
+        MorphosyntacticType.SEX_SUFFIX,
+    )
+
+    fill_in_adpositions(entries)
+
+    ParadigmTable.build(entries)
+
+    return MappingProxyType(entries)
+
+
+def fill_in_prefix_set(entries: dict[str, DictEntry], prefix_set: dict[str, str], mstype: MorphosyntacticType,
+                       wrap_ident: bool = True):
+    for ident, informal_transcription in prefix_set.items():
+        if wrap_ident:
+            ident = f"${ident}$"
+
+        pk_lemma = ProtoKasanicLemma(
+            ident=ident,
+            definition="",
+            category=KasanicStemCategory.UNINFLECTED,
+            mstype=mstype,
+            forms={},
+            generic_morph=pkm(informal_transcription, stress_position=None)
+        )
+
+        lv_lemma = LauvinkoLemma.from_pk(pk_lemma)
+
+        entries[ident] = DictEntry(
+            languages={
+                Language.PK: pk_lemma,
+                Language.LAUVINKO: lv_lemma,
+            },
+            ident=ident,
+            category=KasanicStemCategory.UNINFLECTED,
+            mstype=mstype,
+            origin=ProtoKasanicOrigin(pk_lemma)
+        )
+
+
+def fill_in_adpositions(entries: dict[str, DictEntry]):
+    for case, informal_transcription in ADPOSITIONS:
+        if isinstance(case, str):
+            ident = case
+            definition = case.title() + "."
+        else:
+            ident = f"${case.abbreviation}$"
+            definition = f"{case.name.title()} adposition"
+
+        pk_lemma = ProtoKasanicLemma(
+            ident=ident,
+            definition=definition,
+            category=KasanicStemCategory.UNINFLECTED,
+            mstype=MorphosyntacticType.ADPOSITION,
+            forms={},
+            generic_morph=pkm(informal_transcription),
+        )
+
+        lv_lemma = LauvinkoLemma.from_pk(pk_lemma)
+
+        entries[ident] = DictEntry(
+            languages={
+                Language.PK: pk_lemma,
+                Language.LAUVINKO: lv_lemma,
+            },
+            ident=ident,
+            category=KasanicStemCategory.UNINFLECTED,
+            mstype=MorphosyntacticType.ADPOSITION,
+            origin=ProtoKasanicOrigin(pk_lemma),
+        )
+
+
+# Maps a filename to the modification time of the file when it was read, and the dictionary read from it.
+# Entries are only ever replaced whole, so a reader never sees a dictionary with the wrong mtime.
 DICTIONARY_CACHE: dict[str, tuple[float, "Dictionary"]] = {}
 
+# Held by the one thread reloading a dictionary, while the others carry on with the dictionary they already have
+RELOAD_LOCK = threading.Lock()
+
+# The dictionary pinned by Dictionary.pinned, which Dictionary.main returns in its place
+PINNED_DICTIONARY: contextvars.ContextVar[Optional["Dictionary"]] = contextvars.ContextVar(
+    "PINNED_DICTIONARY",
+    default=None,
+)
+
+# Watches each dictionary file loaded, and is told of the new dictionary when one is reloaded
+CHANGE_DETECTORS: dict[str, ChangeDetector] = {}
+
+# Held while a detector is registered. It isn't RELOAD_LOCK, since reloading notifies the detector with that held.
+CHANGE_DETECTORS_LOCK = threading.Lock()
+
 
 class Dictionary:
-    def __init__(self, entries: dict[str, DictEntry]):
+    def __init__(self, entries: dict[str, DictEntry], version: Optional[str] = None,
+                 entry_digests: Optional[dict[str, str]] = None, lexicon: Optional[Lexicon] = None):
+        """version identifies the dictionary file contents this was built from, and is None for derived dictionaries.
+        entry_digests has the entry_digest of the JSON each entry was read from, if it was read from a file.
+        lexicon is the compiled lexicon the dictionary was opened from, if it was, which the entry digests and indexes
+        are decoded from when they are first used.
+        """
         self.entries = entries
+        self.version = version
+        self.lexicon = lexicon
+        self._entry_digests = entry_digests
+        self.paradigms: Optional[ParadigmTable] = None
+        self._index: Optional[EntryIndex] = None
+        self._search_index: Optional[SearchIndex] = None
         self.fill_in_closed_classes()
 
+    @property
+    def entry_digests(self) -> dict[str, str]:
+        if self._entry_digests is None:
+            self._entry_digests = (self.lexicon and self.lexicon.record("entry_digests")) or {}
+
+        return self._entry_digests
+
+    @property
+    def index(self) -> EntryIndex:
+        """Decoded from the lexicon or built on first use, unless it was built along with the dictionary"""
+        if self._index is None and self.lexicon is not None:
+            self._index = self.lexicon.record("index")
+
+        if self._index is None:
+            self._index = EntryIndex(self.entries)
+
+        return self._index
+
+    @index.setter
+    def index(self, index: EntryIndex):
+        self._index = index
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Decoded from the lexicon or built on first use, unless it was built along with the dictionary"""
+        if self._search_index is None and self.lexicon is not None:
+            search_index = self.lexicon.record("search_index")
+
+            if search_index is not None:
+                search_index.entries = self.entries
+                search_index.index = self.index
+                self._search_index = search_index
+
+        if self._search_index is None:
+            self._search_index = SearchIndex(self.entries, index=self.index)
+
+        return self._search_index
+
+    @search_index.setter
+    def search_index(self, search_index: SearchIndex):
+        self._search_index = search_index
+
     @staticmethod
-    def load(filename=DICTIONARY_FILENAME) -> "Dictionary":
-        last_fetched, dictionary = DICTIONARY_CACHE.get(filename, (None, None))
+    def load(filename=DICTIONARY_FILENAME, processes: int = 1, lazy: bool = False) -> "Dictionary":
+        """Returns the dictionary in filename, reloading it if the file has changed.
+        Only one thread reloads at a time. Until it is done, other threads are given the dictionary from before,
+        or wait for it if there isn't one yet.
+        processes is the number of processes to build the paradigm table with, if there is no usable lexicon.
+        If lazy is set and there is no usable lexicon, entries are only read when they are first looked up.
+        That only helps scripts and tests which look up a few entries by ident. The indexes, and so queries, searches
+        and to_json, read every entry, which the server does at startup, so it always loads eagerly.
+        Loading never compiles a lexicon, which compile_lexicon does.
+        """
+        mtime, dictionary = DICTIONARY_CACHE.get(filename, (None, None))
 
-        if dictionary is None or (os.path.getmtime(filename) > last_fetched):
-            print(f"{'re' if dictionary else ''}loading {filename}...")
+        if dictionary is not None and not Dictionary.changes(filename).changed_since(mtime):
+            return dictionary
 
-            dictionary = Dictionary.from_file(filename)
+        if not RELOAD_LOCK.acquire(blocking=(dictionary is None)):
+            return dictionary
 
-            DICTIONARY_CACHE[filename] = (
-                datetime.datetime.now().timestamp(),
-                dictionary,
+        try:
+            mtime, dictionary = DICTIONARY_CACHE.get(filename, (None, None))
+
+            if dictionary is None or os.path.getmtime(filename) != mtime:
+                dictionary = Dictionary.reload(filename, dictionary, processes=processes, lazy=lazy)
+
+        finally:
+            RELOAD_LOCK.release()
+
+        return dictionary
+
+    @staticmethod
+    def reload(filename: str, previous: Optional["Dictionary"], processes: int = 1,
+               lazy: bool = False) -> "Dictionary":
+        """Reads filename into DICTIONARY_CACHE, reusing what it can from previous, the dictionary it was last read into.
+        Only called with RELOAD_LOCK held.
+        """
+        # read before the file is, so that an edit made while loading is picked up next time
+        mtime = os.path.getmtime(filename)
+
+        if previous is not None and previous.version == file_version(filename):
+            DICTIONARY_CACHE[filename] = (mtime, previous)
+            return previous
+
+        print(f"{'re' if previous else ''}loading {filename}...")
+
+        # After an edit, rebuilding the entries which changed is quicker than compiling a whole new lexicon
+        dictionary = None if previous else Dictionary.from_lexicon(filename)
+
+        if dictionary is None and lazy:
+            dictionary = Dictionary.from_file(filename, previous=previous, lazy=True)
+
+        elif dictionary is None:
+            dictionary = Dictionary.from_file(filename, previous=previous)
+            dictionary.build_paradigms(processes=processes)
+            dictionary.index = EntryIndex(dictionary.entries)
+            dictionary.search_index = SearchIndex(
+                dictionary.entries,
+                previous=previous and previous._search_index,
+                index=dictionary.index,
             )
 
+        DICTIONARY_CACHE[filename] = (mtime, dictionary)
+
+        Dictionary.changes(filename).notify(dictionary)
+
         return dictionary
 
+    @staticmethod
+    def changes(filename=DICTIONARY_FILENAME) -> ChangeDetector:
+        """The detector Dictionary.load checks filename for changes with.
+        Caches derived from the dictionary subscribe to it to be flushed when the dictionary is reloaded.
+        """
+        detector = CHANGE_DETECTORS.get(filename)
+
+        if detector is None:
+            with CHANGE_DETECTORS_LOCK:
+                detector = CHANGE_DETECTORS.get(filename)
+
+                if detector is None:
+                    detector = CHANGE_DETECTORS[filename] = ChangeDetector(filename)
+
+        return detector
+
+    @staticmethod
+    @contextlib.contextmanager
+    def pinned(dictionary: "Dictionary"):
+        """Makes Dictionary.main return dictionary in this thread or task until the block exits,
+        so that everything done for one request uses the same dictionary even if it is reloaded meanwhile
+        """
+        token = PINNED_DICTIONARY.set(dictionary)
+
+        try:
+            yield dictionary
+        finally:
+            PINNED_DICTIONARY.reset(token)
+
     def by_id(self, ident: str) -> DictEntry:
         return self.entries.get(ident)
 
     @staticmethod
-    def main_by_id(ident: str) -> DictEntry:
+    def main() -> "Dictionary":
+        pinned = PINNED_DICTIONARY.get()
+
+        if pinned is not None:
+            return pinned
+
         _, d = DICTIONARY_CACHE[DICTIONARY_FILENAME]
-        return d.by_id(ident)
+        return d
+
+    @staticmethod
+    def main_by_id(ident: str) -> DictEntry:
+        return Dictionary.main().by_id(ident)
+
+    def query(self) -> EntryQuery:
+        """Every entry, to be narrowed down by what is in the dictionary's EntryIndex"""
+        return EntryQuery(self.entries, self.index)
 
     def where(self, f):
+        """A new dictionary with the entries for which f is true, found by looking at every entry.
+        query is much quicker for selecting entries by anything it indexes.
+        """
         return Dictionary({
             ident: entry
             for ident, entry in self.entries.items()
@@ -117,106 +442,139 @@ class Dictionary:
         })
 
     @classmethod
-    def from_file(cls, filename=DICTIONARY_FILENAME) -> "Dictionary":
-        with open(filename, "r") as fh:
-            entries_dict = json.load(fh)
-
-        entries = {
-            ident: DictEntry.from_json_entry(ident=ident, json_entry=json_entry)
-            for ident, json_entry in entries_dict.items()
-        }
-
-        return cls(entries)
-
-    def fill_in_closed_classes(self):
-        self.fill_in_prefix_set(
-            MODAL_PREFIXES,
-            MorphosyntacticType.MODAL_PREFIX,
-            wrap_ident=False,
-        )
-        self.fill_in_prefix_set(
-            TERTIARY_ASPECT_PREFIXES,
-            MorphosyntacticType.TERTIARY_ASPECT_PREFIX,
-        )
-        self.fill_in_prefix_set(
-            TOPIC_AGREEMENT_PREFIXES,
-            MorphosyntacticType.TOPIC_AGREEMENT_PREFIX,
-        )
-        self.fill_in_prefix_set(
-            TOPIC_CASE_PREFIXES,
-            MorphosyntacticType.TOPIC_CASE_PREFIX,
-        )
-        self.fill_in_prefix_set(
-            SEX_SUFFIXES,
-            MorphosyntacticType.SEX_SUFFIX,
+    def from_file(cls, filename=DICTIONARY_FILENAME, previous: Optional["Dictionary"] = None,
+                  lazy: bool = False) -> "Dictionary":
+        """Entries whose JSON is unchanged since previous was read are taken from it as they are,
+        along with any forms already generated for them.
+        If lazy is set, every other entry is only read, and its forms generated, when it is first looked up,
+        so invalid entries aren't found until then.
+        """
+        with open(filename, "rb") as fh:
+            contents = fh.read()
+
+        entries_dict = json.loads(contents)
+
+        entries = {}
+        entry_digests = {}
+
+        for ident, json_entry in entries_dict.items():
+            entry_digests[ident] = digest = entry_digest(json_entry)
+
+            if previous is not None and previous.entry_digests.get(ident) == digest:
+                if lazy and isinstance(previous.entries, LazyEntries):
+                    entry = previous.entries.peek(ident)  # entries aren't built just to be reused
+                else:
+                    entry = previous.entries[ident]
+
+                if entry is not None:
+                    entries[ident] = entry
+                    continue
+
+            if not lazy:
+                entries[ident] = DictEntry.from_json_entry(ident=ident, json_entry=json_entry)
+
+        if not lazy:
+            return cls(entries, version=hashlib.sha1(contents).hexdigest(), entry_digests=entry_digests)
+
+        dictionary = cls(
+            JsonEntries(entries_dict, built=entries),
+            version=hashlib.sha1(contents).hexdigest(),
+            entry_digests=entry_digests,
         )
+        dictionary.paradigms = ParadigmTable(dictionary.entries)
+
+        return dictionary
 
-        self.fill_in_adpositions()
+    @classmethod
+    def from_lexicon(cls, filename=DICTIONARY_FILENAME) -> Optional["Dictionary"]:
+        """Opens the lexicon compiled from filename by write_lexicon. Its entries come with all of their forms already
+        generated, and are only decoded when they are first looked up.
+        Returns None if there is no lexicon, or if it was compiled from a different file or by different code.
+        """
+        lexicon = current_lexicon(filename)
 
-    def fill_in_prefix_set(self, prefix_set: dict[str, str], mstype: MorphosyntacticType, wrap_ident: bool = True):
-        for ident, informal_transcription in prefix_set.items():
-            if wrap_ident:
-                ident = f"${ident}$"
+        if lexicon is None:
+            return None
 
-            pk_lemma = ProtoKasanicLemma(
-                ident=ident,
-                definition="",
-                category=KasanicStemCategory.UNINFLECTED,
-                mstype=mstype,
-                forms={},
-                generic_morph=pkm(informal_transcription)
-            )
-            pk_lemma.generic_morph.surface_form.stress_position = None
+        entries = LexiconEntries(lexicon)
+        dictionary = cls(entries, version=lexicon.header[0], lexicon=lexicon)
+        dictionary.paradigms = ParadigmTable(dictionary.entries)
 
-            lv_lemma = LauvinkoLemma.from_pk(pk_lemma)
+        return dictionary
 
-            self.entries[ident] = DictEntry(
-                languages={
-                    Language.PK: pk_lemma,
-                    Language.LAUVINKO: lv_lemma,
+    def write_lexicon(self, filename: str):
+        """Compiles the entries read from the dictionary file for from_lexicon, along with the indexes.
+        Failing to write is harmless, so it is only reported.
+        """
+        try:
+            Lexicon.write(
+                filename,
+                header=(self.version, source_fingerprint()),
+                entries={ident: self.entries[ident] for ident in self.entry_digests},
+                records={
+                    "entry_digests": self.entry_digests,
+                    "index": self.index,
+                    "search_index": self.search_index,
                 },
-                ident=ident,
-                category=KasanicStemCategory.UNINFLECTED,
-                mstype=mstype,
-                origin=ProtoKasanicOrigin(pk_lemma)
+                renderings={ident: json.dumps(self.entries[ident].to_json()).encode() for ident in self.entry_digests},
             )
 
-    def fill_in_adpositions(self):
-        for case, informal_transcription in ADPOSITIONS:
-            if isinstance(case, str):
-                ident = case
-                definition = case.title() + "."
-            else:
-                ident = f"${case.abbreviation}$"
-                definition = f"{case.name.title()} adposition"
-
-            pk_lemma = ProtoKasanicLemma(
-                ident=ident,
-                definition=definition,
-                category=KasanicStemCategory.UNINFLECTED,
-                mstype=MorphosyntacticType.ADPOSITION,
-                forms={},
-                generic_morph=pkm(informal_transcription),
-            )
+        except OSError as e:
+            print(f"Could not write dictionary lexicon: {e}")
 
-            lv_lemma = LauvinkoLemma.from_pk(pk_lemma)
+    @staticmethod
+    def compile_lexicon(filename=DICTIONARY_FILENAME, processes: int = 1) -> bool:
+        """Compiles the lexicon of filename from the dictionary loaded from it, unless it is up to date already.
+        This is done by the compile_lexicon command, and by gunicorn before it forks any workers,
+        rather than whenever the dictionary is loaded. Returns whether a lexicon was written.
+        The dictionary it was compiled from is then replaced by one opened from the new lexicon,
+        so that this process reads its entries from the lexicon too.
+        """
+        if current_lexicon(filename) is not None:
+            return False
+
+        dictionary = Dictionary.load(filename, processes=processes, lazy=False)
+        dictionary.write_lexicon(lexicon_filename(filename))
+
+        with RELOAD_LOCK:
+            mtime, cached = DICTIONARY_CACHE.get(filename, (None, None))
+            compiled = Dictionary.from_lexicon(filename) if cached is dictionary else None
+
+            if compiled is not None and compiled.version == dictionary.version:
+                DICTIONARY_CACHE[filename] = (mtime, compiled)
+                Dictionary.changes(filename).notify(compiled)
+
+        return True
+
+    def build_paradigms(self, processes: int = 1):
+        """Forms are otherwise generated on first use, which makes the first lookup of each slow
+        and has concurrent requests writing to the same lemmas
+        """
+        self.paradigms = ParadigmTable.build(self.entries, processes=processes)
 
-            self.entries[ident] = DictEntry(
-                languages={
-                    Language.PK: pk_lemma,
-                    Language.LAUVINKO: lv_lemma,
-                },
-                ident=ident,
-                category=KasanicStemCategory.UNINFLECTED,
-                mstype=MorphosyntacticType.ADPOSITION,
-                origin=ProtoKasanicOrigin(pk_lemma),
-            )
+    def fill_in_closed_classes(self):
+        self.entries.update(closed_class_entries())
 
     def to_json(self):
         return {
-            ident: entry.to_json()
-            for ident, entry in self.entries.items()
-            if entry.mstype is MorphosyntacticType.INDEPENDENT
+            entry.ident: entry.to_json()
+            for entry in self.query().where(mstype=MorphosyntacticType.INDEPENDENT)
         }
 
+    def to_json_bytes(self) -> bytes:
+        """to_json, serialized with json.dumps. The JSON of entries in the lexicon is copied out of it as it was
+        rendered when it was compiled, so that they aren't decoded just to be rendered again.
+        """
+        parts = []
+
+        for ident in self.query().where(mstype=MorphosyntacticType.INDEPENDENT).ordered_idents():
+            rendering = self.lexicon and self.lexicon.rendering(ident)
+
+            if rendering is None:
+                rendering = json.dumps(self.entries[ident].to_json()).encode()
+
+            parts.append(b"%b: %b" % (json.dumps(ident).encode(), rendering))
+
+        return b"{" + b", ".join(parts) + b"}"
+
 Dictionary.load()
\ No newline at end of file
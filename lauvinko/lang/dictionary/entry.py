@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from typing import Optional
+import hashlib
 import json
 import mistletoe
 from mistletoe.ast_renderer import ASTRenderer
@@ -11,6 +12,7 @@ from lauvinko.lang.shared.semantics import (
     Language, PTA2ABBREV,
 )
 from lauvinko.lang.shared.morphology import Lemma, MorphosyntacticType
+from lauvinko.lang.shared.cache import LRUCache
 from lauvinko.lang.proto_kasanic.morphology import ProtoKasanicMorpheme, ProtoKasanicStem, ProtoKasanicLemma
 from lauvinko.lang.lauvinko.phonology import LauvinkoSurfaceForm
 from lauvinko.lang.lauvinko.morphology import LauvinkoLemma, LauvinkoMorpheme
@@ -82,6 +84,21 @@ def validate_keys(d: dict, require: set, permit: set):
             raise ValueError(f"Unexpected key {k} in dictionary {d}")
 
 
+# Maps (ident, field, digest of the markdown) to the AST rendered from it. It lives outside any Dictionary so that a
+# reload only re-renders the entries whose text actually changed, and is bounded so that the renderings of edited
+# or removed entries are evicted
+RENDERED_MARKDOWN_CACHE = LRUCache(maxsize=4096)
+
+
+def render_markdown(ident: str, field: str, source: str) -> dict:
+    digest = hashlib.sha1(source.encode()).hexdigest()
+
+    return RENDERED_MARKDOWN_CACHE.get_or_compute(
+        (ident, field, digest),
+        lambda: json.loads(mistletoe.markdown(source, renderer=ASTRenderer)),
+    )
+
+
 @dataclass
 class DictEntry:
     languages: dict[Language, Lemma]
@@ -101,7 +118,7 @@ class DictEntry:
             data = lemma.to_json()
             languages[language.value] = {
                 **data,
-                "definition": json.loads(mistletoe.markdown(data["definition"], renderer=ASTRenderer))
+                "definition": render_markdown(self.ident, language.value, data["definition"]),
             }
 
         olang, oword = self.origin.language_and_word()
@@ -114,7 +131,7 @@ class DictEntry:
                 "language": olang.value[0],
                 "word": oword,
             },
-            "notes": self.notes and json.loads(mistletoe.markdown(self.notes, renderer=ASTRenderer)),
+            "notes": self.notes and render_markdown(self.ident, "notes", self.notes),
         }
 
     @staticmethod
@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+from collections.abc import MutableMapping
+from typing import Iterable, Iterator, Optional
+
+from lauvinko.lang.dictionary.entry import DictEntry
+from lauvinko.lang.dictionary.paradigms import ParadigmTable
+
+
+class LazyEntries(MutableMapping, ABC):
+    """Dictionary entries by ident, each built the first time it is looked up by the build method of a subclass.
+    Entries which are built up front can be added, as closed classes are.
+    """
+    def __init__(self, idents: Iterable[str]):
+        self.idents = list(idents)
+        self.known = set(self.idents)
+        self.built: dict[str, DictEntry] = {}
+        self.added: dict[str, DictEntry] = {}
+
+    @abstractmethod
+    def build(self, ident: str) -> DictEntry:
+        pass
+
+    def peek(self, ident: str) -> Optional[DictEntry]:
+        """The entry for ident if it has been built, without building it otherwise"""
+        return self.added.get(ident) or self.built.get(ident)
+
+    def __getitem__(self, ident: str) -> DictEntry:
+        if ident in self.added:
+            return self.added[ident]
+
+        if ident not in self.known:
+            raise KeyError(ident)
+
+        if ident not in self.built:
+            # Two threads can race to build the same entry, but both get the same one back
+            self.built.setdefault(ident, self.build(ident))
+
+        return self.built[ident]
+
+    def __setitem__(self, ident: str, entry: DictEntry):
+        self.added[ident] = entry
+
+    def __delitem__(self, ident: str):
+        raise TypeError("Entries can't be removed from a lazily built dictionary")
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.idents
+        yield from (ident for ident in self.added if ident not in self.known)
+
+    def __len__(self) -> int:
+        return len(self.idents) + sum(ident not in self.known for ident in self.added)
+
+    def __contains__(self, ident) -> bool:
+        return ident in self.added or ident in self.known
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self.built)} of {len(self.idents)} built)"
+
+
+class JsonEntries(LazyEntries):
+    """Entries which are read from their JSON, with all of their forms, the first time they are looked up.
+    Indexing or searching a dictionary looks up every entry, so this only defers reading the entries
+    until the first query, search or to_json call.
+    """
+    def __init__(self, json_entries: dict[str, dict], built: Optional[dict[str, DictEntry]] = None):
+        """built has entries which have already been read from the same JSON"""
+        super().__init__(json_entries)
+        self.json_entries = json_entries
+        self.built.update(built or {})
+
+    def build(self, ident: str) -> DictEntry:
+        entry = DictEntry.from_json_entry(ident=ident, json_entry=self.json_entries[ident])
+        ParadigmTable.build({ident: entry})
+
+        return entry
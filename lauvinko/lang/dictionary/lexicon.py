@@ -0,0 +1,129 @@
+import mmap
+import os
+import pickle
+import stat
+import struct
+from typing import Any, Optional
+
+from lauvinko.lang.dictionary.entry import DictEntry
+from lauvinko.lang.dictionary.lazy import LazyEntries
+
+# The lexicon file starts with the offset of its table of contents, which is written last
+TOC_OFFSET = struct.Struct("<Q")
+
+# The permissions a lexicon is written with
+MODE = 0o644
+
+
+def writable_by_others(st: os.stat_result) -> bool:
+    """Whether a file could have been written by a user other than this one or root"""
+    return st.st_uid not in (os.getuid(), 0) or bool(st.st_mode & (stat.S_IWGRP | stat.S_IWOTH))
+
+
+class Lexicon:
+    """A compiled dictionary, read through mmap. Every entry is pickled on its own, at an offset given by a table
+    of contents, so a process only decodes the entries it looks up. Along with each entry is its rendered JSON, with
+    every form of every cell written out, which is read straight from the mapped file without decoding the entry.
+    The rest of the file is never copied out of the page cache, which every process reading the lexicon shares.
+
+    Entries are stored as pickles, and unpickling runs whatever code the file says to, so a lexicon is only as
+    trustworthy as whoever can write to it. It is compiled next to the dictionary file, by the same user that serves
+    it, and open refuses lexicons which any other user could have written.
+    """
+    def __init__(self, buffer: mmap.mmap, header: tuple, offsets: dict[str, tuple[int, int]],
+                 records: dict[str, tuple[int, int]], renderings: dict[str, tuple[int, int]]):
+        """offsets has the offset and length of each entry, by ident, records those of anything else stored along
+        with them, by name, and renderings those of the rendered JSON of each entry, by ident
+        """
+        self.buffer = buffer
+        self.header = header
+        self.offsets = offsets
+        self.records = records
+        self.renderings = renderings
+
+    @classmethod
+    def open(cls, filename: str) -> Optional["Lexicon"]:
+        """Returns None if there is no lexicon in filename, if it was written by a different version of this code,
+        or if it could have been written by another user
+        """
+        try:
+            with open(filename, "rb") as fh:
+                if writable_by_others(os.fstat(fh.fileno())):
+                    return None
+
+                buffer = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+            toc_offset, = TOC_OFFSET.unpack_from(buffer, 0)
+            header, offsets, records, renderings = pickle.loads(buffer[toc_offset:])
+
+        except (OSError, ValueError, struct.error, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+
+        return cls(buffer, header, offsets, records, renderings)
+
+    @staticmethod
+    def write(filename: str, header: tuple, entries: dict[str, DictEntry], records: dict[str, Any],
+              renderings: dict[str, bytes]):
+        """header identifies what the lexicon was compiled from. It is written to a temporary file first,
+        so that processes which already have filename open keep reading the old lexicon.
+        """
+        temp_filename = f"{filename}.{os.getpid()}.tmp"
+        offsets = {}
+        record_offsets = {}
+        rendering_offsets = {}
+
+        with open(temp_filename, "wb") as fh:
+            fh.write(TOC_OFFSET.pack(0))
+
+            for ident, entry in entries.items():
+                start = fh.tell()
+                pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                offsets[ident] = (start, fh.tell() - start)
+
+            for name, value in records.items():
+                start = fh.tell()
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                record_offsets[name] = (start, fh.tell() - start)
+
+            for ident, rendering in renderings.items():
+                rendering_offsets[ident] = (fh.tell(), len(rendering))
+                fh.write(rendering)
+
+            toc_offset = fh.tell()
+            pickle.dump((header, offsets, record_offsets, rendering_offsets), fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+            fh.seek(0)
+            fh.write(TOC_OFFSET.pack(toc_offset))
+
+        os.chmod(temp_filename, MODE)
+        os.replace(temp_filename, filename)
+
+    def decode(self, offset: int, length: int) -> Any:
+        return pickle.loads(memoryview(self.buffer)[offset:offset + length])
+
+    def entry(self, ident: str) -> DictEntry:
+        return self.decode(*self.offsets[ident])
+
+    def record(self, name: str) -> Optional[Any]:
+        if name not in self.records:
+            return None
+
+        return self.decode(*self.records[name])
+
+    def rendering(self, ident: str) -> Optional[memoryview]:
+        """The rendered JSON of an entry, as a view of the mapped file rather than a copy"""
+        if ident not in self.renderings:
+            return None
+
+        offset, length = self.renderings[ident]
+        return memoryview(self.buffer)[offset:offset + length]
+
+
+class LexiconEntries(LazyEntries):
+    """The entries of a Lexicon, each decoded the first time it is looked up"""
+    def __init__(self, lexicon: Lexicon):
+        super().__init__(lexicon.offsets)
+        self.lexicon = lexicon
+
+    def build(self, ident: str) -> DictEntry:
+        return self.lexicon.entry(ident)
@@ -0,0 +1,153 @@
+import multiprocessing
+from collections.abc import Mapping
+from typing import Any, Hashable, Optional
+from lauvinko.lang.shared.semantics import PrimaryTenseAspect, Language
+from lauvinko.lang.proto_kasanic.phonology import PKSurfaceForm
+from lauvinko.lang.lauvinko.morphology import LauvinkoLemma, LauvinkoMorpheme
+from lauvinko.lang.lauvinko.diachronic.base import LauvinkoLemmaOrigin, MorphemeContext
+from lauvinko.lang.lauvinko.diachronic.from_pk import ProtoKasanicOrigin
+from lauvinko.lang.dictionary.entry import DictEntry
+
+PK_CELLS: tuple[PrimaryTenseAspect, ...] = tuple(PrimaryTenseAspect)
+LV_CELLS: tuple[tuple[PrimaryTenseAspect, MorphemeContext], ...] = tuple(
+    (primary_ta, context)
+    for primary_ta in PrimaryTenseAspect
+    for context in MorphemeContext
+)
+
+CELLS = {
+    Language.PK: PK_CELLS,
+    Language.LAUVINKO: LV_CELLS,
+}
+CELL_INDICES = {
+    language: {cell: i for i, cell in enumerate(cells)}
+    for language, cells in CELLS.items()
+}
+
+
+class ParadigmRow(Mapping):
+    """The forms of one lemma, stored densely with a slot for every cell of its language's paradigm.
+    Cells the lemma has no form for hold None, and read as missing keys.
+    Once a row has been installed as a lemma's forms, asking the lemma for a form the row lacks raises NonexistentForm.
+    """
+    def __init__(self, language: Language, slots: tuple[Optional[Any], ...]):
+        assert len(slots) == len(CELLS[language])
+
+        self.language = language
+        self.slots = slots
+
+    def __getitem__(self, cell: Hashable):
+        i = CELL_INDICES[self.language].get(cell)
+
+        if i is None or self.slots[i] is None:
+            raise KeyError(cell)
+
+        return self.slots[i]
+
+    def __iter__(self):
+        for cell, form in zip(CELLS[self.language], self.slots):
+            if form is not None:
+                yield cell
+
+    def __len__(self):
+        return sum(form is not None for form in self.slots)
+
+    def __repr__(self):
+        return f"ParadigmRow({self.language.name}, {len(self)} forms)"
+
+
+class ParadigmTable:
+    """Every form of every lemma in a set of dictionary entries, generated up front.
+    Building a table installs its rows as the forms of the lemmas, so that Lemma.form never generates anything afterwards.
+    """
+    def __init__(self, entries: Mapping[str, DictEntry]):
+        self.entries = entries
+
+    def row(self, ident: str, language: Language) -> Optional[ParadigmRow]:
+        entry = self.entries.get(ident)
+
+        if entry is None or language not in entry.languages:
+            return None
+
+        forms = entry.languages[language].forms
+        return forms if isinstance(forms, ParadigmRow) else None
+
+    def form(self, ident: str, language: Language, cell: Hashable) -> Optional[Any]:
+        """cell is a PrimaryTenseAspect in Proto-Kasanic, and a (PrimaryTenseAspect, MorphemeContext) in Lauvinko"""
+        row = self.row(ident, language)
+
+        if row is None:
+            return None
+
+        return row.get(cell)
+
+    @classmethod
+    def build(cls, entries: dict[str, DictEntry], processes: int = 1) -> "ParadigmTable":
+        """Generates every form of every lemma in entries. Sound changes are the expensive part of this,
+        so with processes > 1 they are run in a pool of worker processes.
+        """
+        pending: list[tuple[LauvinkoLemma, tuple[PrimaryTenseAspect, MorphemeContext]]] = []
+        jobs: list[tuple[PKSurfaceForm, MorphemeContext]] = []
+
+        for entry in entries.values():
+            for language, lemma in entry.languages.items():
+                if language is Language.LAUVINKO:
+                    cls.collect_lv_forms(lemma, pending, jobs)
+
+        for (lemma, (primary_ta, context)), lv_sf in zip(pending, evolve_all(jobs, processes)):
+            lemma.forms[(primary_ta, context)] = LauvinkoMorpheme(
+                lemma=lemma,
+                surface_form=lv_sf,
+                virtual_original_form=lemma.origin.derived_from.form(primary_ta).as_morph(),
+                context=context,
+            )
+
+        for entry in entries.values():
+            for language, lemma in entry.languages.items():
+                if isinstance(lemma.forms, ParadigmRow):
+                    continue  # already built, and possibly shared with other dictionaries
+
+                if language is Language.PK:
+                    for primary_ta in lemma.category.primary_aspects:
+                        lemma.form(primary_ta)
+
+                lemma.forms = ParadigmRow(language, tuple(
+                    lemma.forms.get(cell)
+                    for cell in CELLS[language]
+                ))
+
+        return cls(entries)
+
+    @staticmethod
+    def collect_lv_forms(lemma: LauvinkoLemma, pending: list, jobs: list):
+        """Generates the forms of lemma which don't need sound changes, and queues up the ones that do"""
+        if isinstance(lemma.forms, ParadigmRow):
+            return
+
+        for primary_ta in lemma.category.primary_aspects:
+            for context in MorphemeContext:
+                if (primary_ta, context) in lemma.forms:
+                    continue
+
+                if isinstance(lemma.origin, ProtoKasanicOrigin):
+                    pk_stem = lemma.origin.derived_from.form(primary_ta)
+                    pending.append((lemma, (primary_ta, context)))
+                    jobs.append((pk_stem.surface_form(), context))
+                    continue
+
+                try:
+                    lemma.form(primary_ta, context)
+                except LauvinkoLemmaOrigin.InvalidOrigin:
+                    pass  # only some forms of lemmas with explicitly listed forms exist
+
+
+def evolve_all(jobs: list[tuple[PKSurfaceForm, MorphemeContext]], processes: int = 1) -> list:
+    if processes <= 1 or len(jobs) == 0:
+        return ProtoKasanicOrigin.evolve_surface_forms(jobs)
+
+    with multiprocessing.Pool(processes) as pool:
+        return pool.starmap(
+            ProtoKasanicOrigin.evolve_surface_form,
+            jobs,
+            chunksize=max(1, len(jobs) // (processes * 4)),
+        )
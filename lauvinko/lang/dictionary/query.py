@@ -0,0 +1,107 @@
+from collections.abc import Mapping
+from typing import Callable, Iterator, Optional
+
+from lauvinko.lang.shared.morphology import MorphosyntacticType
+from lauvinko.lang.shared.semantics import KasanicStemCategory, PrimaryTenseAspect, Language
+from lauvinko.lang.lauvinko.diachronic.base import OriginLanguage
+from lauvinko.lang.dictionary.entry import DictEntry
+
+
+class EntryIndex:
+    """The idents of a dictionary's entries by morphosyntactic type, stem category, origin language and primary
+    tense/aspect, along with the key they are alphabetized by. It is built when the dictionary is loaded,
+    so that entries can be selected with EntryQuery without looking at every one of them.
+    """
+    def __init__(self, entries: Mapping[str, DictEntry]):
+        self.by_mstype: dict[MorphosyntacticType, set[str]] = {}
+        self.by_category: dict[KasanicStemCategory, set[str]] = {}
+        self.by_origin: dict[OriginLanguage, set[str]] = {}
+        self.by_primary_aspect: dict[PrimaryTenseAspect, set[str]] = {}
+        self.alphabetization: dict[str, str] = {}
+        # the position of each ident in the dictionary
+        self.positions: dict[str, int] = {}
+
+        for ident, entry in entries.items():
+            self.positions[ident] = len(self.positions)
+            self.add_entry(ident, entry)
+
+    def add_entry(self, ident: str, entry: DictEntry):
+        origin_language, _ = entry.origin.language_and_word()
+
+        self.by_mstype.setdefault(entry.mstype, set()).add(ident)
+        self.by_category.setdefault(entry.category, set()).add(ident)
+        self.by_origin.setdefault(origin_language, set()).add(ident)
+
+        for primary_ta in entry.category.primary_aspects:
+            self.by_primary_aspect.setdefault(primary_ta, set()).add(ident)
+
+        lv_citation_form = entry.languages[Language.LAUVINKO].citation_form()
+        self.alphabetization[ident] = lv_citation_form.virtual_original_form.surface_form.alphabetical_order()
+
+
+class EntryQuery:
+    """A selection of a dictionary's entries. Narrowing it down with where only intersects sets of idents from
+    the dictionary's EntryIndex, and entries aren't looked up until the query is iterated over.
+    """
+    def __init__(self, entries: Mapping[str, DictEntry], index: EntryIndex, idents: Optional[frozenset[str]] = None,
+                 predicates: tuple[Callable[[DictEntry], bool], ...] = ()):
+        """idents is None for every entry"""
+        self.entries = entries
+        self.index = index
+        self.idents = idents
+        self.predicates = predicates
+
+    def narrowed(self, idents: set[str]) -> "EntryQuery":
+        return EntryQuery(
+            self.entries,
+            self.index,
+            frozenset(idents if self.idents is None else self.idents & idents),
+            self.predicates,
+        )
+
+    def where(self, mstype: Optional[MorphosyntacticType] = None, category: Optional[KasanicStemCategory] = None,
+              origin: Optional[OriginLanguage] = None, primary_aspect: Optional[PrimaryTenseAspect] = None
+              ) -> "EntryQuery":
+        """Only the entries which have every one of the given properties"""
+        query = self
+
+        for index, value in (
+            (self.index.by_mstype, mstype),
+            (self.index.by_category, category),
+            (self.index.by_origin, origin),
+            (self.index.by_primary_aspect, primary_aspect),
+        ):
+            if value is not None:
+                query = query.narrowed(index.get(value, set()))
+
+        return query
+
+    def filter(self, f: Callable[[DictEntry], bool]) -> "EntryQuery":
+        """Only the entries for which f is true. f is only called while iterating, after narrowing with where."""
+        return EntryQuery(self.entries, self.index, self.idents, self.predicates + (f,))
+
+    def ordered_idents(self) -> list[str]:
+        """The idents narrowed down to with where, in the order they are in the dictionary.
+        Entries aren't looked up, so filter has no effect on them.
+        """
+        if self.idents is None:
+            return list(self.index.positions)
+
+        return sorted(self.idents, key=self.index.positions.__getitem__)
+
+    def __iter__(self) -> Iterator[DictEntry]:
+        """The entries in the order they are in the dictionary"""
+        for ident in self.ordered_idents():
+            entry = self.entries[ident]
+
+            if all(f(entry) for f in self.predicates):
+                yield entry
+
+    def __len__(self) -> int:
+        if self.predicates:
+            return sum(1 for _ in self)
+
+        return len(self.index.positions) if self.idents is None else len(self.idents)
+
+    def alphabetical(self) -> list[DictEntry]:
+        return sorted(self, key=lambda entry: (self.index.alphabetization[entry.ident], entry.ident))
@@ -0,0 +1,213 @@
+import bisect
+import re
+import unicodedata
+from typing import Iterable, Optional
+from lauvinko.lang.shared.morphology import MorphosyntacticType
+from lauvinko.lang.shared.semantics import KasanicStemCategory
+from lauvinko.lang.lauvinko.diachronic.base import OriginLanguage
+from lauvinko.lang.dictionary.entry import DictEntry
+from lauvinko.lang.dictionary.query import EntryIndex, EntryQuery
+
+NGRAM_LENGTH = 3
+
+# The names filters are given by in search queries
+ORIGINS_BY_NAME = {language.value[0]: language for language in OriginLanguage}
+CATEGORIES_BY_NAME = {category.title: category for category in KasanicStemCategory}
+MSTYPES_BY_NAME = {mstype.value: mstype for mstype in MorphosyntacticType}
+
+# Scores for the ways an entry can match a query. Entries are ranked by the sum of their scores.
+EXACT_FORM_SCORE = 100
+PREFIX_FORM_SCORE = 40
+INFIX_FORM_SCORE = 15
+EXACT_TOKEN_SCORE = 10
+PREFIX_TOKEN_SCORE = 5
+NOTES_WEIGHT = 0.5
+
+
+def normalize(s: str) -> str:
+    """Lowercases s and strips diacritics, so that searching for lauvinko finds lauvìnko"""
+    return "".join(
+        c for c in unicodedata.normalize("NFD", s.lower())
+        if unicodedata.category(c) != "Mn"
+    ).strip()
+
+
+def tokenize(text: str) -> list[str]:
+    text = re.sub(r"\]\([^)]*\)", "]", text)  # link targets aren't part of the text
+    return re.findall(r"\w+", normalize(text))
+
+
+def ngrams(s: str) -> set[str]:
+    return {s[i:i + NGRAM_LENGTH] for i in range(len(s) - NGRAM_LENGTH + 1)}
+
+
+class FormIndex:
+    """Finds the entries with a form which equals, starts with or contains a string"""
+    def __init__(self):
+        self.idents: dict[str, set[str]] = {}
+        self.ngrams: dict[str, set[str]] = {}
+        self.sorted_forms: list[str] = []
+
+    def add(self, form: str, ident: str):
+        if form not in self.idents:
+            self.idents[form] = set()
+
+            for ngram in ngrams(form):
+                self.ngrams.setdefault(ngram, set()).add(form)
+
+        self.idents[form].add(ident)
+
+    def finish(self):
+        self.sorted_forms = sorted(self.idents)
+
+    def match(self, q: str) -> dict[str, int]:
+        scores = {}
+
+        def score(forms: Iterable[str], s: int):
+            for form in forms:
+                for ident in self.idents[form]:
+                    scores[ident] = max(scores.get(ident, 0), s)
+
+        if len(q) >= NGRAM_LENGTH:
+            candidates = set.intersection(*(self.ngrams.get(ngram, set()) for ngram in ngrams(q)))
+
+            score((form for form in candidates if q in form), INFIX_FORM_SCORE)
+
+        score(prefixed(self.sorted_forms, q), PREFIX_FORM_SCORE)
+        score([q] if q in self.idents else [], EXACT_FORM_SCORE)
+
+        return scores
+
+
+def prefixed(sorted_strings: list[str], prefix: str) -> list[str]:
+    start = bisect.bisect_left(sorted_strings, prefix)
+    end = start
+
+    while end < len(sorted_strings) and sorted_strings[end].startswith(prefix):
+        end += 1
+
+    return sorted_strings[start:end]
+
+
+class SearchIndex:
+    """In-memory indexes over a dictionary's entries for the search API.
+    Definitions and notes are searched by token, and the romanization and falavay of every form by prefix and n-gram.
+    """
+    def __init__(self, entries: dict[str, DictEntry], previous: Optional["SearchIndex"] = None,
+                 index: Optional[EntryIndex] = None):
+        """The forms of entries which previous was also built from are taken from it rather than rendered again.
+        index is the EntryIndex of entries, if it has already been built.
+        """
+        self.entries = entries
+        self.index = index or EntryIndex(entries)
+        self.forms: dict[str, list[tuple[str, str]]] = {}
+        self.tokens: dict[str, dict[str, float]] = {}
+        self.romanizations = FormIndex()
+        self.falavay = FormIndex()
+        self.sorted_idents = sorted(entries)
+
+        for ident, entry in entries.items():
+            if previous is not None and previous.entries.get(ident) is entry:
+                self.forms[ident] = previous.forms[ident]
+
+            self.add_entry(ident, entry)
+
+        self.sorted_tokens = sorted(self.tokens)
+        self.romanizations.finish()
+        self.falavay.finish()
+
+    def __getstate__(self):
+        """Indexes are stored without their entries and EntryIndex, which whoever restores one gives back to it"""
+        return {**self.__dict__, "entries": None, "index": None}
+
+    def add_entry(self, ident: str, entry: DictEntry):
+        for language, lemma in entry.languages.items():
+            self.add_text(ident, lemma.definition, 1)
+
+        if ident not in self.forms:
+            self.forms[ident] = [
+                (normalize(form["romanization"]), form["falavay"])
+                for lemma in entry.languages.values()
+                for form in lemma.to_json()["forms"].values()
+            ]
+
+        for romanization, falavay in self.forms[ident]:
+            self.romanizations.add(romanization, ident)
+            self.falavay.add(falavay, ident)
+
+        if entry.notes:
+            self.add_text(ident, entry.notes, NOTES_WEIGHT)
+
+    def add_text(self, ident: str, text: str, weight: float):
+        for token in tokenize(text):
+            postings = self.tokens.setdefault(token, {})
+            postings[ident] = max(postings.get(ident, 0), weight)
+
+    def match_tokens(self, q: str) -> dict[str, float]:
+        """Entries whose definition or notes contain every token of q. The last token may be incomplete."""
+        tokens = tokenize(q)
+        scores: Optional[dict[str, float]] = None
+
+        for i, token in enumerate(tokens):
+            token_scores = {
+                ident: EXACT_TOKEN_SCORE * weight
+                for ident, weight in self.tokens.get(token, {}).items()
+            }
+
+            if i == len(tokens) - 1:
+                for t in prefixed(self.sorted_tokens, token):
+                    for ident, weight in self.tokens[t].items():
+                        token_scores[ident] = max(token_scores.get(ident, 0), PREFIX_TOKEN_SCORE * weight)
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {ident: s + token_scores[ident] for ident, s in scores.items() if ident in token_scores}
+
+        return scores or {}
+
+    def match(self, q: str) -> dict[str, float]:
+        if q.startswith("@"):
+            return {
+                ident: EXACT_FORM_SCORE if ident == q[1:] else PREFIX_FORM_SCORE
+                for ident in prefixed(self.sorted_idents, q[1:])
+            }
+
+        scores = self.match_tokens(q)
+
+        for form_scores in (self.romanizations.match(normalize(q)), self.falavay.match(q.strip())):
+            for ident, s in form_scores.items():
+                scores[ident] = scores.get(ident, 0) + s
+
+        return scores
+
+    def search(self, q: str = "", origin: Optional[str] = None, category: Optional[str] = None,
+               mstype: Optional[str] = None) -> list[tuple[str, float]]:
+        """Returns (ident, score) for every matching entry, best first.
+        An empty query matches every entry, in alphabetical order.
+        """
+        if q.strip():
+            scores = self.match(q)
+        else:
+            scores = dict.fromkeys(self.sorted_idents, 0)
+
+        filters = {}
+
+        for key, names, name in (
+            ("origin", ORIGINS_BY_NAME, origin),
+            ("category", CATEGORIES_BY_NAME, category),
+            ("mstype", MSTYPES_BY_NAME, mstype),
+        ):
+            if name is not None:
+                if name not in names:
+                    return []
+
+                filters[key] = names[name]
+
+        query = EntryQuery(self.entries, self.index).where(**filters)
+
+        if query.idents is not None:
+            scores = {ident: s for ident, s in scores.items() if ident in query.idents}
+
+        alphabetization = self.index.alphabetization
+        return sorted(scores.items(), key=lambda item: (-item[1], alphabetization[item[0]], item[0]))
@@ -0,0 +1,1224 @@
+import bisect
+import functools
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional, Sequence
+
+from ..shared.morphology import MorphosyntacticType
+from ..shared.semantics import PrimaryTenseAspect, KasanicStemCategory, PTA2ABBREV, Language
+from ..shared.cache import LRUCache
+from ..proto_kasanic.phonology import ProtoKasanicSyllable, ProtoKasanicOnset, ProtoKasanicVowel, ProtoKasanicMutation, PKSurfaceForm
+from ..proto_kasanic.morphology import ProtoKasanicMorpheme
+from ..lauvinko.phonology import LauvinkoSyllable, LauvinkoSurfaceForm, LauvinkoConsonant, LauvinkoVowel, broad_syllable_transcription, build_syllables
+from ..lauvinko.morphology import LauvinkoMorpheme, LauvinkoWord, LauvinkoWordType, LauvinkoDeterminer, CASE_BY_IDENT
+from ..lauvinko.diachronic.base import MorphemeContext
+from ..lauvinko.romanize import romanize_syllable
+from ..dictionary import Dictionary
+from .gloss import MC_ABBREVS, ACCENTLESS_TYPES
+
+ROMANIZATION_ACCENTS = "̀́"
+BROAD_ACCENTS = "́̂"
+
+# The morphemes of a content word, in the order they are joined
+PREFIX_TYPES = (
+    MorphosyntacticType.MODAL_PREFIX,
+    MorphosyntacticType.TERTIARY_ASPECT_PREFIX,
+    MorphosyntacticType.TOPIC_AGREEMENT_PREFIX,
+    MorphosyntacticType.TOPIC_CASE_PREFIX,
+)
+STEM = len(PREFIX_TYPES)
+
+# The only topic case prefix which doesn't need a topic agreement prefix before it
+DEPENDENT_TOPIC_CASE = "$dep$"
+
+STANDALONE_TYPES = (
+    MorphosyntacticType.ADPOSITION,
+    MorphosyntacticType.SEX_SUFFIX,
+    MorphosyntacticType.ADVERB,
+    MorphosyntacticType.PARTICLE,
+)
+
+DETERMINER_TYPES = (
+    MorphosyntacticType.CLASS_WORD,
+    MorphosyntacticType.NUMBER_SUFFIX,
+)
+
+# The syntactic words a phonological word can be made of, in order, as accepted by LauvinkoWord.join_syntactic_words
+CONTENT = "content"
+DETERMINER = "determiner"
+WORD_SLOTS = (
+    CONTENT,
+    MorphosyntacticType.ADPOSITION,
+    CONTENT,
+    MorphosyntacticType.SEX_SUFFIX,
+    DETERMINER,
+    DETERMINER,
+)
+SECOND_CONTENT = 2
+SECOND_DETERMINER = 5
+
+# A syllable which later morphemes or words may still change, along with its accent:
+# None if it is unaccented, and otherwise whether the accent is falling
+Held = tuple[LauvinkoSyllable, Optional[bool]]
+
+# Onsets which a syllable can't have unless it starts a phonological word
+INITIAL_ONSETS = (None, LauvinkoConsonant.H)
+
+
+@dataclass(frozen=True)
+class Transcription:
+    """How a word given to the analyzer is written: romanized or in broad IPA, with or without accent marks"""
+    broad: bool
+    accents: bool
+
+    @classmethod
+    def read(cls, word: str, broad: bool = False) -> tuple["Transcription", str]:
+        """Returns the transcription of word, and word normalized to be compared with forms written in it.
+        Syllable breaks, punctuation and case are ignored, and forms are only compared with accents if word has them.
+        """
+        word = re.sub("[^\\ẁ-ͯ]", "", unicodedata.normalize("NFD", word.lower()))
+        accents = BROAD_ACCENTS if broad else ROMANIZATION_ACCENTS
+
+        return cls(broad=broad, accents=any(accent in word for accent in accents)), word
+
+    @functools.cache
+    def syllable(self, syllable: LauvinkoSyllable, next_onset: Optional[LauvinkoConsonant],
+                 falling_accent: Optional[bool]) -> str:
+        if not self.accents:
+            falling_accent = None
+
+        if self.broad:
+            out = broad_syllable_transcription(syllable, falling_accent)
+        else:
+            out = romanize_syllable(syllable, next_onset, falling_accent)
+
+        return unicodedata.normalize("NFD", out)
+
+    def split_onset(self, held: Held) -> tuple[str, Held]:
+        """Returns how the onset of a syllable which isn't settled yet is written, and the syllable without it.
+        Later morphemes and words only ever copy an onset, so it can be matched against the word straight away,
+        and analyses which only differ in it share their state. Only y before i is kept, as cliticizing looks at it.
+        """
+        syllable, accent = held
+
+        if syllable.onset is None or (syllable.onset is LauvinkoConsonant.Y and syllable.vowel is LauvinkoVowel.I):
+            return "", held
+
+        return self.onset(syllable.onset), (LauvinkoSyllable.of(None, syllable.vowel, syllable.coda), accent)
+
+    def onset(self, onset: LauvinkoConsonant) -> str:
+        return unicodedata.normalize("NFD", onset.ipa if self.broad else onset.name.lower())
+
+    def syllables(self, syllables: Sequence[Held], next_onset: Optional[LauvinkoConsonant]) -> str:
+        return "".join(
+            self.syllable(syllable, syllables[i + 1][0].onset if i + 1 < len(syllables) else next_onset, accent)
+            for i, (syllable, accent) in enumerate(syllables)
+        )
+
+    def surface_form(self, sf: LauvinkoSurfaceForm) -> str:
+        return self.syllables(held_syllables(sf, accented=True), None)
+
+
+# Every way the analyzer can be given a word
+TRANSCRIPTIONS = tuple(Transcription(broad, accents) for broad in (False, True) for accents in (False, True))
+
+
+def held_syllables(sf: LauvinkoSurfaceForm, accented: bool) -> list[Held]:
+    return [
+        (syllable, sf.falling_accent if accented and i == sf.accent_position else None)
+        for i, syllable in enumerate(sf.syllables)
+    ]
+
+
+@dataclass(frozen=True)
+class Unit:
+    """A morpheme or syntactic word the analyzer can recognise, and how it is written in a gloss outline"""
+    outline: str
+    value: object  # a LauvinkoMorpheme, or a LauvinkoWord for the words around content words
+
+
+@dataclass(frozen=True)
+class JoinState:
+    """How far joining the morphemes of a content word has got. Everything but the last syllable is settled, and has
+    already been matched against the word being analyzed.
+    """
+    held: Optional[Held]
+    pk_vowel: Optional[ProtoKasanicVowel]
+    mutation: Optional[ProtoKasanicMutation]
+
+    def __post_init__(self):
+        # states are hashed constantly as dict keys while words are read, so the hash is only computed once
+        object.__setattr__(self, "_hash", hash((self.held, self.pk_vowel, self.mutation)))
+
+    def __hash__(self):
+        return self._hash
+
+
+START = JoinState(held=None, pk_vowel=None, mutation=None)
+
+
+class Accent(Enum):
+    """Where the accent of a phonological word can still go. LauvinkoWord.join_syntactic_words puts it on the first
+    syntactic word, unless a second content word follows the first syntactic word, which takes it instead.
+    """
+    NO_WORDS = "no words"
+    OWED = "owed to a second content word"
+    PLACED = "placed"
+
+
+@dataclass(frozen=True)
+class PhraseState:
+    """How far reading the syntactic words of a phonological word has got, along with everything about the words so
+    far which LauvinkoWord.join_syntactic_words checks the words after them against. held is the last syllable so far.
+    context is the context of the last content word, found is whether the words so far could end the phonological word
+    as far as join_syntactic_words is concerned, and determiner is the type of the first determiner.
+    """
+    slot: int
+    held: Optional[Held]
+    accent: Accent
+    context: Optional[MorphemeContext]
+    found: bool
+    determiner: Optional[MorphosyntacticType]
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((
+            self.slot, self.held, self.accent, self.context, self.found, self.determiner,
+        )))
+
+    def __hash__(self):
+        return self._hash
+
+    def following(self, held: Optional[Held], accent: Optional[Accent] = None, context: Optional[MorphemeContext] = None,
+                  found: Optional[bool] = None, determiner: Optional[MorphosyntacticType] = None) -> "PhraseState":
+        """The state in the next slot, which holds held, with the given fields changed"""
+        return PhraseState(
+            slot=self.slot + 1,
+            held=held,
+            accent=self.accent if accent is None else accent,
+            context=self.context if context is None else context,
+            found=self.found if found is None else found,
+            determiner=self.determiner if determiner is None else determiner,
+        )
+
+
+PHRASE_START = PhraseState(slot=0, held=None, accent=Accent.NO_WORDS, context=None, found=False, determiner=None)
+
+
+@dataclass(frozen=True)
+class ContentState:
+    """How far reading a content word has got. phrase is the state of the phonological word before it, stage is the
+    index in PREFIX_TYPES of the next morpheme it can have, agreement is whether it has a topic agreement prefix,
+    which needs a topic case prefix after it, and state is how far joining its morphemes has got.
+    previous is the last syllable of the syntactic word before, if the content word hasn't settled it yet.
+    """
+    phrase: PhraseState
+    stage: int
+    agreement: bool
+    state: JoinState
+    previous: Optional[Held]
+    accented: bool
+
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((
+            self.phrase, self.stage, self.agreement, self.state, self.previous, self.accented,
+        )))
+
+    def __hash__(self):
+        return self._hash
+
+
+# The node reached once a whole phonological word has been read
+ACCEPT = "accept"
+
+# Where the analyzer is in reading a word: a node, which is a PhraseState, a ContentState or ACCEPT, reading some text,
+# and then the key of a move from a table, of which it has read the last part. With nothing left to read and no table,
+# the node is still to be entered.
+Reading = tuple[object, str, Optional["Table"], str]
+ACCEPTED: Reading = (ACCEPT, "", None, "")
+
+
+@dataclass(eq=False)
+class Table:
+    """The moves from one state by each morpheme or syntactic word which can come next, as (unit, next state), keyed by
+    the text each settles along with the onset split off the first syllable it leaves unsettled. A move with no unit
+    goes on to read a key of the table in place of its next state.
+
+    The last syllable of the syntactic word before can change until the first syllable of the next is settled, so after
+    another word the moves are read from the other fields instead. How that syllable is written only depends on the
+    onset of the first syllable of the next word, if it has one, so starts groups the moves by that onset, keyed as in
+    moves. Otherwise, cliticizing changes both syllables, so vowel_starts groups the moves by their first syllable,
+    with its accent and the onset after it, keyed by the text after it. Moves which settle nothing and leave a syllable
+    with no onset are in unsettled.
+    """
+    moves: dict[str, list[tuple[Unit, object]]] = field(default_factory=dict)
+    starts: dict[LauvinkoConsonant, "Table"] = field(default_factory=dict)
+    vowel_starts: dict[tuple[Held, Optional[LauvinkoConsonant]], "Table"] = field(default_factory=dict)
+    unsettled: list[tuple[Unit, object]] = field(default_factory=list)
+    keys: Optional[list[str]] = field(default=None, repr=False)
+
+    def put(self, key: str, moves: list[tuple[Unit, object]]):
+        self.moves.setdefault(key, []).extend(moves)
+
+    def add(self, transcription: Transcription, settled: Sequence[Held], next_onset: Optional[LauvinkoConsonant],
+            onset: Optional[LauvinkoConsonant], moves: dict[str, list[tuple[Unit, object]]]):
+        """Adds moves which settle the same syllables, followed by a syllable with next_onset, and then the text they
+        are keyed by. onset is the onset of the syllable the moves leave unsettled, if they settle none.
+        """
+        head = transcription.syllables(settled, next_onset)
+
+        if len(settled) > 0 and settled[0][0].onset is None:
+            after = settled[1][0].onset if len(settled) > 1 else next_onset
+            starts = self.vowel_starts.setdefault((settled[0], after), Table())
+            first = len(transcription.syllables(settled[:1], after))
+        elif len(settled) > 0 or onset is not None:
+            starts = self.starts.setdefault(settled[0][0].onset if settled else onset, Table())
+            first = 0
+        else:
+            starts = None
+
+        for rest, rest_moves in moves.items():
+            self.put(head + rest, rest_moves)
+
+            if starts is None:
+                self.unsettled.extend(rest_moves)
+            else:
+                starts.put(head[first:] + rest, rest_moves)
+
+    def continues(self, partial: str) -> bool:
+        """Whether a longer key starts with partial"""
+        if self.keys is None:
+            self.keys = sorted(self.moves)
+
+        i = bisect.bisect_right(self.keys, partial)
+        return i < len(self.keys) and self.keys[i].startswith(partial)
+
+
+@dataclass(eq=False)
+class DFAState:
+    """The readings the analyzer can be in at once after reading the start of a word, as a state of the deterministic
+    machine it builds up as it analyzes words. next is the step by each character from here, as found by Analyzer.step.
+    """
+    readings: tuple[Reading, ...]
+    next: dict = field(default_factory=dict)
+
+    def groups(self) -> dict[tuple[str, Optional["Table"], str], list[tuple[int, object]]]:
+        """The nodes of the readings, with their indices, grouped by what is left to read"""
+        groups = {}
+
+        for i, (node, text, table, partial) in enumerate(self.readings):
+            groups.setdefault((text, table, partial), []).append((i, node))
+
+        return groups
+
+
+@dataclass
+class JunctionGroup:
+    """Morphemes which all join onto a content word in the same way, as found by Analyzer.junction_groups.
+    Groups of morphemes with the same junction_key share an ident.
+    continues is whether they have a second syllable, next_onset is its onset,
+    and accent is the accent of their first syllable.
+    If they continue, members are their moves, keyed by the text from their second syllable up to and including the
+    onset of their last, and otherwise they are keyed by the Proto-Kasanic vowel and mutation the morphemes end in.
+    """
+    ident: int
+    morpheme: Optional[LauvinkoMorpheme]
+    continues: bool
+    next_onset: Optional[LauvinkoConsonant]
+    accent: Optional[bool]
+    members: dict
+
+
+def morpheme_outline(morpheme: LauvinkoMorpheme, primary_ta: PrimaryTenseAspect) -> str:
+    lemma = morpheme.lemma
+    out = lemma.ident
+
+    if lemma.category is not KasanicStemCategory.UNINFLECTED:
+        out += f".${PTA2ABBREV[primary_ta]}$"
+
+    if lemma.mstype in (MorphosyntacticType.INDEPENDENT, MorphosyntacticType.CLASS_WORD):
+        out += f".{MC_ABBREVS[morpheme.context]}"
+
+    return out
+
+
+def default_context(mstype: MorphosyntacticType) -> MorphemeContext:
+    """The context of a morpheme which isn't given one in a gloss outline"""
+    return MorphemeContext.PREFIXED if mstype in ACCENTLESS_TYPES else MorphemeContext.NONAUGMENTED
+
+
+def junction_key(morpheme: LauvinkoMorpheme) -> tuple:
+    """Everything about a morpheme which LauvinkoMorpheme.join looks at to join it onto the morphemes before it"""
+    accent_position = morpheme.surface_form.accent_position
+    pk_syllable = morpheme.virtual_original_form.surface_form.syllables[0]
+
+    return (
+        morpheme.surface_form.syllables[0],
+        pk_syllable.onset,
+        pk_syllable.vowel,
+        accent_position if accent_position is None else min(accent_position, 1),
+    )
+
+
+class Analyzer:
+    """Finds every gloss outline which generates a Lauvinko word, the reverse of Gloss.parse.
+
+    The analyzer is a finite-state machine over the text of a word, read left to right a morpheme or syntactic word at
+    a time. Joining a morpheme can only change the last syllable before it and its own first syllable, so every other
+    syllable is settled as soon as it is joined, and is matched against the word straight away. A state is everything
+    joining the next morpheme looks at: the last syllable, the last Proto-Kasanic vowel and the active mutation. There
+    are only so many of those, so prefixes of any number and order can be read. compile builds a table for each state,
+    of the text settled by every morpheme which can come next, so moving from one state to the next is a few
+    dictionary lookups, rather than joining every stem onto every prefix combination.
+
+    Cliticizing one syntactic word onto another only changes the last syllable of the first and the first syllable of
+    the second, so the last syllable of a word is only settled once the first syllable of the next is. The nodes of the
+    machine track everything LauvinkoWord.join_syntactic_words and the content words check, so every analysis it
+    accepts generates the word.
+
+    The machine is nondeterministic, so words are read by a deterministic machine whose states are the sets of readings
+    it can be in at once. It is built up a character at a time as words are analyzed, so each step is only worked out
+    the first time any word needs it, and words which start the same way share their steps. Once built, reading a word
+    is a dictionary lookup per character.
+    """
+    def __init__(self, dictionary: Dictionary, max_states: int = 4096):
+        self.dictionary = dictionary
+        self.units: dict = {mstype: [] for mstype in (*PREFIX_TYPES, MorphosyntacticType.INDEPENDENT)}
+        self.words: dict = {slot: [] for slot in WORD_SLOTS if slot is not CONTENT}
+        self.standalone: list[Unit] = []
+
+        # For each (held syllable, Proto-Kasanic vowel, mutation, is_stem), the junction onto it of each JunctionGroup.ident
+        self.junctions: dict[tuple, dict[int, Optional[tuple[LauvinkoSyllable, ...]]]] = {}
+        self.junction_idents: dict[tuple, int] = {}
+        self.groups: dict[tuple, list[JunctionGroup]] = {}
+        # Tables which compile doesn't build, and the words with no syllables after a held syllable
+        self.moves = LRUCache(maxsize=max_states)
+        # The syllables which cliticizing a syllable onto a syntactic word ending in a held syllable leaves, or None
+        self.attachments = LRUCache(maxsize=max_states)
+        # How a held syllable is written before the start of the next syntactic word, as found by start_text
+        self.start_texts = LRUCache(maxsize=max_states)
+        # The tables built by compile, which are kept for as long as the analyzer
+        self.tables: dict[tuple, Table] = {}
+        # The moves from a table after a held syllable, as found by after
+        self.afters = LRUCache(maxsize=max_states)
+        # The readings each node leads to without reading anything, as found by enter, and then reading each character,
+        # as found by node_step. Many states of the machine share each node, so more of them are kept.
+        self.entries = LRUCache(maxsize=4 * max_states)
+        self.node_steps = LRUCache(maxsize=4 * max_states)
+        # The states of the deterministic machine, by their readings, and the state each transcription starts in
+        self.max_states = max_states
+        self.states: dict[tuple[Transcription, frozenset], DFAState] = {}
+        self.starts: dict[Transcription, tuple[DFAState, list[list[str]]]] = {}
+        self.standalone_forms: dict[Transcription, dict[str, list[str]]] = {}
+
+        self.case_suffixes = [
+            dictionary.by_id(ident).languages[Language.LAUVINKO]
+            for ident in CASE_BY_IDENT
+            if dictionary.by_id(ident) is not None
+        ]
+        self.definite_markers = [
+            entry.languages[Language.LAUVINKO]
+            for entry in dictionary.query().where(mstype=MorphosyntacticType.DEFINITE_MARKER)
+        ]
+
+        for entry in dictionary.entries.values():
+            lemma = entry.languages[Language.LAUVINKO]
+
+            if entry.mstype in self.units:
+                self.add_morphemes(lemma)
+            elif entry.mstype in STANDALONE_TYPES:
+                self.add_word(lemma)
+            elif entry.mstype in DETERMINER_TYPES:
+                self.add_determiners(lemma)
+
+    @staticmethod
+    def main() -> "Analyzer":
+        dictionary = Dictionary.main()
+
+        if dictionary.version not in ANALYZERS:
+            ANALYZERS[dictionary.version] = Analyzer(dictionary)
+
+        return ANALYZERS[dictionary.version]
+
+    def compile(self):
+        """Builds the table of every state a content word can be in, and of the words around content words, in every
+        transcription. Otherwise, they are built the first time a word needs them, which makes the first few words
+        analyzed take a second or more each.
+        """
+        for transcription in TRANSCRIPTIONS:
+            self.standalone_outlines(transcription)
+
+            for kind in self.words:
+                for accented in (False, True) if kind is DETERMINER else (False,):
+                    self.compile_table((None, kind, accented, transcription))
+
+            states = {START}
+
+            for mstype in PREFIX_TYPES:
+                frontier = states
+
+                # modal prefixes can be stacked, so they are joined onto the states they lead to until there are no new ones
+                while frontier:
+                    next_states = {
+                        next_state
+                        for state in frontier
+                        for moves in self.compile_table((state, mstype, False, transcription)).moves.values()
+                        for _, next_state in moves
+                    }
+                    frontier = next_states - states if mstype is MorphosyntacticType.MODAL_PREFIX else set()
+                    states = states | next_states
+
+            for state in states:
+                for accented in (False, True):
+                    self.compile_table((state, MorphosyntacticType.INDEPENDENT, accented, transcription))
+
+    def compile_table(self, key: tuple) -> Table:
+        if key not in self.tables:
+            self.tables[key] = self.build_table(*key)
+
+        return self.tables[key]
+
+    def add_morphemes(self, lemma):
+        if lemma.mstype is MorphosyntacticType.INDEPENDENT:
+            contexts = (MorphemeContext.AUGMENTED, MorphemeContext.NONAUGMENTED)
+        else:
+            contexts = (MorphemeContext.PREFIXED,)
+
+        for primary_ta in lemma.category.primary_aspects:
+            for context in contexts:
+                morpheme = lemma.form(primary_ta, context)
+                self.units[lemma.mstype].append(Unit(morpheme_outline(morpheme, primary_ta), morpheme))
+
+    def add_word(self, lemma):
+        morpheme = lemma.form(PrimaryTenseAspect.GENERAL, default_context(lemma.mstype))
+        word = Unit(lemma.ident, LauvinkoWord.from_morphemes([morpheme]))
+
+        self.standalone.append(word)
+
+        if lemma.mstype in self.words:
+            self.words[lemma.mstype].append(word)
+
+    def add_determiners(self, lemma):
+        if lemma.mstype is MorphosyntacticType.CLASS_WORD:
+            contexts = (MorphemeContext.AUGMENTED, MorphemeContext.NONAUGMENTED)
+        else:
+            contexts = (default_context(lemma.mstype),)
+
+        for context in contexts:
+            for case in [None, *self.case_suffixes]:
+                for definite in [None, *self.definite_markers]:
+                    if definite is not None and case is None:
+                        continue
+
+                    morphemes = [lemma.form(PrimaryTenseAspect.GENERAL, context)]
+                    for suffix in case, definite:
+                        if suffix is not None:
+                            morphemes.append(suffix.form(PrimaryTenseAspect.GENERAL, default_context(suffix.mstype)))
+
+                    try:
+                        word = LauvinkoDeterminer.from_morphemes(morphemes)
+                    except (AssertionError, NotImplementedError):
+                        continue  # not every class word takes every case
+
+                    unit = Unit(
+                        "-".join(morpheme_outline(m, PrimaryTenseAspect.GENERAL) for m in morphemes),
+                        word,
+                    )
+                    self.standalone.append(unit)
+                    self.words[DETERMINER].append(unit)
+
+    def analyze(self, word: str, broad: bool = False) -> list[str]:
+        """Returns the outline of every gloss of one phonological word which is written as word,
+        which is romanized, or in broad IPA if broad is set.
+        """
+        transcription, text = Transcription.read(word, broad=broad)
+        outlines = set(self.standalone_outlines(transcription).get(text, ()))
+
+        state, outputs = self.start(transcription)
+        steps = []
+
+        for char in text:
+            step = self.step(state, char, transcription)
+
+            if step is None:
+                return sorted(outlines)
+
+            state, preds = step
+            steps.append(preds)
+
+        accepting = self.accepting(state, transcription)
+
+        # The outlines read up to each reading after each character, worked out backwards from the accepting readings,
+        # so that only the readings on the way to it are visited
+        memo: dict[tuple[int, int], list[str]] = {}
+
+        def read(position: int, i: int) -> list[str]:
+            if position == 0:
+                return outputs[i]
+
+            if (position, i) not in memo:
+                memo[position, i] = [
+                    outline + output
+                    for j, output in steps[position - 1][i]
+                    for outline in read(position - 1, j)
+                ]
+
+            return memo[position, i]
+
+        # content words start with "=" and each of their morphemes with "-"
+        outlines.update(
+            (outline + output).replace("=-", "=")[1:]
+            for i, output in accepting
+            for outline in read(len(text), i)
+        )
+
+        return sorted(outlines)
+
+    def standalone_outlines(self, transcription: Transcription) -> dict[str, list[str]]:
+        if transcription not in self.standalone_forms:
+            forms = {}
+
+            for unit in self.standalone:
+                forms.setdefault(transcription.surface_form(unit.value.surface_form()), []).append(unit.outline)
+
+            self.standalone_forms[transcription] = forms
+
+        return self.standalone_forms[transcription]
+
+    def start(self, transcription: Transcription) -> tuple[DFAState, list[list[str]]]:
+        """The state of the machine before reading a word, and the outlines which lead to each of its readings"""
+        if transcription not in self.starts:
+            self.starts[transcription] = self.intern({(PHRASE_START, "", None, ""): None}, transcription), [[""]]
+
+        return self.starts[transcription]
+
+    def step(self, state: DFAState, char: str,
+             transcription: Transcription) -> Optional[tuple[DFAState, tuple[tuple[tuple[int, str], ...], ...]]]:
+        """The state reading char leads to, along with where each of its readings comes from, as the index of a reading
+        of state and the outline in between. Steps are kept on the states, so words which start the same way share them.
+        Returns None if no analysis of a word can start with what has been read so far.
+        """
+        if char in state.next:
+            return state.next[char]
+
+        readings: dict[Reading, list[tuple[int, str]]] = {}
+
+        # readings which only differ in their node read the same text, so each group is only checked once
+        for (text, table, partial), members in state.groups().items():
+            if not text and table is None:
+                for i, node in members:
+                    for output, next_reading in self.node_step(node, char, transcription):
+                        readings.setdefault(next_reading, []).append((i, output))
+
+                continue
+
+            left = self.read_char(text, table, partial, char)
+
+            if left is None:
+                continue
+
+            for i, node in members:
+                for output, next_reading in self.readings(node, *left, transcription):
+                    readings.setdefault(next_reading, []).append((i, output))
+
+        step = None
+
+        if readings:
+            next_state = self.intern(readings, transcription)
+            step = next_state, tuple(tuple(readings[reading]) for reading in next_state.readings)
+
+        state.next[char] = step
+        return step
+
+    def intern(self, readings: dict, transcription: Transcription) -> DFAState:
+        """The one state with a set of readings, so that the machine only grows with the sets of readings it comes
+        across, rather than with every word analyzed. It is cleared once it has max_states states.
+        """
+        key = (transcription, frozenset(readings))
+
+        if key not in self.states:
+            if len(self.states) >= self.max_states:
+                self.states.clear()
+                self.starts.clear()
+
+            self.states[key] = DFAState(tuple(readings))
+
+        return self.states[key]
+
+    @staticmethod
+    def read_char(text: str, table: Optional[Table], partial: str,
+                  char: str) -> Optional[tuple[str, Optional[Table], str]]:
+        """What is left to read once char has been read, or None if char can't be read next"""
+        if text:
+            return (text[1:], table, "") if text[0] == char else None
+
+        partial += char
+        return (text, table, partial) if partial in table.moves or table.continues(partial) else None
+
+    def readings(self, node, text: str, table: Optional[Table], partial: str, transcription: Transcription,
+                 entering: Optional[dict] = None) -> list[tuple[str, Reading]]:
+        """The readings which node reading text, and then a key of table which starts with partial, stands for, along
+        with the outlines which lead to them. Once text is read, the moves keyed by partial are made, and node is kept
+        as long as a longer key starts with partial. With no table, node is reached once text is read.
+        """
+        if text:
+            return [("", (node, text, table, partial))]
+
+        if table is None:
+            return self.reach(node, transcription, entering)
+
+        out = [("", (node, "", table, partial))] if table.continues(partial) else []
+
+        for unit, next_state in table.moves.get(partial, ()):
+            if unit is None:
+                out += self.readings(node, "", next_state, "", transcription, entering)
+            else:
+                out += self.move(node, unit, next_state, None, transcription, entering)
+
+        return out
+
+    def reach(self, node, transcription: Transcription, entering: Optional[dict]) -> list[tuple[str, Reading]]:
+        """The readings which reaching node leads to. While reading a character, node is left to be entered by the
+        next step, so that it is one reading, rather than every reading it leads to.
+        """
+        if entering is None:
+            return [("", (node, "", None, ""))]
+
+        return self.enter(node, transcription, entering)
+
+    def node_step(self, node, char: str, transcription: Transcription) -> list[tuple[str, Reading]]:
+        """The readings which entering node and then reading char leads to, along with the outlines in between.
+        They are kept for each node, so that every state of the machine the node is reached in shares them.
+        """
+        def compute():
+            out = []
+
+            for output, (next_node, text, table, partial) in self.enter(node, transcription):
+                # only ACCEPTED has nothing left to read
+                left = None if table is None and not text else self.read_char(text, table, partial, char)
+
+                if left is not None:
+                    out += [(output + o, r) for o, r in self.readings(next_node, *left, transcription)]
+
+            return out
+
+        return self.node_steps.get_or_compute((node, char, transcription), compute)
+
+    def accepting(self, state: DFAState, transcription: Transcription) -> list[tuple[int, str]]:
+        """The readings of state which can end the word, along with the outlines they end it with"""
+        return [
+            (i, output)
+            for i, (node, text, table, _) in enumerate(state.readings)
+            if not text and table is None
+            for output, reading in self.enter(node, transcription)
+            if reading == ACCEPTED
+        ]
+
+    def enter(self, node, transcription: Transcription, entering: Optional[dict] = None) -> list[tuple[str, Reading]]:
+        """The readings which reading nothing from node leads to, along with the outlines which lead to them.
+        entering are the nodes this is reading nothing from already, each with whether a cycle has come back to it.
+        A cycle of moves which read nothing only repeats analyses found without it, but the readings of the nodes on
+        it are left incomplete, so they are only kept once the cycle has been left.
+        """
+        if entering is None:
+            entering = {}
+
+        if node in entering:
+            entering[node] = True
+            return []
+
+        out = self.entries.get((node, transcription))
+
+        if out is None:
+            entering[node] = False
+            out = self.enter_node(node, transcription, entering)
+            del entering[node]
+
+            if not any(entering.values()):
+                self.entries.put((node, transcription), out)
+
+        return out
+
+    def enter_node(self, node, transcription: Transcription, entering: dict) -> list[tuple[str, Reading]]:
+        if node is ACCEPT:
+            return [("", ACCEPTED)]
+
+        if isinstance(node, ContentState):
+            return self.enter_content_word(node, transcription, entering)
+
+        state = node
+        out = []
+
+        if state.slot == len(WORD_SLOTS):
+            if state.accent is Accent.PLACED and state.found and state.held is not None:
+                out += self.readings(ACCEPT, transcription.syllables([state.held], None), None, "", transcription, entering)
+
+            return out
+
+        # every slot can be left empty
+        out += self.enter(state.following(state.held), transcription, entering)
+        kind = WORD_SLOTS[state.slot]
+
+        if kind is CONTENT:
+            # A content word after the first syntactic word takes the accent, so the first is only accented if there is
+            # no second
+            if state.accent is Accent.NO_WORDS:
+                options = (True, False)
+            elif state.slot == SECOND_CONTENT and state.accent is Accent.OWED:
+                options = (True,)
+            else:
+                options = ()
+
+            for accented in options:
+                content_word = ContentState(state, 0, False, START, state.held, accented)
+                out += [("=" + output, reading) for output, reading in self.enter(content_word, transcription, entering)]
+
+        # the accent goes on the first syntactic word unless a second content word takes it, and neither a sex suffix
+        # nor a determiner can be followed by one
+        elif kind is MorphosyntacticType.SEX_SUFFIX and state.accent is not Accent.PLACED:
+            pass
+
+        elif kind is DETERMINER and state.accent is Accent.OWED:
+            pass
+
+        # a second determiner can only be a number suffix after a class word
+        elif state.slot == SECOND_DETERMINER and state.determiner is not MorphosyntacticType.CLASS_WORD:
+            pass
+
+        else:
+            accented = kind is DETERMINER and state.accent is Accent.NO_WORDS
+            out += self.start_readings(state, (None, kind, accented, transcription), state.held, transcription, entering)
+
+            for settled, unit, held in self.clitic_moves(state.held, kind, transcription):
+                next_state = self.after_word(state, unit.value, held)
+
+                if next_state is not None:
+                    out += [
+                        ("=" + unit.outline + output, reading)
+                        for output, reading in self.readings(next_state, settled, None, "", transcription, entering)
+                    ]
+
+        return out
+
+    def enter_content_word(self, node: "ContentState", transcription: Transcription,
+                           entering: dict) -> list[tuple[str, Reading]]:
+        out = []
+
+        if node.stage < STEM:
+            mstype = PREFIX_TYPES[node.stage]
+
+            if not (node.agreement and mstype is MorphosyntacticType.TOPIC_CASE_PREFIX):
+                out += self.enter(
+                    ContentState(node.phrase, node.stage + 1, node.agreement, node.state, node.previous, node.accented),
+                    transcription,
+                    entering,
+                )
+        else:
+            mstype = MorphosyntacticType.INDEPENDENT
+
+        # only the stem of a content word is accented
+        key = (node.state, mstype, node.accented and node.stage == STEM, transcription)
+        out += self.start_readings(node, key, node.previous, transcription, entering)
+
+        return out
+
+    def start_readings(self, node, key: tuple, previous: Optional[Held], transcription: Transcription,
+                       entering: dict) -> list[tuple[str, Reading]]:
+        """The readings of node starting to read the table for key, after a syntactic word ending in previous which
+        hasn't been settled yet
+        """
+        if previous is None:
+            return self.readings(node, "", self.table(key), "", transcription, entering)
+
+        out = self.readings(node, "", self.after(previous, key), "", transcription, entering)
+
+        for unit, next_state in self.table(key).unsettled:
+            out += self.move(node, unit, next_state, previous, transcription, entering)
+
+        return out
+
+    def after(self, previous: Held, key: tuple) -> Table:
+        """The moves in the table for key which settle previous, the last syllable of the syntactic word before them.
+        They are keyed by how previous is written before each group of Table.starts and Table.vowel_starts, and each
+        move goes on to read a key of its group, so that nothing is read from a group until that text has been.
+        """
+        def compute():
+            table = self.table(key)
+            transcription = key[-1]
+            after = Table()
+
+            for onset, starts in table.starts.items():
+                start = self.start_text(previous, None, onset, transcription)
+
+                if start is not None:
+                    after.put(start, [(None, starts)])
+
+            for (first, next_onset), starts in table.vowel_starts.items():
+                start = self.start_text(previous, first, next_onset, transcription)
+
+                if start is not None:
+                    after.put(start, [(None, starts)])
+
+            return after
+
+        return self.afters.get_or_compute((previous, key), compute)
+
+    def move(self, node, unit: Unit, next_state, previous: Optional[Held], transcription: Transcription,
+             entering: Optional[dict] = None) -> list[tuple[str, Reading]]:
+        """The readings which node leads to by reading unit, which leads to next_state. previous is the last syllable of
+        the syntactic word before, if unit hasn't settled it.
+        """
+        if isinstance(node, ContentState):
+            output = "-" + unit.outline
+
+            if node.stage < STEM:
+                if node.stage == PREFIX_TYPES.index(MorphosyntacticType.TOPIC_CASE_PREFIX) and not node.agreement and \
+                        unit.value.lemma.ident != DEPENDENT_TOPIC_CASE:
+                    return []
+
+                next_node = ContentState(
+                    phrase=node.phrase,
+                    # modal prefixes can be stacked
+                    stage=node.stage + (PREFIX_TYPES[node.stage] is not MorphosyntacticType.MODAL_PREFIX),
+                    agreement=node.agreement or PREFIX_TYPES[node.stage] is MorphosyntacticType.TOPIC_AGREEMENT_PREFIX,
+                    state=next_state,
+                    previous=previous,
+                    accented=node.accented,
+                )
+                return [(output + o, r) for o, r in self.reach(next_node, transcription, entering)]
+
+            held = next_state.held
+            phrase = node.phrase
+        else:
+            output = "=" + unit.outline
+            held = next_state
+            phrase = node
+
+        settled = ""
+
+        if previous is not None:
+            if held is None:
+                return []  # a word with no syllables leaves nothing to cliticize onto
+
+            settlement = self.settlement(previous, held, transcription)
+
+            if settlement is None:
+                return []
+
+            settled, held = settlement
+
+        if isinstance(node, ContentState):
+            next_node = phrase.following(
+                held,
+                accent=Accent.PLACED if node.accented else Accent.OWED,
+                context=unit.value.context,
+                found=True,
+            )
+        else:
+            next_node = self.after_word(phrase, unit.value, held)
+
+            if next_node is None:
+                return []
+
+        if settled:
+            return [(output, (next_node, settled, None, ""))]
+
+        return [(output + o, r) for o, r in self.reach(next_node, transcription, entering)]
+
+    @staticmethod
+    def after_word(state: PhraseState, word: LauvinkoWord, held: Optional[Held]) -> Optional[PhraseState]:
+        """The state after a syntactic word other than a content word, or None if it can't follow the words so far"""
+        if word.word_type() is LauvinkoWordType.DETERMINER:
+            if state.slot == SECOND_DETERMINER:
+                if word.determiner_type() is not MorphosyntacticType.NUMBER_SUFFIX:
+                    return None
+
+                return state.following(held)
+
+            if state.context is not None and word.expected_context() is not state.context:
+                return None  # the augment must match between the content word and the class word
+
+            return state.following(held, accent=Accent.PLACED, found=True, determiner=word.determiner_type())
+
+        if word.word_type() is LauvinkoWordType.ADPOSITION:
+            accent = Accent.OWED if state.accent is Accent.NO_WORDS else state.accent
+            return state.following(held, accent=accent, found=False)
+
+        return state.following(held)
+
+    def start_text(self, previous: Held, first: Optional[Held], after: Optional[LauvinkoConsonant],
+                   transcription: Transcription) -> Optional[str]:
+        """How previous, the last syllable of a syntactic word, is written before the next, along with first,
+        the first syllable of the next if it has no onset, followed by a syllable with the onset after.
+        Returns None if the next word can't follow previous.
+        """
+        def compute():
+            if first is None:
+                return None if after in INITIAL_ONSETS else transcription.syllables([previous], after)
+
+            syllables = self.attachment(previous, first)
+            return None if syllables is None else transcription.syllables(syllables, after)
+
+        return self.start_texts.get_or_compute((previous, first, after, transcription), compute)
+
+    def settlement(self, previous: Held, held: Held, transcription: Transcription) -> Optional[tuple[str, Held]]:
+        """Settles previous, the last syllable of a syntactic word, before a whole word which is held, its only syllable.
+        Returns the text they are written as, and the syllable held after them, or None if the word can't follow previous.
+        """
+        syllables = self.attachment(previous, held)
+
+        if syllables is None:
+            return None
+
+        onset, held = transcription.split_onset(syllables[-1])
+        return transcription.syllables(syllables[:-1], syllables[-1][0].onset) + onset, held
+
+    def attachment(self, previous: Held, first: Held) -> Optional[list[Held]]:
+        """The syllables which first, the first syllable of a syntactic word, and previous, the last syllable of the
+        word before, are left as, or None if a syllable starting a word can't follow previous
+        """
+        def compute():
+            try:
+                syllables = self.attach(previous, [first])
+            except (ValueError, RuntimeError):
+                return None  # generating this combination fails too
+
+            # only the first syllable of a phonological word can have no onset, or h
+            if len(syllables) > 1 and syllables[-1][0].onset in INITIAL_ONSETS:
+                return None
+
+            return syllables
+
+        return self.attachments.get_or_compute((previous, first), compute)
+
+    def table(self, key: tuple) -> Table:
+        if key in self.tables:
+            return self.tables[key]
+
+        return self.moves.get_or_compute(key, lambda: self.build_table(*key))
+
+    def build_table(self, state: Optional[JoinState], kind, accented: bool, transcription: Transcription) -> Table:
+        if kind in self.units:
+            return self.morpheme_table(state, kind, accented, transcription)
+
+        return self.word_table(kind, accented, transcription)
+
+    def morpheme_table(self, state: JoinState, mstype: MorphosyntacticType, accented: bool,
+                       transcription: Transcription) -> Table:
+        """For every morpheme of type mstype, the state which joining it leads to, keyed by the text it settles
+        along with the onset split off the first syllable which isn't settled
+        """
+        table = Table()
+        is_stem = mstype is MorphosyntacticType.INDEPENDENT
+
+        # junctions onto this state, by JunctionGroup.ident
+        junctions = self.junctions.setdefault((state.held and state.held[0], state.pk_vowel, state.mutation, is_stem), {})
+
+        for group in self.junction_groups(mstype, accented, transcription):
+            if group.morpheme is None:
+                table.add(transcription, (), None, None, {
+                    "": [(unit, self.join(state, unit.value)) for unit in group.members],
+                })
+                continue
+
+            if group.ident not in junctions:
+                try:
+                    junctions[group.ident] = self.junction(state, group.morpheme, is_stem)
+                except (ValueError, NotImplementedError, RuntimeError):
+                    junctions[group.ident] = None  # generating this combination fails too
+
+            junction = junctions[group.ident]
+            if junction is None:
+                continue
+
+            syllables = [(syllable, None) for syllable in junction]
+            syllables[-1] = (junction[-1], group.accent)
+
+            if group.continues:
+                table.add(transcription, syllables, group.next_onset, None, group.members)
+            else:
+                onset, held = transcription.split_onset(syllables[-1])
+
+                table.add(transcription, syllables[:-1], junction[-1].onset, junction[-1].onset, {onset: [
+                    (unit, JoinState(held, pk_vowel, mutation))
+                    for (pk_vowel, mutation), units in group.members.items()
+                    for unit in units
+                ]})
+
+        return table
+
+    def junction_groups(self, mstype: MorphosyntacticType, accented: bool,
+                        transcription: Transcription) -> list["JunctionGroup"]:
+        """The morphemes of type mstype, grouped so that joining any morpheme of a group onto the same state gives the
+        same junction. The rest of each morpheme, which joining leaves alone, is written out once here.
+        Morphemes with no syllables are put in a group of their own, whose morpheme is None and whose members are a
+        list of them.
+        """
+        key = (mstype, accented, transcription)
+
+        if key not in self.groups:
+            is_stem = mstype is MorphosyntacticType.INDEPENDENT
+            groups: dict = {None: JunctionGroup(-1, None, False, None, None, [])}
+
+            for unit in self.units[mstype]:
+                morpheme = unit.value
+                ms = morpheme.surface_form.syllables
+                pk_syllables = morpheme.virtual_original_form.surface_form.syllables
+
+                if len(ms) == 0:
+                    groups[None].members.append(unit)
+                    continue
+
+                syllables = held_syllables(morpheme.surface_form, accented and is_stem)
+                next_onset = ms[1].onset if len(ms) > 1 else None
+                group_key = (junction_key(morpheme), len(ms) > 1, next_onset, syllables[0][1])
+
+                if group_key not in groups:
+                    ident = self.junction_idents.setdefault(group_key[0], len(self.junction_idents))
+                    groups[group_key] = JunctionGroup(ident, morpheme, len(ms) > 1, next_onset, syllables[0][1], {})
+
+                members = groups[group_key].members
+
+                if len(ms) > 1:
+                    onset, held = transcription.split_onset(syllables[-1])
+                    body = transcription.syllables(syllables[1:-1], ms[-1].onset) + onset
+                    members.setdefault(body, []).append(
+                        (unit, JoinState(held, pk_syllables[-1].vowel, morpheme.end_mutation()))
+                    )
+                else:
+                    members.setdefault((pk_syllables[-1].vowel, morpheme.end_mutation()), []).append(unit)
+
+            self.groups[key] = list(groups.values())
+
+        return self.groups[key]
+
+    def word_table(self, kind, accented: bool, transcription: Transcription) -> Table:
+        """Like morpheme_table, for the words of a kind with syllables, which lead to the last syllable they hold"""
+        table = Table()
+
+        for unit in self.words[kind]:
+            sf = unit.value.surface_form()
+
+            if len(sf.syllables) == 0:
+                continue  # these are cliticized by clitic_moves
+
+            syllables = held_syllables(sf, accented)
+            onset, held = transcription.split_onset(syllables[-1])
+            table.add(transcription, syllables[:-1], syllables[-1][0].onset, syllables[-1][0].onset,
+                      {onset: [(unit, held)]})
+
+        return table
+
+    def clitic_moves(self, held: Optional[Held], kind, transcription: Transcription) -> list[tuple[str, Unit, Held]]:
+        """(text, word, last syllable) for the words of a kind with no syllables, which change the syntactic word ending
+        in held they follow, or are left out altogether at the start of a phonological word
+        """
+        def compute():
+            moves = []
+
+            for unit in self.words[kind]:
+                if len(unit.value.surface_form().syllables) > 0:
+                    continue
+
+                if held is None:
+                    # case endings need a syllable to go on
+                    if unit.value.word_type() is not LauvinkoWordType.DETERMINER:
+                        moves.append(("", unit, None))
+                    continue
+
+                try:
+                    syllables = self.cliticize(held, unit.value)
+                except (ValueError, NotImplementedError, RuntimeError):
+                    continue  # generating this combination fails too
+
+                onset, next_held = transcription.split_onset(syllables[-1])
+                moves.append((transcription.syllables(syllables[:-1], syllables[-1][0].onset) + onset, unit, next_held))
+
+            return moves
+
+        return self.moves.get_or_compute((held, kind, transcription), compute)
+
+    @staticmethod
+    def join(state: JoinState, morpheme: LauvinkoMorpheme) -> JoinState:
+        """Joins a morpheme with no syllables onto a content word, which leaves its last syllable alone"""
+        pk_syllables = morpheme.virtual_original_form.surface_form.syllables
+        end_mutation = morpheme.end_mutation()
+
+        return JoinState(
+            held=state.held,
+            pk_vowel=pk_syllables[-1].vowel if pk_syllables else state.pk_vowel,
+            mutation=state.mutation if end_mutation is None else end_mutation,
+        )
+
+    @staticmethod
+    def junction(state: JoinState, morpheme: LauvinkoMorpheme, is_stem: bool) -> tuple[LauvinkoSyllable, ...]:
+        """The syllables which joining morpheme onto a content word leaves in place of the last syllable so far
+        and the first syllable of morpheme. They only depend on junction_key(morpheme), and are found by joining
+        morpheme onto a stand-in for the word so far.
+        """
+        held = state.held and state.held[0]
+
+        # The stand-in's Proto-Kasanic onset is NC, so that joining leaves its Lauvinko onset alone
+        stand_in = LauvinkoMorpheme(
+            lemma=None,
+            surface_form=LauvinkoSurfaceForm(
+                syllables=() if held is None else (held,),
+                accent_position=None,
+                falling_accent=False,
+            ),
+            virtual_original_form=ProtoKasanicMorpheme(
+                lemma=None,
+                surface_form=PKSurfaceForm(
+                    syllables=() if held is None else (
+                        ProtoKasanicSyllable.unvalidated(ProtoKasanicOnset.NC, state.pk_vowel),
+                    ),
+                    stress_position=None,
+                ),
+                end_mutation=state.mutation,
+            ),
+            context=MorphemeContext.PREFIXED,
+        )
+
+        joined = LauvinkoMorpheme.join([stand_in, morpheme], accented=1 if is_stem else None).surface_form.syllables
+        return joined[:len(joined) - len(morpheme.surface_form.syllables) + 1]
+
+    @staticmethod
+    def attach(previous: Held, syllables: list[Held]) -> list[Held]:
+        """Cliticizes syllables, the start of a syntactic word, onto a syntactic word ending in previous"""
+        before = [previous[0].builder()]
+        ms = [syllables[0][0].builder()]
+
+        LauvinkoWord.attach_syllables(before, ms, 0 if previous[1] is not None else -1)
+
+        out = [(syllable, None) for syllable in build_syllables(before + ms)] + syllables[1:]
+
+        # an accent stays on the same syllable, even if the one it was on has merged with the next
+        if previous[1] is not None:
+            out[0] = (out[0][0], previous[1])
+        if syllables[0][1] is not None:
+            out[len(before)] = (out[len(before)][0], syllables[0][1])
+
+        return out
+
+    @staticmethod
+    def cliticize(previous: Held, word: LauvinkoWord) -> list[Held]:
+        """The syllables which cliticizing word, which has no syllables, onto a syntactic word ending in previous
+        leaves in place of previous
+        """
+        if word.word_type() is not LauvinkoWordType.DETERMINER:
+            return [previous]
+
+        before = [previous[0].builder()]
+        word.apply_case_ending(before, 0 if previous[1] is not None else -1)
+
+        return [
+            (syllable, previous[1] if i == 0 else None)
+            for i, syllable in enumerate(build_syllables(before))
+        ]
+
+
+# Analyzers for each dictionary version
+ANALYZERS: dict[str, Analyzer] = {}
+
+Dictionary.changes().subscribe(lambda _dictionary: ANALYZERS.clear())
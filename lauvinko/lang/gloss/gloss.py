@@ -4,6 +4,7 @@ import re
 
 from ..shared.semantics import PrimaryTenseAspect, PRIMARY_TA_ABBREVIATIONS, KasanicStemCategory, PTA2ABBREV
 from ..shared.morphology import Morpheme, Word, MorphosyntacticType
+from ..shared.cache import LRUCache
 from ..proto_kasanic.morphology import PKWord
 from ..proto_kasanic.romanize import romanize as pk_romanize
 from ..lauvinko.morphology import LauvinkoWord
@@ -25,7 +26,12 @@ MC_ABBREVS = {
 
 
 def parse_gloss_tag(gloss_tag: str):
-    return re.fullmatch("\\$([a-z]+)\\$", gloss_tag).group(1)
+    m = re.fullmatch("\\$([a-z]+)\\$", gloss_tag)
+
+    if m is None:
+        raise InvalidGloss(f"Invalid gloss tag: {gloss_tag}")
+
+    return m.group(1)
 
 
 def normalize_word(word: str):
@@ -73,7 +79,18 @@ class MorphemeSource:
         self.value = self.resolve()
 
     @classmethod
-    def parse(cls, source: str, language: Language):
+    def parse(cls, source: str, language: Language, sources: Optional[dict] = None):
+        """sources, if given, caches parsed morpheme sources so that they can be shared between many glosses"""
+        if sources is None:
+            return cls._parse(source, language)
+
+        if (source, language) not in sources:
+            sources[(source, language)] = cls._parse(source, language)
+
+        return sources[(source, language)]
+
+    @classmethod
+    def _parse(cls, source: str, language: Language):
         pieces = source.split(".")
 
         if len(pieces) > 1 and pieces[1] in {"$sg$", "$du$", "$pl$"}:
@@ -90,7 +107,13 @@ class MorphemeSource:
             primary_ta = None
 
         if len(pieces) > i:
-            context = parse_context(parse_gloss_tag(pieces[i]))
+            context_tag = parse_gloss_tag(pieces[i])
+
+            try:
+                context = parse_context(context_tag)
+            except ValueError:
+                raise InvalidGloss(f"Invalid augment: {pieces[i]}")
+
             i += 1
         else:
             context = None
@@ -193,9 +216,9 @@ class GlossSyntacticWord:
     language: Language
 
     @classmethod
-    def parse(cls, source: str, language: Language):
+    def parse(cls, source: str, language: Language, sources: Optional[dict] = None):
         ms = [
-            MorphemeSource.parse(s, language)
+            MorphemeSource.parse(s, language, sources=sources)
             for s in source.split("-")
         ]
 
@@ -246,7 +269,7 @@ class GlossPhonologicalWord:
             raise NotImplementedError
 
     @classmethod
-    def parse(cls, source: str, language: Language):
+    def parse(cls, source: str, language: Language, sources: Optional[dict] = None):
         front_matter = re.match("^[^a-zA-Z0-9$]*", source).group()
         back_matter = re.search("[^a-zA-Z0-9$]*$", source).group()
 
@@ -254,15 +277,18 @@ class GlossPhonologicalWord:
         if back_matter:
             source = source[:-len(back_matter)]
 
-        first_letter = re.search("[a-zA-Z]", source).group()
+        first_letter = re.search("[a-zA-Z]", source)
+
+        if first_letter is None:
+            raise InvalidGloss(f"Word has no morphemes: {source}")
 
         return cls(
             swords=[
-                GlossSyntacticWord.parse(sword, language=language)
+                GlossSyntacticWord.parse(sword, language=language, sources=sources)
                 for sword in source.lower().split("=")
             ],
             language=language,
-            capitalize=first_letter.isupper(),
+            capitalize=first_letter.group().isupper(),
             front_matter=front_matter,
             back_matter=back_matter,
         )
@@ -298,16 +324,22 @@ class GlossPhonologicalWord:
         return "".join(sword.falavay() for sword in self.swords)
 
 
+# Gloss.as_json results, keyed on (dictionary version, language, outline)
+GLOSS_CACHE = LRUCache(maxsize=4096)
+
+Dictionary.changes().subscribe(lambda _dictionary: GLOSS_CACHE.clear())
+
+
 @dataclass
 class Gloss:
     pwords: List[GlossPhonologicalWord]
     language: Language
 
     @classmethod
-    def parse(cls, source: str, language: Language):
+    def parse(cls, source: str, language: Language, sources: Optional[dict] = None):
         return cls(
             pwords=[
-                GlossPhonologicalWord.parse(word, language=language)
+                GlossPhonologicalWord.parse(word, language=language, sources=sources)
                 for word in source.split()
             ],
             language=language,
@@ -336,3 +368,13 @@ class Gloss:
             "romanization": self.romanization(),
             "falavay": self.falavay(),
         }
+
+    @classmethod
+    def cached_json(cls, source: str, language: Language, sources: Optional[dict] = None) -> dict:
+        """Equivalent to parsing source and calling as_json, but reuses the results for outlines seen before.
+        Invalid outlines are not cached, and raise every time.
+        """
+        return GLOSS_CACHE.get_or_compute(
+            (Dictionary.main().version, language, source),
+            lambda: cls.parse(source, language=language, sources=sources).as_json(),
+        )
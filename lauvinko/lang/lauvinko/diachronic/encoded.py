@@ -0,0 +1,334 @@
+"""The sound changes of ProtoKasanicOrigin, over forms encoded as integers. Each syllable is a row of
+[onset, vowel, coda, stressed], where consonants and vowels are their indices in CONSONANTS and VOWELS,
+and what every phoneme turns into, or which features it has, is looked up in tables indexed the same way.
+The passes do exactly what the stages of ProtoKasanicOrigin of the same name do, but without allocating
+GenericCVCSyllables or going through generators.
+"""
+from typing import Optional
+from lauvinko.lang.shared.phonology import VowelFrontness
+from lauvinko.lang.proto_kasanic.phonology import ProtoKasanicOnset, ProtoKasanicVowel, ProtoKasanicMutation, PKSurfaceForm
+from lauvinko.lang.lauvinko.phonology import LauvinkoConsonant, LauvinkoVowel, LauvinkoSyllable
+from .base import MorphemeContext
+from .correspondences import PK_TO_LV_ONSETS, DIPHTHONG_END, OFFGLIDES, break_pk_consonant
+
+# Consonant 0 is no consonant at all
+CONSONANTS: tuple = (None, *ProtoKasanicOnset, *LauvinkoConsonant)
+VOWELS: tuple = (*ProtoKasanicVowel, *LauvinkoVowel)
+
+CONSONANT_IDS = {c: i for i, c in enumerate(CONSONANTS)}
+VOWEL_IDS = {v: i for i, v in enumerate(VOWELS)}
+
+
+def pk(c: Optional[ProtoKasanicOnset]) -> int:
+    return CONSONANT_IDS[c]
+
+
+def lv(c: Optional[LauvinkoConsonant]) -> int:
+    return CONSONANT_IDS[c]
+
+
+NC = pk(ProtoKasanicOnset.NC)
+LV_H, LV_N, LV_S, LV_A, LV_V, LV_Y = map(lv, (
+    LauvinkoConsonant.H,
+    LauvinkoConsonant.N,
+    LauvinkoConsonant.S,
+    LauvinkoConsonant.A,
+    LauvinkoConsonant.V,
+    LauvinkoConsonant.Y,
+))
+PK_A, PK_AA, PK_U, PK_O, PK_E = map(VOWEL_IDS.__getitem__, (
+    ProtoKasanicVowel.A,
+    ProtoKasanicVowel.AA,
+    ProtoKasanicVowel.U,
+    ProtoKasanicVowel.O,
+    ProtoKasanicVowel.E,
+))
+LV_VOWEL_A, LV_VOWEL_E, LV_VOWEL_O = map(VOWEL_IDS.__getitem__, (LauvinkoVowel.A, LauvinkoVowel.E, LauvinkoVowel.O))
+PK_MID_VOWELS = {
+    low: VOWEL_IDS[ProtoKasanicVowel.find_by(low=low, frontness=VowelFrontness.MID)]
+    for low in (False, True)
+}
+
+# Features of each vowel
+FRONTNESS = tuple(v.frontness for v in VOWELS)
+LOW = tuple(v.low for v in VOWELS)
+UNDERSPECIFIED = {i for i, v in enumerate(VOWELS) if v.frontness is VowelFrontness.UNDERSPECIFIED}
+# The Lauvinko consonant each vowel becomes as an offglide, or -1 if it can't be one
+OFFGLIDE = tuple(lv(OFFGLIDES[v.frontness]) if v.frontness in OFFGLIDES else -1 for v in VOWELS)
+
+# The tables below are only looked up with Proto-Kasanic vowels
+PK_VOWELS = [v if isinstance(v, ProtoKasanicVowel) else None for v in VOWELS]
+
+# Each vowel shifted to each height
+RAISED = tuple(v and VOWEL_IDS[ProtoKasanicVowel.shift_height(v, low=False)] for v in PK_VOWELS)
+LOWERED = tuple(v and VOWEL_IDS[ProtoKasanicVowel.shift_height(v, low=True)] for v in PK_VOWELS)
+# The vowel each diphthong ends in, or -1 for vowels which aren't diphthongs
+DIPHTHONG = tuple(VOWEL_IDS[DIPHTHONG_END[v]] if v in DIPHTHONG_END else -1 for v in PK_VOWELS)
+# The Lauvinko vowel each vowel other than A and U becomes, or -1 where there is none
+CONVERTED = tuple(v and VOWEL_IDS.get(LauvinkoVowel.find_by(v.low, v.frontness), -1) for v in PK_VOWELS)
+
+# The tables below are only looked up with no consonant or a Proto-Kasanic onset
+PK_ONSETS = [c if isinstance(c, ProtoKasanicOnset) else None for c in CONSONANTS]
+
+# The Lauvinko consonant each onset becomes, or -1 for NC
+TO_LV = tuple(lv(PK_TO_LV_ONSETS[c]) if c in PK_TO_LV_ONSETS else 0 if c is None else -1 for c in PK_ONSETS)
+# The coda and Proto-Kasanic onset each onset is broken into after another syllable
+BROKEN = tuple((lv(coda), pk(onset)) for coda, onset in map(break_pk_consonant, PK_ONSETS))
+# The Lauvinko consonant each onset becomes after lenition, and whether lenition changes it
+LENITED = tuple(
+    (0, False) if c is None or c is ProtoKasanicOnset.NC else
+    (TO_LV[pk(ProtoKasanicMutation.LENITION.mutate(c))], ProtoKasanicMutation.LENITION.mutate(c) is not c)
+    for c in PK_ONSETS
+)
+
+
+def encode(pk_sf: PKSurfaceForm, context: MorphemeContext) -> Optional[list[list]]:
+    """The rows of pk_sf, like ProtoKasanicOrigin.genericize, or None if it has an underspecified vowel,
+    which only the reference implementation handles
+    """
+    stress_position = None if context is MorphemeContext.PREFIXED else pk_sf.stress_position
+    rows = []
+
+    for i, syllable in enumerate(pk_sf.syllables):
+        vowel = VOWEL_IDS[syllable.vowel]
+
+        if vowel in UNDERSPECIFIED:
+            return None
+
+        rows.append([CONSONANT_IDS[syllable.onset], vowel, 0, i == stress_position])
+
+    return rows
+
+
+# Each LauvinkoSyllable decoded so far, by (onset, vowel, coda)
+DECODED: dict[tuple[int, int, int], LauvinkoSyllable] = {}
+
+
+def decode(rows: list[list]) -> tuple[list[LauvinkoSyllable], Optional[int]]:
+    lv_syllables, accent_position = [], None
+
+    for i, (onset, vowel, coda, stressed) in enumerate(rows):
+        syllable = DECODED.get((onset, vowel, coda))
+
+        if syllable is None:
+            syllable = DECODED[onset, vowel, coda] = LauvinkoSyllable.of(
+                onset=CONSONANTS[onset],
+                vowel=VOWELS[vowel],
+                coda=CONSONANTS[coda],
+            )
+
+        lv_syllables.append(syllable)
+
+        if stressed:
+            accent_position = i
+
+    return lv_syllables, accent_position
+
+
+def break_diphthongs(rows: list[list]) -> list[list]:
+    out = []
+
+    for row in rows:
+        end = DIPHTHONG[row[1]]
+
+        if end >= 0:
+            out.append([row[0], PK_AA, 0, False])
+            out.append([0, end, 0, row[3]])
+        else:
+            out.append(row)
+
+    return out
+
+
+def transform_consonants(rows: list[list], context: MorphemeContext) -> tuple[list[list], Optional[bool]]:
+    out = []
+    falling_accent = None
+    reduces = context is MorphemeContext.NONAUGMENTED
+
+    if rows[0][0] == NC:
+        rows = [[0, PK_AA, 0, False]] + rows
+
+    for i, row in enumerate(rows):
+        if row[3]:
+            falling_accent = context is not MorphemeContext.AUGMENTED
+
+        if reduces and i > 0 and rows[i - 1][3]:
+            if row[0] == NC:
+                out[-1][2] = LV_N
+                row[0] = LV_S
+                falling_accent = False
+            else:
+                row[0], lenited = LENITED[row[0]]
+                falling_accent = not lenited
+
+            out.append(row)
+            continue
+
+        elif len(out) > 0:
+            out[-1][2], row[0] = BROKEN[row[0]]
+
+        row[0] = TO_LV[row[0]]
+        out.append(row)
+
+    return out, falling_accent
+
+
+def remove_h(rows: list[list]) -> list[list]:
+    for row in rows[1:]:
+        if row[0] == LV_H:
+            row[0] = 0
+
+    return rows
+
+
+def reduce_vowels(rows: list[list], context: MorphemeContext) -> list[list]:
+    if context is MorphemeContext.NONAUGMENTED:
+        for i in range(1, len(rows)):
+            if rows[i - 1][3]:
+                rows[i][1] = RAISED[rows[i][1]]
+
+    assert rows[-1][2] == 0
+    if not rows[-1][3] and context is not MorphemeContext.PREFIXED:
+        rows[-1][1] = RAISED[rows[-1][1]]
+
+    return rows
+
+
+def resolve_vowel_hiatus(rows: list[list]) -> list[list]:
+    out = []
+
+    i = 0
+    while i < len(rows):
+        if (i + 1 < len(rows)) and rows[i + 1][0] == 0:
+            first, second = rows[i], rows[i + 1]
+            assert first[2] == 0
+
+            if (i + 2 < len(rows)) and rows[i + 2][0] == 0:
+                assert second[2] == 0
+
+                if second[3]:
+                    second[3] = False
+                    first[3] = True
+
+                if FRONTNESS[second[1]] is not VowelFrontness.MID:
+                    rows[i + 2][0] = OFFGLIDE[second[1]]
+
+                del rows[i + 1]
+                continue
+
+            v1, v2, has_coda = first[1], second[1], second[2] != 0
+            stressed = first[3] or second[3]
+
+            if (first[3] or ((not LOW[v2]) and not second[3])) and not has_coda:
+                first[2] = OFFGLIDE[v2]
+                out.append(first)
+
+            elif FRONTNESS[v1] is VowelFrontness.MID and FRONTNESS[v2] is VowelFrontness.MID:
+                out.append([first[0], PK_MID_VOWELS[LOW[v1] or LOW[v2]], second[2], stressed])
+
+            elif FRONTNESS[v1] is FRONTNESS[v2] and not LOW[v2]:
+                out.append([first[0], v1, second[2], stressed])
+
+            elif v1 == PK_A:
+                out.append([first[0], LOWERED[v2], second[2], stressed])
+
+            else:
+                second[0] = OFFGLIDE[v2 if v1 == PK_AA else v1]
+                out.append(first)
+                out.append(second)
+
+            i += 2
+
+        else:
+            out.append(rows[i])
+            i += 1
+
+    return out
+
+
+def resolve_offglides(rows: list[list]) -> list[list]:
+    for row in rows:
+        if row[1] == PK_A and row[2] == LV_V:
+            row[1] = PK_O
+            row[2] = 0
+
+        elif row[1] == PK_A and row[2] == LV_Y:
+            row[1] = PK_E
+            row[2] = 0
+
+        elif row[2] == OFFGLIDE[row[1]]:
+            row[2] = 0
+
+    return rows
+
+
+def remove_short_vowels(rows: list[list]) -> list[list]:
+    out = []
+
+    i = len(rows) - 1
+    while i >= 0:
+        if i - 1 >= 0:
+            previous, row = rows[i - 1], rows[i]
+
+            if (row[1] == PK_A or row[1] == PK_U) and not row[3] and previous[2] == 0 and row[2] == 0:
+                out.append([previous[0], previous[1], row[0], previous[3]])
+                i -= 2
+                continue
+
+            elif row[0] == OFFGLIDE[row[1]] and not LOW[row[1]]:
+                if previous[2] == 0 and row[2] == 0:
+                    previous[2] = row[0]
+                    previous[3] = previous[3] or row[3]
+                    out.append(previous)
+                    i -= 2
+                    continue
+
+                elif previous[2] == 0 and FRONTNESS[previous[1]] is FRONTNESS[row[1]]:
+                    previous[2] = row[2]
+                    previous[3] = previous[3] or row[3]
+                    out.append(previous)
+                    i -= 2
+                    continue
+
+        out.append(rows[i])
+        i -= 1
+
+    out.reverse()
+    return out
+
+
+def convert_vowels(rows: list[list]) -> list[list]:
+    for row in rows:
+        if row[1] == PK_U:
+            row[1] = LV_VOWEL_O if row[3] or row[2] == LV_A else LV_VOWEL_A
+        elif row[1] == PK_A:
+            row[1] = LV_VOWEL_E if row[3] else LV_VOWEL_A
+        else:
+            row[1] = CONVERTED[row[1]]
+
+    return rows
+
+
+def evolve_syllables(pk_sf: PKSurfaceForm, context: MorphemeContext) \
+        -> Optional[tuple[list[LauvinkoSyllable], Optional[int], Optional[bool]]]:
+    """Like ProtoKasanicOrigin.evolve_syllables, or None for forms which only it can evolve"""
+    rows = encode(pk_sf, context)
+
+    if rows is None:
+        return None
+
+    if len(rows) > 0:
+        rows = break_diphthongs(rows)
+        rows, falling_accent = transform_consonants(rows, context)
+        rows = remove_h(rows)
+        rows = reduce_vowels(rows, context)
+        rows = resolve_vowel_hiatus(rows)
+        rows = resolve_offglides(rows)
+        rows = remove_short_vowels(rows)
+        rows = resolve_offglides(rows)
+        rows = convert_vowels(rows)
+    else:
+        falling_accent = None
+
+    lv_syllables, accent_position = decode(rows)
+    return lv_syllables, accent_position, falling_accent
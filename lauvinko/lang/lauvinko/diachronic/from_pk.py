@@ -1,12 +1,8 @@
-from typing import Optional, List, Iterable
+import os
+from typing import Optional, List, Iterable, Sequence
 from lauvinko.lang.proto_kasanic.morphology import ProtoKasanicLemma, ProtoKasanicMorpheme
 from lauvinko.lang.shared.semantics import PrimaryTenseAspect
-from lauvinko.lang.shared.phonology import (
-    MannerOfArticulation,
-    PlaceOfArticulation,
-    VowelFrontness,
-    GenericCVCSyllable,
-)
+from lauvinko.lang.shared.phonology import VowelFrontness, GenericCVCSyllable
 from lauvinko.lang.proto_kasanic.phonology import (
     ProtoKasanicOnset,
     PKSurfaceForm,
@@ -14,71 +10,16 @@ from lauvinko.lang.proto_kasanic.phonology import (
     ProtoKasanicVowel,
 )
 from lauvinko.lang.lauvinko.phonology import LauvinkoConsonant, LauvinkoVowel, LauvinkoSyllable, LauvinkoSurfaceForm
+from lauvinko.lang.shared.cache import LRUCache
+from . import encoded, vectorized
 from .base import LauvinkoLemmaOrigin, MorphemeContext, OriginLanguage
+from .correspondences import PK_TO_LV_ONSETS, DIPHTHONG_END, OFFGLIDES, break_pk_consonant
 
+# How forms are evolved: "encoded" by the passes in encoded, "reference" by the stages of ProtoKasanicOrigin,
+# or "differential" by both, raising ProtoKasanicOrigin.EngineMismatch if they disagree
+SOUND_CHANGE_ENGINE = os.getenv("SOUND_CHANGE_ENGINE", "encoded")
 
-def pk_to_lv_onset(pk_onset: ProtoKasanicOnset):
-    """Converts 24 of the 25 Proto-Kasanic onsets to the Lauvinko consonant they would become word-initially.
-    Cannot handle the PK prenasalized palatal stop because this becomes the sequence /ant͡s/ word-initially in Lauvinko.
-    """
-    if pk_onset is ProtoKasanicOnset.NC:
-        raise ValueError("Deal with NC another way")
-
-    if pk_onset.moa in {MannerOfArticulation.PREGLOTTALIZED_STOP, MannerOfArticulation.PLAIN_STOP}:
-        if pk_onset.poa is PlaceOfArticulation.PALATAL:
-            moa = MannerOfArticulation.AFFRICATE
-        else:
-            moa = MannerOfArticulation.PLAIN_STOP
-    elif pk_onset.moa is MannerOfArticulation.PRENASALIZED_STOP:
-        moa = MannerOfArticulation.NASAL
-    else:
-        moa = pk_onset.moa
-
-    if pk_onset.poa is PlaceOfArticulation.PALATAL and pk_onset.moa is not MannerOfArticulation.APPROXIMANT:
-        poa = PlaceOfArticulation.ALVEOLAR
-    elif pk_onset.poa is PlaceOfArticulation.LABIOVELAR:
-        poa = PlaceOfArticulation.LABIAL
-    else:
-        poa = pk_onset.poa
-
-    return LauvinkoConsonant.find_by(poa=poa, moa=moa)
-
-
-PK_TO_LV_ONSETS = {
-    c: pk_to_lv_onset(c)
-    for c in ProtoKasanicOnset
-    if c is not ProtoKasanicOnset.NC
-}
-
-DIPHTHONG_END = {
-    ProtoKasanicVowel.AI: ProtoKasanicVowel.I,
-    ProtoKasanicVowel.AU: ProtoKasanicVowel.U,
-}
-
-OFFGLIDES = {
-    VowelFrontness.FRONT: LauvinkoConsonant.Y,
-    VowelFrontness.MID: LauvinkoConsonant.A,
-    VowelFrontness.BACK: LauvinkoConsonant.V,
-}
-
-
-def break_pk_consonant(c: ProtoKasanicOnset) -> tuple[Optional[LauvinkoConsonant], Optional[ProtoKasanicOnset]]:
-    if c is None:
-        return None, None
-
-    elif c.moa is MannerOfArticulation.PRENASALIZED_STOP:
-        return LauvinkoConsonant.N, ProtoKasanicOnset.find_by(poa=c.poa, moa=MannerOfArticulation.PLAIN_STOP)
-
-    elif c.moa is MannerOfArticulation.PREGLOTTALIZED_STOP:
-        c2 = ProtoKasanicOnset.find_by(poa=c.poa, moa=MannerOfArticulation.PLAIN_STOP)
-
-        if c is ProtoKasanicOnset.CC:
-            return LauvinkoConsonant.T, c2
-        else:
-            return PK_TO_LV_ONSETS[c], c2
-
-    else:
-        return None, c
+EVOLUTION_CACHE = LRUCache(maxsize=16384)
 
 
 class ProtoKasanicOrigin(LauvinkoLemmaOrigin):
@@ -89,6 +30,9 @@ class ProtoKasanicOrigin(LauvinkoLemmaOrigin):
     def __init__(self, derived_from: ProtoKasanicLemma):
         self.derived_from = derived_from
 
+    class EngineMismatch(RuntimeError):
+        pass
+
     def generate_form(self, primary_ta: PrimaryTenseAspect, context: MorphemeContext) \
             -> tuple[LauvinkoSurfaceForm, ProtoKasanicMorpheme]:
         pk_stem = self.derived_from.form(primary_ta)
@@ -104,24 +48,83 @@ class ProtoKasanicOrigin(LauvinkoLemmaOrigin):
 
         return OriginLanguage.KASANIC, None
 
+    @staticmethod
+    def evolution_key(pk_sf: PKSurfaceForm, context: MorphemeContext) -> tuple:
+        return pk_sf, context
+
     @classmethod
     def evolve_surface_form(cls, pk_sf: PKSurfaceForm, context: MorphemeContext) -> LauvinkoSurfaceForm:
-        syllables: Iterable[GenericCVCSyllable] = cls.genericize(pk_sf, context)
+        """The same stems recur across lemmas, closed-class prefixes and forms given as_from, so each evolution is
+        only computed once per process. The result is shared between callers and must not be modified.
+        """
+        return EVOLUTION_CACHE.get_or_compute(
+            cls.evolution_key(pk_sf, context),
+            lambda: cls._evolve_surface_form(pk_sf, context),
+        )
 
-        if len(list(syllables)) > 0:
-            syllables = cls.break_diphthongs(syllables)
-            syllables, falling_accent = cls.transform_consonants(syllables, context)
-            syllables = cls.remove_h(syllables)
-            syllables = cls.reduce_vowels(syllables, context)
-            syllables = cls.resolve_vowel_hiatus(syllables)
-            syllables = cls.resolve_offglides(syllables)
-            syllables = cls.remove_short_vowels(syllables)
-            syllables = cls.resolve_offglides(syllables)
-            syllables = cls.convert_vowels(syllables)
-        else:
-            falling_accent = None
+    @classmethod
+    def evolve_surface_forms(cls, jobs: Sequence[tuple[PKSurfaceForm, MorphemeContext]]) -> List[LauvinkoSurfaceForm]:
+        """evolve_surface_form for each of jobs, such as every form of a dictionary or a batch of generated lemmas.
+        A form which appears more than once, or is already in the evolution cache, is evolved once and shared.
+        The rest are evolved together by vectorized and put in the cache, and forms which only the reference
+        implementation handles, or which raise, are evolved one at a time.
+        """
+        if SOUND_CHANGE_ENGINE == "reference":
+            return [cls.evolve_surface_form(pk_sf, context) for pk_sf, context in jobs]
 
-        lv_syllables, accent_position = cls.degenericize(syllables)
+        evolved: dict[tuple, Optional[LauvinkoSurfaceForm]] = {}
+        uncached = []
+
+        for pk_sf, context in jobs:
+            key = cls.evolution_key(pk_sf, context)
+
+            if key not in evolved:
+                evolved[key] = EVOLUTION_CACHE.get(key)
+
+                if evolved[key] is None:
+                    uncached.append((pk_sf, context))
+
+        for (pk_sf, context), syllables in zip(uncached, vectorized.evolve(uncached).decoded()):
+            key = cls.evolution_key(pk_sf, context)
+
+            if syllables is None:
+                evolved[key] = cls.evolve_surface_form(pk_sf, context)
+                continue
+
+            lv_sf = cls.surface_form(pk_sf, context, syllables)
+
+            if SOUND_CHANGE_ENGINE == "differential":
+                expected = cls._evolve_surface_form(pk_sf, context)
+
+                if lv_sf != expected:
+                    raise cls.EngineMismatch(f"{pk_sf.broad_transcription()} ({context}): {lv_sf} != {expected}")
+
+            EVOLUTION_CACHE.put(key, lv_sf)
+            evolved[key] = lv_sf
+
+        return [evolved[cls.evolution_key(pk_sf, context)] for pk_sf, context in jobs]
+
+    @classmethod
+    def _evolve_surface_form(cls, pk_sf: PKSurfaceForm, context: MorphemeContext) -> LauvinkoSurfaceForm:
+        evolved = None
+
+        if SOUND_CHANGE_ENGINE != "reference":
+            evolved = encoded.evolve_syllables(pk_sf, context)
+
+        if evolved is None or SOUND_CHANGE_ENGINE == "differential":
+            expected = cls.evolve_syllables(pk_sf, context)
+
+            if evolved is not None and evolved != expected:
+                raise cls.EngineMismatch(f"{pk_sf.broad_transcription()} ({context}): {evolved} != {expected}")
+
+            evolved = expected
+
+        return cls.surface_form(pk_sf, context, evolved)
+
+    @staticmethod
+    def surface_form(pk_sf: PKSurfaceForm, context: MorphemeContext,
+                     evolved: tuple[List[LauvinkoSyllable], Optional[int], Optional[bool]]) -> LauvinkoSurfaceForm:
+        lv_syllables, accent_position, falling_accent = evolved
 
         lv_sf = LauvinkoSurfaceForm(
             syllables=lv_syllables,
@@ -137,6 +140,28 @@ class ProtoKasanicOrigin(LauvinkoLemmaOrigin):
 
         return lv_sf
 
+    @classmethod
+    def evolve_syllables(cls, pk_sf: PKSurfaceForm, context: MorphemeContext) \
+            -> tuple[List[LauvinkoSyllable], Optional[int], Optional[bool]]:
+        """The reference implementation of the sound changes, which encoded.evolve_syllables must agree with"""
+        syllables: Iterable[GenericCVCSyllable] = cls.genericize(pk_sf, context)
+
+        if len(list(syllables)) > 0:
+            syllables = cls.break_diphthongs(syllables)
+            syllables, falling_accent = cls.transform_consonants(syllables, context)
+            syllables = cls.remove_h(syllables)
+            syllables = cls.reduce_vowels(syllables, context)
+            syllables = cls.resolve_vowel_hiatus(syllables)
+            syllables = cls.resolve_offglides(syllables)
+            syllables = cls.remove_short_vowels(syllables)
+            syllables = cls.resolve_offglides(syllables)
+            syllables = cls.convert_vowels(syllables)
+        else:
+            falling_accent = None
+
+        lv_syllables, accent_position = cls.degenericize(syllables)
+        return lv_syllables, accent_position, falling_accent
+
     @staticmethod
     def genericize(pk_sf: PKSurfaceForm, context: MorphemeContext) -> List[GenericCVCSyllable]:
         return [
@@ -366,7 +391,7 @@ class ProtoKasanicOrigin(LauvinkoLemmaOrigin):
         lv_syllables, accent_position = [], None
 
         for i, syllable in enumerate(syllables):
-            lv_syllables.append(LauvinkoSyllable(
+            lv_syllables.append(LauvinkoSyllable.of(
                 onset=syllable.onset,
                 vowel=syllable.vowel,
                 coda=syllable.coda,
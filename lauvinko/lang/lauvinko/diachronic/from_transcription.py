@@ -7,8 +7,13 @@ from lauvinko.lang.proto_kasanic.phonology import (
     ProtoKasanicVowel,
 )
 from lauvinko.lang.proto_kasanic.morphology import MUTATION_NOTATION, ProtoKasanicMorpheme
-from lauvinko.lang.lauvinko.phonology import LauvinkoConsonant, LauvinkoVowel, LauvinkoSyllable, LauvinkoSurfaceForm
-from .from_pk import PK_TO_LV_ONSETS
+from lauvinko.lang.lauvinko.phonology import (
+    LauvinkoConsonant,
+    LauvinkoVowel,
+    LauvinkoSyllableBuilder,
+    LauvinkoSurfaceForm,
+)
+from .correspondences import PK_TO_LV_ONSETS
 
 
 INFORMAL_PK_ONSETS = {
@@ -71,7 +76,7 @@ class TranscriptionReader:
         self.original_initial_consonant: Optional[ProtoKasanicOnset] = None
         self.end_mutation = None
         self.i = 0
-        self.syllables: list[LauvinkoSyllable] = []
+        self.syllables: list[LauvinkoSyllableBuilder] = []
         self.accent_position: Optional[int] = None
         self.falling_accent: Optional[bool] = None
         self.last_seen_consonant: Optional[LauvinkoConsonant] = None
@@ -97,34 +102,33 @@ class TranscriptionReader:
 
             if syllable.vowel is LauvinkoVowel.A:
                 if syllable.coda is LauvinkoConsonant.Y:
-                    virtual_syllables.append(ProtoKasanicSyllable(onset, ProtoKasanicVowel.AI))
+                    virtual_syllables.append(ProtoKasanicSyllable.of(onset, ProtoKasanicVowel.AI))
                     continue
 
                 if syllable.coda is LauvinkoConsonant.V:
-                    virtual_syllables.append(ProtoKasanicSyllable(onset, ProtoKasanicVowel.AU))
+                    virtual_syllables.append(ProtoKasanicSyllable.of(onset, ProtoKasanicVowel.AU))
                     continue
 
-            syll = ProtoKasanicSyllable(
-                onset=None,
+            # Circumventing PK prohibition on yi
+            syll = ProtoKasanicSyllable.unvalidated(
+                onset=onset,
                 vowel=ProtoKasanicVowel.find_by(
                     frontness=syllable.vowel.frontness,
                     low=syllable.vowel.low,
                 )
             )
-            # Circumventing PK prohibition on yi
-            syll.onset = onset
             virtual_syllables.append(syll)
 
             if syllable.coda is LauvinkoConsonant.A:
                 virtual_syllables.append(
-                    ProtoKasanicSyllable(
+                    ProtoKasanicSyllable.of(
                         onset=None,
                         vowel=ProtoKasanicVowel.A,
                     )
                 )
             elif syllable.coda is not None:
                 virtual_syllables.append(
-                    ProtoKasanicSyllable(
+                    ProtoKasanicSyllable.of(
                         onset=LV_TO_PK_ONSETS[syllable.coda],
                         vowel=ProtoKasanicVowel.A,
                     )
@@ -133,7 +137,7 @@ class TranscriptionReader:
         last_syll = self.syllables[-1]
         if last_syll.coda is None and last_syll.vowel is not LauvinkoVowel.I:
             virtual_syllables.append(
-                ProtoKasanicSyllable(
+                ProtoKasanicSyllable.of(
                     onset=ProtoKasanicOnset.H,
                     vowel=ProtoKasanicVowel.find_by(
                         frontness=last_syll.vowel.frontness,
@@ -175,7 +179,7 @@ class TranscriptionReader:
             self.original_initial_consonant = INFORMAL_PK_ONSETS[self.next(2)]
 
             if self.original_initial_consonant is ProtoKasanicOnset.NC:
-                self.syllables.append(LauvinkoSyllable(
+                self.syllables.append(LauvinkoSyllableBuilder(
                     onset=None,
                     vowel=LauvinkoVowel.A,
                     coda=LauvinkoConsonant.N,
@@ -203,7 +207,7 @@ class TranscriptionReader:
 
     def push_vowel(self, v_str: str):
         vowel = INFORMAL_LV_VOWELS[v_str]
-        self.syllables.append(LauvinkoSyllable(onset=self.last_seen_consonant, vowel=vowel, coda=None))
+        self.syllables.append(LauvinkoSyllableBuilder(onset=self.last_seen_consonant, vowel=vowel, coda=None))
         self.last_seen_consonant = None
         self.state = TranscriptionReaderState.POST_VOWEL
         self.i += len(v_str)
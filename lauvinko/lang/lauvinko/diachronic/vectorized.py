@@ -0,0 +1,410 @@
+"""The passes of encoded, run over a whole batch of forms at once with NumPy. A batch is stored as arrays of
+onsets, vowels, codas and stresses with a row for each form and a column for each syllable, padded after the
+end of shorter forms, and each pass is a handful of array operations over every form. The passes which walk
+along a form and merge or delete syllables as they go keep a cursor for each form, and step every cursor
+together. Forms the encoded passes would raise on are marked as not evolved, rather than raising for the
+whole batch, so that the caller can evolve them one at a time and get the same error.
+"""
+from dataclasses import dataclass
+from typing import Optional, Sequence
+import numpy as np
+from lauvinko.lang.shared.phonology import VowelFrontness
+from lauvinko.lang.proto_kasanic.phonology import PKSurfaceForm
+from lauvinko.lang.lauvinko.phonology import LauvinkoSyllable
+from .base import MorphemeContext
+from . import encoded
+from .encoded import NC, LV_H, LV_N, LV_S, LV_A, LV_V, LV_Y, PK_A, PK_AA, PK_U, PK_O, PK_E
+
+LV_VOWEL_A, LV_VOWEL_E, LV_VOWEL_O = encoded.LV_VOWEL_A, encoded.LV_VOWEL_E, encoded.LV_VOWEL_O
+
+
+def table(values) -> np.ndarray:
+    """One of the tables of encoded as an array, with -1 where it has None"""
+    return np.array([-1 if v is None else v for v in values], dtype=np.int64)
+
+
+FRONTNESS = np.array([list(VowelFrontness).index(f) for f in encoded.FRONTNESS], dtype=np.int64)
+MID = list(VowelFrontness).index(VowelFrontness.MID)
+LOW = np.array(encoded.LOW, dtype=bool)
+OFFGLIDE = table(encoded.OFFGLIDE)
+RAISED = table(encoded.RAISED)
+LOWERED = table(encoded.LOWERED)
+DIPHTHONG = table(encoded.DIPHTHONG)
+CONVERTED = table(encoded.CONVERTED)
+PK_MID_VOWELS = np.array([encoded.PK_MID_VOWELS[False], encoded.PK_MID_VOWELS[True]], dtype=np.int64)
+TO_LV = table(encoded.TO_LV)
+BROKEN_CODA = table(coda for coda, _ in encoded.BROKEN)
+BROKEN_ONSET = table(onset for _, onset in encoded.BROKEN)
+LENITED_ONSET = table(onset for onset, _ in encoded.LENITED)
+LENITED_CHANGED = np.array([changed for _, changed in encoded.LENITED], dtype=bool)
+
+CONTEXTS = list(MorphemeContext)
+AUGMENTED, NONAUGMENTED, PREFIXED = map(CONTEXTS.index, (
+    MorphemeContext.AUGMENTED,
+    MorphemeContext.NONAUGMENTED,
+    MorphemeContext.PREFIXED,
+))
+
+
+@dataclass
+class Batch:
+    """Forms being evolved. Row f of each array is form f, which has lengths[f] syllables."""
+    onsets: np.ndarray
+    vowels: np.ndarray
+    codas: np.ndarray
+    stressed: np.ndarray
+    lengths: np.ndarray
+
+    @classmethod
+    def empty(cls, forms: int, width: int) -> "Batch":
+        return cls(
+            onsets=np.zeros((forms, width), dtype=np.int64),
+            vowels=np.zeros((forms, width), dtype=np.int64),
+            codas=np.zeros((forms, width), dtype=np.int64),
+            stressed=np.zeros((forms, width), dtype=bool),
+            lengths=np.zeros(forms, dtype=np.int64),
+        )
+
+    @property
+    def width(self) -> int:
+        return self.onsets.shape[1]
+
+    def filled(self) -> np.ndarray:
+        """Which cells hold a syllable, rather than padding"""
+        return np.arange(self.width) < self.lengths[:, None]
+
+    def put(self, forms: np.ndarray, columns: np.ndarray, onsets, vowels, codas, stressed):
+        self.onsets[forms, columns] = onsets
+        self.vowels[forms, columns] = vowels
+        self.codas[forms, columns] = codas
+        self.stressed[forms, columns] = stressed
+
+    def get(self, forms: np.ndarray, columns: np.ndarray) -> tuple:
+        columns = np.minimum(columns, self.width - 1)
+        return (
+            self.onsets[forms, columns],
+            self.vowels[forms, columns],
+            self.codas[forms, columns],
+            self.stressed[forms, columns],
+        )
+
+
+@dataclass
+class EvolvedBatch:
+    """The Lauvinko syllables of every form of a batch, as indices into encoded.CONSONANTS and encoded.VOWELS,
+    the position of each form's accent, or -1 if it has none, and whether its accent falls, as 1 or 0, or -1.
+    Forms which weren't evolved have False in evolved.
+    """
+    onsets: np.ndarray
+    vowels: np.ndarray
+    codas: np.ndarray
+    lengths: np.ndarray
+    accent_positions: np.ndarray
+    falling_accents: np.ndarray
+    evolved: np.ndarray
+
+    def decoded(self) -> list[Optional[tuple[list[LauvinkoSyllable], Optional[int], Optional[bool]]]]:
+        """What encoded.evolve_syllables returns for each form, or None for forms which weren't evolved,
+        or which would raise LauvinkoSyllable.InvalidSyllable
+        """
+        out = []
+        rows = zip(
+            self.onsets.tolist(),
+            self.vowels.tolist(),
+            self.codas.tolist(),
+            self.lengths.tolist(),
+            self.accent_positions.tolist(),
+            self.falling_accents.tolist(),
+            self.evolved.tolist(),
+        )
+
+        for onsets, vowels, codas, length, accent_position, falling_accent, evolved in rows:
+            if not evolved:
+                out.append(None)
+                continue
+
+            try:
+                lv_syllables, _ = encoded.decode(zip(onsets[:length], vowels[:length], codas[:length], [False] * length))
+            except LauvinkoSyllable.InvalidSyllable:
+                out.append(None)
+                continue
+
+            out.append((
+                lv_syllables,
+                None if accent_position < 0 else accent_position,
+                None if falling_accent < 0 else bool(falling_accent),
+            ))
+
+        return out
+
+
+def encode(jobs: Sequence[tuple[PKSurfaceForm, MorphemeContext]]) -> tuple[Batch, np.ndarray, np.ndarray]:
+    """The batch of jobs, the context of each form, and which forms can be evolved, like encoded.encode"""
+    forms, columns, onsets, vowels, stressed = [], [], [], [], []
+    lengths, contexts, evolvable = [], [], []
+
+    for f, (pk_sf, context) in enumerate(jobs):
+        stress_position = None if context is MorphemeContext.PREFIXED else pk_sf.stress_position
+        syllables = pk_sf.syllables
+        form_vowels = [encoded.VOWEL_IDS[syllable.vowel] for syllable in syllables]
+
+        lengths.append(len(syllables))
+        contexts.append(CONTEXTS.index(context))
+        evolvable.append(not any(vowel in encoded.UNDERSPECIFIED for vowel in form_vowels))
+
+        forms += [f] * len(syllables)
+        columns += range(len(syllables))
+        onsets += [encoded.CONSONANT_IDS[syllable.onset] for syllable in syllables]
+        vowels += form_vowels
+        stressed += [i == stress_position for i in range(len(syllables))]
+
+    batch = Batch.empty(len(jobs), max(lengths, default=0))
+    batch.lengths[:] = lengths
+    batch.put(np.array(forms, dtype=np.int64), np.array(columns, dtype=np.int64), onsets, vowels, 0, stressed)
+    return batch, np.array(contexts, dtype=np.int64), np.array(evolvable, dtype=bool)
+
+
+def break_diphthongs(batch: Batch) -> Batch:
+    filled = batch.filled()
+    diphthong = (DIPHTHONG[batch.vowels] >= 0) & filled
+
+    # Each syllable moves right by one for every diphthong before it
+    columns = np.arange(batch.width) + np.cumsum(diphthong, axis=1) - diphthong
+    lengths = batch.lengths + diphthong.sum(axis=1)
+    out = Batch.empty(len(lengths), max(lengths.max(initial=0), 1))
+    out.lengths[:] = lengths
+
+    f, i = np.nonzero(filled)
+    d = diphthong[f, i]
+    out.put(f, columns[f, i], batch.onsets[f, i], np.where(d, PK_AA, batch.vowels[f, i]), 0, batch.stressed[f, i] & ~d)
+
+    f, i = f[d], i[d]
+    out.put(f, columns[f, i] + 1, 0, DIPHTHONG[batch.vowels[f, i]], 0, batch.stressed[f, i])
+    return out
+
+
+def transform_consonants(batch: Batch, contexts: np.ndarray) -> tuple[Batch, np.ndarray]:
+    """The batch and each form's falling accent, as 1, 0, or -1 where it has none"""
+    prepended = (batch.onsets[:, 0] == NC) & (batch.lengths > 0)
+    out = Batch.empty(len(batch.lengths), batch.width + 1)
+    out.lengths[:] = batch.lengths + prepended
+
+    f, i = np.nonzero(batch.filled())
+    out.put(f, i + prepended[f], batch.onsets[f, i], batch.vowels[f, i], batch.codas[f, i], batch.stressed[f, i])
+    out.vowels[prepended, 0] = PK_AA
+
+    reduces = contexts == NONAUGMENTED
+    falling_accent = np.full(len(batch.lengths), -1, dtype=np.int64)
+
+    for i in range(out.width):
+        present = i < out.lengths
+        onset = out.onsets[:, i].copy()
+
+        if i == 0:
+            out.onsets[:, 0] = np.where(present, TO_LV[onset], onset)
+            reduced = np.zeros_like(present)
+        else:
+            reduced = present & reduces & out.stressed[:, i - 1]
+            broken = present & ~reduced
+
+            out.codas[:, i - 1] = np.where(reduced & (onset == NC), LV_N, out.codas[:, i - 1])
+            out.codas[:, i - 1] = np.where(broken, BROKEN_CODA[onset], out.codas[:, i - 1])
+            out.onsets[:, i] = np.where(
+                reduced,
+                np.where(onset == NC, LV_S, LENITED_ONSET[onset]),
+                np.where(broken, TO_LV[BROKEN_ONSET[onset]], onset),
+            )
+
+        falling_accent = np.where(present & out.stressed[:, i], contexts != AUGMENTED, falling_accent)
+        falling_accent = np.where(reduced, (onset != NC) & ~LENITED_CHANGED[onset], falling_accent)
+
+    return out, falling_accent
+
+
+def remove_h(batch: Batch) -> Batch:
+    batch.onsets[:, 1:][batch.onsets[:, 1:] == LV_H] = 0
+    return batch
+
+
+def reduce_vowels(batch: Batch, contexts: np.ndarray, evolvable: np.ndarray) -> Batch:
+    raised = np.zeros_like(batch.stressed)
+    raised[:, 1:] = batch.stressed[:, :-1] & (contexts == NONAUGMENTED)[:, None]
+    raised &= batch.filled()
+    batch.vowels = np.where(raised, RAISED[batch.vowels], batch.vowels)
+
+    f = np.nonzero(batch.lengths > 0)[0]
+    last = batch.lengths[f] - 1
+    evolvable[f[batch.codas[f, last] != 0]] = False
+
+    raised = ~batch.stressed[f, last] & (contexts[f] != PREFIXED)
+    f, last = f[raised], last[raised]
+    batch.vowels[f, last] = RAISED[batch.vowels[f, last]]
+    return batch
+
+
+def resolve_vowel_hiatus(batch: Batch, evolvable: np.ndarray) -> Batch:
+    out = Batch.empty(len(batch.lengths), batch.width)
+    # Where each form is, the syllable after it, since the one in between may have been deleted, and how many
+    # syllables it has in out
+    cursors = np.zeros_like(batch.lengths)
+    following = np.ones_like(batch.lengths)
+
+    while True:
+        f = np.nonzero(cursors < batch.lengths)[0]
+
+        if len(f) == 0:
+            break
+
+        i, j = cursors[f], following[f]
+        o1, v1, c1, s1 = batch.get(f, i)
+        o2, v2, c2, s2 = batch.get(f, j)
+        o3, *_ = batch.get(f, j + 1)
+
+        hiatus = (j < batch.lengths[f]) & (o2 == 0)
+        triple = hiatus & (j + 1 < batch.lengths[f]) & (o3 == 0)
+        evolvable[f[hiatus & (c1 != 0)]] = False
+        evolvable[f[triple & (c2 != 0)]] = False
+
+        # Three vowels in a row: the middle one is deleted, passing on its stress and becoming an offglide
+        t = np.nonzero(triple)[0]
+        batch.stressed[f[t], i[t]] |= s2[t]
+        offglided = t[FRONTNESS[v2[t]] != MID]
+        batch.onsets[f[offglided], j[offglided] + 1] = OFFGLIDE[v2[offglided]]
+        following[f[t]] += 1
+
+        # No vowel hiatus
+        s = np.nonzero(~hiatus)[0]
+        out.put(f[s], out.lengths[f[s]], o1[s], v1[s], c1[s], s1[s])
+        out.lengths[f[s]] += 1
+        cursors[f[s]] = j[s]
+        following[f[s]] = j[s] + 1
+
+        # Two vowels in a row
+        p = np.nonzero(hiatus & ~triple)[0]
+        o1, v1, c1, s1, v2, c2, s2 = o1[p], v1[p], c1[p], s1[p], v2[p], c2[p], s2[p]
+        stressed = s1 | s2
+
+        coda_glide = (s1 | (~LOW[v2] & ~s2)) & (c2 == 0)
+        mid = ~coda_glide & (FRONTNESS[v1] == MID) & (FRONTNESS[v2] == MID)
+        same_frontness = ~coda_glide & ~mid & (FRONTNESS[v1] == FRONTNESS[v2]) & ~LOW[v2]
+        lowered = ~coda_glide & ~mid & ~same_frontness & (v1 == PK_A)
+        merged = coda_glide | mid | same_frontness | lowered
+
+        out.put(
+            f[p],
+            out.lengths[f[p]],
+            o1,
+            np.select([mid, lowered], [PK_MID_VOWELS[(LOW[v1] | LOW[v2]).astype(np.int64)], LOWERED[v2]], v1),
+            np.select([coda_glide, merged], [OFFGLIDE[v2], c2], c1),
+            np.where(coda_glide | ~merged, s1, stressed),
+        )
+
+        split = np.nonzero(~merged)[0]
+        out.put(
+            f[p[split]],
+            out.lengths[f[p[split]]] + 1,
+            OFFGLIDE[np.where(v1[split] == PK_AA, v2[split], v1[split])],
+            v2[split],
+            c2[split],
+            s2[split],
+        )
+
+        out.lengths[f[p]] += 1 + ~merged
+        cursors[f[p]] = j[p] + 1
+        following[f[p]] = j[p] + 2
+
+    return out
+
+
+def resolve_offglides(batch: Batch) -> Batch:
+    a = batch.vowels == PK_A
+    rounded = a & (batch.codas == LV_V)
+    fronted = a & (batch.codas == LV_Y)
+
+    batch.vowels = np.select([rounded, fronted], [PK_O, PK_E], batch.vowels)
+    batch.codas[rounded | fronted | (batch.codas == OFFGLIDE[batch.vowels])] = 0
+    return batch
+
+
+def remove_short_vowels(batch: Batch) -> Batch:
+    # Forms are walked from the end, so each one is built backwards and reversed at the end
+    backwards = Batch.empty(len(batch.lengths), batch.width)
+    cursors = batch.lengths - 1
+
+    while True:
+        f = np.nonzero(cursors >= 0)[0]
+
+        if len(f) == 0:
+            break
+
+        i = cursors[f]
+        o0, v0, c0, s0 = batch.get(f, np.maximum(i - 1, 0))
+        o, v, c, s = batch.get(f, i)
+
+        short = (i >= 1) & ((v == PK_A) | (v == PK_U)) & ~s & (c0 == 0) & (c == 0)
+        offglide = (i >= 1) & ~short & (o == OFFGLIDE[v]) & ~LOW[v] & (c0 == 0)
+        coda_offglide = offglide & (c == 0)
+        same_frontness = offglide & ~coda_offglide & (FRONTNESS[v0] == FRONTNESS[v])
+        merged = short | coda_offglide | same_frontness
+
+        backwards.put(
+            f,
+            backwards.lengths[f],
+            np.where(merged, o0, o),
+            np.where(merged, v0, v),
+            np.select([short | coda_offglide, same_frontness], [o, c], c),
+            np.select([short, merged], [s0, s0 | s], s),
+        )
+
+        backwards.lengths[f] += 1
+        cursors[f] -= 1 + merged
+
+    f, i = np.nonzero(backwards.filled())
+    out = Batch.empty(len(batch.lengths), batch.width)
+    out.lengths[:] = backwards.lengths
+    out.put(f, backwards.lengths[f] - 1 - i, *backwards.get(f, i))
+    return out
+
+
+def convert_vowels(batch: Batch) -> Batch:
+    batch.vowels = np.select(
+        [batch.vowels == PK_U, batch.vowels == PK_A],
+        [
+            np.where(batch.stressed | (batch.codas == LV_A), LV_VOWEL_O, LV_VOWEL_A),
+            np.where(batch.stressed, LV_VOWEL_E, LV_VOWEL_A),
+        ],
+        CONVERTED[batch.vowels],
+    )
+    return batch
+
+
+def evolve(jobs: Sequence[tuple[PKSurfaceForm, MorphemeContext]]) -> EvolvedBatch:
+    """Like encoded.evolve_syllables for each of jobs"""
+    batch, contexts, evolvable = encode(jobs)
+
+    batch = break_diphthongs(batch)
+    batch, falling_accents = transform_consonants(batch, contexts)
+    batch = remove_h(batch)
+    batch = reduce_vowels(batch, contexts, evolvable)
+    batch = resolve_vowel_hiatus(batch, evolvable)
+    batch = resolve_offglides(batch)
+    batch = remove_short_vowels(batch)
+    batch = resolve_offglides(batch)
+    batch = convert_vowels(batch)
+
+    stressed = batch.stressed & batch.filled()
+    accent_positions = np.where(
+        stressed.any(axis=1),
+        batch.width - 1 - np.argmax(stressed[:, ::-1], axis=1),
+        -1,
+    )
+
+    return EvolvedBatch(
+        onsets=batch.onsets,
+        vowels=batch.vowels,
+        codas=batch.codas,
+        lengths=batch.lengths,
+        accent_positions=accent_positions,
+        falling_accents=falling_accents,
+        evolved=evolvable,
+    )
@@ -1,21 +1,30 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Union
 import re
 from ..proto_kasanic.romanize import falavay
 from ..shared.phonology import VowelFrontness
 from ..shared.semantics import PrimaryTenseAspect, KasanicStemCategory, PTA2ABBREV
 from ..shared.morphology import Morpheme, Lemma, Word, MorphosyntacticType, bucket_kasanic_prefixes
-from ..proto_kasanic.phonology import ProtoKasanicVowel, PKSurfaceForm, ProtoKasanicSyllable, ProtoKasanicOnset
+from ..shared.cache import LRUCache
+from ..proto_kasanic.phonology import (
+    ProtoKasanicVowel,
+    PKSurfaceForm,
+    ProtoKasanicSyllable,
+    ProtoKasanicOnset,
+    ProtoKasanicMutation,
+)
 from .phonology import (
     LauvinkoSyllable,
+    LauvinkoSyllableBuilder,
     LauvinkoSurfaceForm,
     LauvinkoVowel,
     LauvinkoConsonant,
 )
 from ..proto_kasanic.morphology import ProtoKasanicLemma, ProtoKasanicMorpheme
 from .diachronic.base import LauvinkoLemmaOrigin, MorphemeContext
-from .diachronic.from_pk import ProtoKasanicOrigin, break_pk_consonant, PK_TO_LV_ONSETS, OFFGLIDES
+from .diachronic.from_pk import ProtoKasanicOrigin
+from .diachronic.correspondences import break_pk_consonant, PK_TO_LV_ONSETS, OFFGLIDES
 from .diachronic.from_transcription import TranscriptionReader
 from .romanize import romanize
 
@@ -37,6 +46,10 @@ def epenthetic_consonant(f: VowelFrontness) -> Optional[LauvinkoConsonant]:
     else:
         return None
 
+JOIN_CACHE = LRUCache(maxsize=16384)
+PREFIX_JOIN_CACHE = LRUCache(maxsize=4096)
+
+
 @dataclass
 class LauvinkoMorpheme(Morpheme):
     """One of the complexities of LauvinkoMorpheme is that LauvinkoMorpheme.join needs to maintain equivalence with
@@ -87,198 +100,279 @@ class LauvinkoMorpheme(Morpheme):
             "context": MorphemeContext.NONAUGMENTED,
         }
 
+    def join_key(self) -> tuple:
+        """Everything about the morpheme which LauvinkoMorpheme.join looks at"""
+        return self.surface_form, self.virtual_original_form.surface_form, self.end_mutation(), self.context
+
     @staticmethod
     def join(morphemes: List["LauvinkoMorpheme"], accented: Optional[int]) -> "LauvinkoMorpheme":
-        syllables: List[LauvinkoSyllable] = []
-        pk_syllables: List[ProtoKasanicSyllable] = []
-        accent_position = None
-        falling_accent = None
-        pk_stress_position = None
-        active_mutation = None
-
-        for i, morpheme in enumerate(morphemes):
-            ms = [
-                LauvinkoSyllable(
-                    onset=s.onset,
-                    vowel=s.vowel,
-                    coda=s.coda,
-                )
-                for s in morpheme.surface_form.syllables
-            ]
-
-            morpheme_pk_syllables = [
-                ProtoKasanicSyllable(
-                    onset=s.onset,
-                    vowel=s.vowel,
-                )
-                for s in morpheme.virtual_original_form.surface_form.syllables
-            ]
-
-            pk_consonant = morpheme.original_initial_consonant()
-
-            if active_mutation is not None and len(ms) > 0:
-                pk_consonant = active_mutation.mutate(pk_consonant)
-                morpheme_pk_syllables[0].onset = pk_consonant
-
-            if len(ms) == 0:
-                pass
-            elif len(syllables) > 0:
-                if pk_consonant is not None and pk_consonant is not ProtoKasanicOnset.NC:
-                    c1, c2 = break_pk_consonant(pk_consonant)
-
-                    if c1 is not None:
-                        if syllables[-1].coda is None:
-                            syllables[-1].coda = c1
-                        elif syllables[-1].coda is LauvinkoConsonant.A:
-                            epenthetic_syllable = LauvinkoSyllable(
-                                onset=epenthetic_consonant(syllables[-1].vowel.frontness),
-                                vowel=LauvinkoVowel.A,
-                                coda=c1,
-                            )
-
-                            syllables[-1].coda = None
-                            syllables.append(epenthetic_syllable)
-                        else:
-                            epenthetic_syllable = LauvinkoSyllable(
-                                onset=syllables[-1].coda,
-                                vowel=epenthetic_vowel(syllables[-1].coda),
-                                coda=c1,
-                            )
-
-                            syllables[-1].coda = None
-                            syllables.append(epenthetic_syllable)
-
-                    ms[0].onset = c2 and PK_TO_LV_ONSETS[c2]
-            else:
-                if pk_consonant is not ProtoKasanicOnset.NC:
-                    ms[0].onset = pk_consonant and PK_TO_LV_ONSETS[pk_consonant]
+        """The same chains of prefixes and stems recur across a page, so the surface forms of each join are only
+        computed once per process. They are shared between the morphemes returned, which is safe as they are frozen.
+        """
+        keys = tuple(morpheme.join_key() for morpheme in morphemes)
+
+        lv_sf, pk_sf = JOIN_CACHE.get_or_compute(
+            (keys, accented),
+            lambda: LauvinkoMorpheme._join_prefixes(morphemes[:-1], keys[:-1], accented).attach(
+                morphemes[-1],
+                accented=accented == len(morphemes) - 1,
+            ).surface_forms(),
+        )
 
-            if len(syllables) > 0 and len(ms) > 0:
-                if ms[0].onset is LauvinkoConsonant.H:
-                    ms[0].onset = None
+        return LauvinkoMorpheme(
+            lemma=None,
+            surface_form=lv_sf,
+            virtual_original_form=ProtoKasanicMorpheme(
+                lemma=None,
+                surface_form=pk_sf,
+                end_mutation=morphemes[-1].end_mutation(),
+            ),
+            context=morphemes[-1].context,
+        )
 
-                if ms[0].onset is None:
-                    v1, c1, v2, c2 = syllables[-1].vowel, syllables[-1].coda, ms[0].vowel, ms[0].coda
+    @staticmethod
+    def join_prefixes(morphemes: List["LauvinkoMorpheme"], accented: Optional[int] = None) -> "PartialJoin":
+        """Joins the morphemes before a stem, so that any number of stems can then be attached with PartialJoin.attach.
+        accented is the index of the accented morpheme among them, if any.
+        """
+        keys = tuple(morpheme.join_key() for morpheme in morphemes)
+        return LauvinkoMorpheme._join_prefixes(morphemes, keys, accented)
 
-                    original_final_vowel = pk_syllables[-1].vowel
+    @staticmethod
+    def _join_prefixes(morphemes: List["LauvinkoMorpheme"], keys: tuple, accented: Optional[int]) -> "PartialJoin":
+        if len(morphemes) == 0:
+            return EMPTY_JOIN
+
+        # an accent on a morpheme after these makes no difference to how they are joined
+        if accented is not None and accented >= len(morphemes):
+            accented = None
+
+        return PREFIX_JOIN_CACHE.get_or_compute(
+            (keys, accented),
+            lambda: LauvinkoMorpheme._join_prefixes(morphemes[:-1], keys[:-1], accented).attach(
+                morphemes[-1],
+                accented=accented == len(morphemes) - 1,
+            ),
+        )
 
-                    if c1 is LauvinkoConsonant.A:
-                        pass
 
-                    elif original_final_vowel is ProtoKasanicVowel.A:
-                        merged_vowel = LauvinkoVowel.find_by(
-                            frontness=v2.frontness,
-                            low=True,
+@dataclass(frozen=True)
+class PartialJoin:
+    """The morphemes joined so far by LauvinkoMorpheme.join. Attaching the next morpheme can only change the last
+    syllable, and the rest of the word only affects it through the last Proto-Kasanic vowel and the active mutation,
+    so a block of prefixes can be joined once and shared by every stem attached to it. Syllables at boundaries are
+    kept as builders until the join is finished, since they may not be valid on their own, and the last one is copied
+    before it is changed.
+    """
+    syllables: tuple[Union[LauvinkoSyllable, LauvinkoSyllableBuilder], ...]
+    pk_syllables: tuple[ProtoKasanicSyllable, ...]
+    accent_position: Optional[int]
+    falling_accent: Optional[bool]
+    pk_stress_position: Optional[int]
+    active_mutation: Optional[ProtoKasanicMutation]
+
+    def attach(self, morpheme: LauvinkoMorpheme, accented: bool) -> "PartialJoin":
+        syllables: List[Union[LauvinkoSyllable, LauvinkoSyllableBuilder]] = list(self.syllables)
+        pk_syllables: List[ProtoKasanicSyllable] = list(self.pk_syllables)
+        accent_position = self.accent_position
+        falling_accent = self.falling_accent
+        pk_stress_position = self.pk_stress_position
+        active_mutation = self.active_mutation
+
+        # Only the syllables either side of a morpheme boundary can change, so only they need builders
+        ms = list(morpheme.surface_form.syllables)
+
+        if len(ms) > 0:
+            ms[0] = ms[0].builder()
+
+            if len(syllables) > 0:
+                # a copy, since the last syllable may be a builder shared with other partial joins
+                last = syllables[-1]
+                syllables[-1] = LauvinkoSyllableBuilder(onset=last.onset, vowel=last.vowel, coda=last.coda)
+
+        morpheme_pk_syllables = list(morpheme.virtual_original_form.surface_form.syllables)
+
+        pk_consonant = morpheme.original_initial_consonant()
+
+        if active_mutation is not None and len(ms) > 0:
+            pk_consonant = active_mutation.mutate(pk_consonant)
+            morpheme_pk_syllables[0] = ProtoKasanicSyllable.of(
+                onset=pk_consonant,
+                vowel=morpheme_pk_syllables[0].vowel,
+            )
+
+        if len(ms) == 0:
+            pass
+        elif len(syllables) > 0:
+            if pk_consonant is not None and pk_consonant is not ProtoKasanicOnset.NC:
+                c1, c2 = break_pk_consonant(pk_consonant)
+
+                if c1 is not None:
+                    if syllables[-1].coda is None:
+                        syllables[-1].coda = c1
+                    elif syllables[-1].coda is LauvinkoConsonant.A:
+                        epenthetic_syllable = LauvinkoSyllableBuilder(
+                            onset=epenthetic_consonant(syllables[-1].vowel.frontness),
+                            vowel=LauvinkoVowel.A,
+                            coda=c1,
                         )
-                        ms[0].vowel = merged_vowel
-
-                    elif original_final_vowel is ProtoKasanicVowel.AA and c2 is None and \
-                            not (accented == i and morpheme.surface_form.accent_position == 0):
-                        ms[0].coda = epenthetic_consonant(v2.frontness)
-                        ms[0].vowel = LauvinkoVowel.A
-
-                    v2 = ms[0].vowel
-                    if c1 is not None:
-                        if original_final_vowel.frontness is VowelFrontness.BACK:
-                            ms[0].onset = LauvinkoConsonant.V
-
-                        elif c1 is LauvinkoConsonant.A:
-                            syllables[-1].coda = None
-                            ms[0].onset = epenthetic_consonant(v1.frontness)
-
-                        else:
-                            syllables[-1].coda = None
-                            ms[0].onset = c1
-
-                    if ms[0].onset is not None:
-                        pass
-
-                    elif morpheme.surface_form.accent_position != 0 and v2.frontness is VowelFrontness.MID:
-                        original_initial_vowel = morpheme.virtual_original_form.surface_form.syllables[0].vowel
-
-                        vowel_epenthesized = pk_consonant is ProtoKasanicOnset.NC
-                        vowel_broken = original_initial_vowel in (ProtoKasanicVowel.AI, ProtoKasanicVowel.AU)
-
-                        if vowel_epenthesized or vowel_broken:
-                            ms[0].onset = syllables[-1].onset
-                            ms[0].vowel = v1
-
-                            if ms[0].coda is epenthetic_consonant(v1.frontness):
-                                ms[0].coda = None
-
-                            del syllables[-1]
-                        elif original_final_vowel.frontness is original_initial_vowel.frontness:
-                            ms[0].onset = syllables[-1].onset
-                            ms[0].vowel = v1
-                            del syllables[-1]
-                        elif c2 is not None:
-                            ms[0].onset = epenthetic_consonant(original_final_vowel.frontness) or epenthetic_consonant(original_initial_vowel.frontness)
-                        else:
-                            ms[0].onset = syllables[-1].onset
-                            ms[0].vowel = v1
-                            if original_initial_vowel.frontness is not VowelFrontness.MID:
-                                ms[0].coda = epenthetic_consonant(original_initial_vowel.frontness)
-                            elif v1.frontness is not VowelFrontness.MID:
-                                ms[0].coda = LauvinkoConsonant.A
-                            del syllables[-1]
-
-                    elif (v1.frontness is v2.frontness) and (
-                            (v1.frontness is VowelFrontness.MID) or
-                            (v2.low is False) or
-                            ((morpheme.surface_form.accent_position is not None) and
-                             (morpheme.surface_form.accent_position > 0))):
-                        ms[0].onset = syllables[-1].onset
-                        del syllables[-1]
-                        ms[0].vowel = LauvinkoVowel.find_by(
-                            frontness=v1.frontness,
-                            low=v1.low or v2.low,
+
+                        syllables[-1].coda = None
+                        syllables.append(epenthetic_syllable)
+                    else:
+                        epenthetic_syllable = LauvinkoSyllableBuilder(
+                            onset=syllables[-1].coda,
+                            vowel=epenthetic_vowel(syllables[-1].coda),
+                            coda=c1,
                         )
 
+                        syllables[-1].coda = None
+                        syllables.append(epenthetic_syllable)
+
+                ms[0].onset = c2 and PK_TO_LV_ONSETS[c2]
+        else:
+            if pk_consonant is not ProtoKasanicOnset.NC:
+                ms[0].onset = pk_consonant and PK_TO_LV_ONSETS[pk_consonant]
+
+        if len(syllables) > 0 and len(ms) > 0:
+            if ms[0].onset is LauvinkoConsonant.H:
+                ms[0].onset = None
+
+            if ms[0].onset is None:
+                v1, c1, v2, c2 = syllables[-1].vowel, syllables[-1].coda, ms[0].vowel, ms[0].coda
+
+                original_final_vowel = pk_syllables[-1].vowel
+
+                if c1 is LauvinkoConsonant.A:
+                    pass
+
+                elif original_final_vowel is ProtoKasanicVowel.A:
+                    merged_vowel = LauvinkoVowel.find_by(
+                        frontness=v2.frontness,
+                        low=True,
+                    )
+                    ms[0].vowel = merged_vowel
+
+                elif original_final_vowel is ProtoKasanicVowel.AA and c2 is None and \
+                        not (accented and morpheme.surface_form.accent_position == 0):
+                    ms[0].coda = epenthetic_consonant(v2.frontness)
+                    ms[0].vowel = LauvinkoVowel.A
+
+                v2 = ms[0].vowel
+                if c1 is not None:
+                    if original_final_vowel.frontness is VowelFrontness.BACK:
+                        ms[0].onset = LauvinkoConsonant.V
+
+                    elif c1 is LauvinkoConsonant.A:
+                        syllables[-1].coda = None
+                        ms[0].onset = epenthetic_consonant(v1.frontness)
+
                     else:
-                        ec = (epenthetic_consonant(original_final_vowel.frontness)
-                              or epenthetic_consonant(v2.frontness)
-                              or epenthetic_consonant(v1.frontness))
-                        if ec is None:
-                            raise RuntimeError(f"{original_final_vowel} {v1} {v2}")
+                        syllables[-1].coda = None
+                        ms[0].onset = c1
 
-                        ms[0].onset = ec
+                if ms[0].onset is not None:
+                    pass
+
+                elif morpheme.surface_form.accent_position != 0 and v2.frontness is VowelFrontness.MID:
+                    original_initial_vowel = morpheme.virtual_original_form.surface_form.syllables[0].vowel
 
-            if i == accented:
-                pk_stress_position = len(pk_syllables) + morpheme.virtual_original_form.surface_form.stress_position
+                    vowel_epenthesized = pk_consonant is ProtoKasanicOnset.NC
+                    vowel_broken = original_initial_vowel in (ProtoKasanicVowel.AI, ProtoKasanicVowel.AU)
 
-                if morpheme.surface_form.accent_position is None:
-                    raise LauvinkoMorpheme.InvalidAccent(f"Morpheme bears no accent: {morpheme}")
+                    if vowel_epenthesized or vowel_broken:
+                        ms[0].onset = syllables[-1].onset
+                        ms[0].vowel = v1
 
-                accent_position = len(syllables) + morpheme.surface_form.accent_position
-                falling_accent = morpheme.surface_form.falling_accent
+                        if ms[0].coda is epenthetic_consonant(v1.frontness):
+                            ms[0].coda = None
 
-            syllables += ms
+                        del syllables[-1]
+                    elif original_final_vowel.frontness is original_initial_vowel.frontness:
+                        ms[0].onset = syllables[-1].onset
+                        ms[0].vowel = v1
+                        del syllables[-1]
+                    elif c2 is not None:
+                        ms[0].onset = epenthetic_consonant(original_final_vowel.frontness) or epenthetic_consonant(original_initial_vowel.frontness)
+                    else:
+                        ms[0].onset = syllables[-1].onset
+                        ms[0].vowel = v1
+                        if original_initial_vowel.frontness is not VowelFrontness.MID:
+                            ms[0].coda = epenthetic_consonant(original_initial_vowel.frontness)
+                        elif v1.frontness is not VowelFrontness.MID:
+                            ms[0].coda = LauvinkoConsonant.A
+                        del syllables[-1]
 
-            pk_syllables += morpheme_pk_syllables
+                elif (v1.frontness is v2.frontness) and (
+                        (v1.frontness is VowelFrontness.MID) or
+                        (v2.low is False) or
+                        ((morpheme.surface_form.accent_position is not None) and
+                         (morpheme.surface_form.accent_position > 0))):
+                    ms[0].onset = syllables[-1].onset
+                    del syllables[-1]
+                    ms[0].vowel = LauvinkoVowel.find_by(
+                        frontness=v1.frontness,
+                        low=v1.low or v2.low,
+                    )
 
-            if (len(ms) > 0) or (morpheme.end_mutation() is not None):
-                active_mutation = morpheme.end_mutation()
+                else:
+                    ec = (epenthetic_consonant(original_final_vowel.frontness)
+                          or epenthetic_consonant(v2.frontness)
+                          or epenthetic_consonant(v1.frontness))
+                    if ec is None:
+                        raise RuntimeError(f"{original_final_vowel} {v1} {v2}")
 
-        lv_sf = LauvinkoSurfaceForm(
-            syllables=syllables,
+                    ms[0].onset = ec
+
+        if accented:
+            pk_stress_position = len(pk_syllables) + morpheme.virtual_original_form.surface_form.stress_position
+
+            if morpheme.surface_form.accent_position is None:
+                raise LauvinkoMorpheme.InvalidAccent(f"Morpheme bears no accent: {morpheme}")
+
+            accent_position = len(syllables) + morpheme.surface_form.accent_position
+            falling_accent = morpheme.surface_form.falling_accent
+
+        syllables += ms
+
+        pk_syllables += morpheme_pk_syllables
+
+        if (len(ms) > 0) or (morpheme.end_mutation() is not None):
+            active_mutation = morpheme.end_mutation()
+
+        return PartialJoin(
+            syllables=tuple(syllables),
+            pk_syllables=tuple(pk_syllables),
             accent_position=accent_position,
             falling_accent=falling_accent,
+            pk_stress_position=pk_stress_position,
+            active_mutation=active_mutation,
         )
 
-        return LauvinkoMorpheme(
-            lemma=None,
-            surface_form=lv_sf,
-            virtual_original_form=ProtoKasanicMorpheme(
-                lemma=None,
-                surface_form=PKSurfaceForm(
-                    syllables=pk_syllables,
-                    stress_position=pk_stress_position,
-                ),
-                end_mutation=morphemes[-1].end_mutation(),
-            ),
-            context=morphemes[-1].context,
+    def surface_forms(self) -> tuple[LauvinkoSurfaceForm, PKSurfaceForm]:
+        lv_sf = LauvinkoSurfaceForm(
+            syllables=self.syllables,
+            accent_position=self.accent_position,
+            falling_accent=self.falling_accent,
+        )
+
+        pk_sf = PKSurfaceForm(
+            syllables=self.pk_syllables,
+            stress_position=self.pk_stress_position,
         )
 
+        return lv_sf, pk_sf
+
+
+EMPTY_JOIN = PartialJoin(
+    syllables=(),
+    pk_syllables=(),
+    accent_position=None,
+    falling_accent=None,
+    pk_stress_position=None,
+    active_mutation=None,
+)
+
 
 @dataclass
 class LauvinkoLemma(Lemma):
@@ -300,7 +394,7 @@ class LauvinkoLemma(Lemma):
         self.check_form_allowed(primary_ta)
 
         if (primary_ta, context) not in self.forms:
-            self.forms[(primary_ta, context)] = self._generate_form(primary_ta, context)
+            return self.store_generated_form((primary_ta, context), lambda: self._generate_form(primary_ta, context))
 
         return self.forms[(primary_ta, context)]
 
@@ -483,68 +577,74 @@ class LauvinkoWord(Word):
             accented=accented,
         )
 
+    @staticmethod
+    def attach_syllables(syllables: List[LauvinkoSyllableBuilder], ms: List[LauvinkoSyllableBuilder],
+                         accent_position: Optional[int]):
+        """Resolves the boundary between the syllables of a phonological word so far and ms, the syllables of the
+        next syntactic word. Only the last of syllables and the first of ms change, and the last of syllables may be
+        deleted, so those two must be builders.
+        """
+        if ms[0].onset is not None or len(syllables) == 0:
+            return
+
+        if syllables[-1].coda is LauvinkoConsonant.A:
+            frontness = ms[0].vowel.frontness
+            if ms[0].vowel.frontness is VowelFrontness.MID:
+                syllables[-1].coda = None
+                frontness = syllables[-1].vowel.frontness
+
+            if frontness is VowelFrontness.FRONT:
+                ms[0].onset = LauvinkoConsonant.Y
+
+            elif frontness is VowelFrontness.BACK:
+                ms[0].onset = LauvinkoConsonant.V
+
+            else:
+                raise RuntimeError
+
+        elif syllables[-1].coda is not None:
+            ms[0].onset = syllables[-1].coda
+            syllables[-1].coda = None
+
+        elif accent_position != len(syllables) and (syllables[-1].vowel is LauvinkoVowel.A or (
+            syllables[-1].onset is LauvinkoConsonant.Y and syllables[-1].vowel is LauvinkoVowel.I)):
+
+            ms[0].onset = syllables[-1].onset
+            del syllables[-1]
+
+        elif ms[0].vowel.frontness == syllables[-1].vowel.frontness and not ms[0].vowel.low:
+            ms[0].vowel = syllables[-1].vowel
+            ms[0].onset = syllables[-1].onset
+            del syllables[-1]
+
+        elif syllables[-1].vowel.frontness is VowelFrontness.FRONT:
+            ms[0].onset = LauvinkoConsonant.Y
+
+        elif syllables[-1].vowel.frontness is VowelFrontness.BACK:
+            ms[0].onset = LauvinkoConsonant.V
+
     @classmethod
     def cliticize(cls, words: List["LauvinkoWord"], accented: int) -> "LauvinkoSurfaceForm":
-        syllables: List[LauvinkoSyllable] = []
+        syllables: List[Union[LauvinkoSyllable, LauvinkoSyllableBuilder]] = []
         accent_position = None
         falling_accent = None
 
         for i, word in enumerate(words):
             sf = word.surface_form()
 
+            # Only the syllables either side of a word boundary can change, so only they need builders
+            if len(syllables) > 0:
+                syllables[-1] = syllables[-1].builder()
+
             if len(sf.syllables) == 0:
                 if word.word_type() is LauvinkoWordType.DETERMINER:
                     word.apply_case_ending(syllables, accent_position)
                 continue
 
-            ms = [
-                LauvinkoSyllable(
-                    onset=s.onset,
-                    vowel=s.vowel,
-                    coda=s.coda,
-                )
-                for s in sf.syllables
-            ]
-
-            if ms[0].onset is None:
-                if len(syllables) == 0:
-                    pass
-
-                elif syllables[-1].coda is LauvinkoConsonant.A:
-                    frontness = ms[0].vowel.frontness
-                    if ms[0].vowel.frontness is VowelFrontness.MID:
-                        syllables[-1].coda = None
-                        frontness = syllables[-1].vowel.frontness
-
-                    if frontness is VowelFrontness.FRONT:
-                        ms[0].onset = LauvinkoConsonant.Y
+            ms = list(sf.syllables)
+            ms[0] = ms[0].builder()
 
-                    elif frontness is VowelFrontness.BACK:
-                        ms[0].onset = LauvinkoConsonant.V
-
-                    else:
-                        raise RuntimeError
-
-                elif syllables[-1].coda is not None:
-                    ms[0].onset = syllables[-1].coda
-                    syllables[-1].coda = None
-
-                elif accent_position != len(syllables) and (syllables[-1].vowel is LauvinkoVowel.A or (
-                    syllables[-1].onset is LauvinkoConsonant.Y and syllables[-1].vowel is LauvinkoVowel.I)):
-
-                    ms[0].onset = syllables[-1].onset
-                    del syllables[-1]
-
-                elif ms[0].vowel.frontness == syllables[-1].vowel.frontness and not ms[0].vowel.low:
-                    ms[0].vowel = syllables[-1].vowel
-                    ms[0].onset = syllables[-1].onset
-                    del syllables[-1]
-
-                elif syllables[-1].vowel.frontness is VowelFrontness.FRONT:
-                    ms[0].onset = LauvinkoConsonant.Y
-
-                elif syllables[-1].vowel.frontness is VowelFrontness.BACK:
-                    ms[0].onset = LauvinkoConsonant.V
+            cls.attach_syllables(syllables, ms, accent_position)
 
             if accented == i:
                 accent_position = len(syllables) + sf.accent_position
@@ -604,11 +704,11 @@ class LauvinkoContentWord(LauvinkoWord):
         )
 
 
-PKS = ProtoKasanicSyllable
+PKS = ProtoKasanicSyllable.of
 PKO = ProtoKasanicOnset
 PKV = ProtoKasanicVowel
 
-LS = LauvinkoSyllable
+LS = LauvinkoSyllable.of
 LC = LauvinkoConsonant
 LV = LauvinkoVowel
 
@@ -684,7 +784,7 @@ def _add_case_vowel(lv_syllables: list[LauvinkoSyllable], accent_position: int,
         raise NotImplementedError
 
     else:
-        syll = LauvinkoSyllable(
+        syll = LauvinkoSyllable.of(
             onset=lv_syllables[-1].coda,
             vowel=vowel,
             coda=None,
@@ -701,7 +801,7 @@ def _add_case_consonant(lv_syllables: list[LauvinkoSyllable], consonant: Lauvink
         raise NotImplementedError
 
     else:
-        syll = LauvinkoSyllable(
+        syll = LauvinkoSyllable.of(
             onset=lv_syllables[-1].coda,
             vowel=LauvinkoVowel.A,
             coda=consonant,
@@ -714,11 +814,11 @@ def _add_partitive_suffix(lv_syllables: list[LauvinkoSyllable], definite: bool):
     coda = LauvinkoConsonant.S if definite else None
 
     if lv_syllables[-1].coda is None:
-        lv_syllables.append(LauvinkoSyllable(onset=LauvinkoConsonant.Y, vowel=LauvinkoVowel.E, coda=coda))
+        lv_syllables.append(LauvinkoSyllable.of(onset=LauvinkoConsonant.Y, vowel=LauvinkoVowel.E, coda=coda))
     elif lv_syllables[-1].coda is LauvinkoConsonant.A:
         raise NotImplementedError
     else:
-        syll = LauvinkoSyllable(
+        syll = LauvinkoSyllable.of(
             onset=lv_syllables[-1].coda,
             vowel=LauvinkoVowel.E,
             coda=coda,
@@ -791,8 +891,12 @@ class LauvinkoDeterminer(LauvinkoWord):
         return person in ANIMATES
 
     def apply_case_ending(self, lv_syllables: list[LauvinkoSyllable], accent_position: int):
+        """Case endings only change the last syllable, so only it is replaced with a builder"""
         case = self.case()
 
+        if len(lv_syllables) > 0:
+            lv_syllables[-1] = lv_syllables[-1].builder()
+
         if case is None:
             pass
         elif case in (LauvinkoCase.AGENTIVE, LauvinkoCase.PATIENTIVE):
@@ -810,7 +914,7 @@ class LauvinkoDeterminer(LauvinkoWord):
         elif case in (LauvinkoCase.LOCATIVE, LauvinkoCase.ABLATIVE):
             _add_case_vowel(lv_syllables, accent_position, LauvinkoVowel.O)
         elif case is LauvinkoCase.PERLATIVE:
-            lv_syllables.append(LauvinkoSyllable(onset=LauvinkoConsonant.M, vowel=LauvinkoVowel.I, coda=None))
+            lv_syllables.append(LauvinkoSyllable.of(onset=LauvinkoConsonant.M, vowel=LauvinkoVowel.I, coda=None))
         elif case is LauvinkoCase.PARTITIVE:
             _add_partitive_suffix(lv_syllables, self.definite_suffix is not None)
         else:
@@ -827,7 +931,7 @@ class LauvinkoDeterminer(LauvinkoWord):
         else:
             tup = CASE_SPELLING_SYLLABLES[case.abbreviation]
 
-        return tup and ProtoKasanicSyllable(*tup)
+        return tup and ProtoKasanicSyllable.of(*tup)
 
     def _generate_morph(self) -> "LauvinkoMorpheme":
         case = self.case()
@@ -851,14 +955,7 @@ class LauvinkoDeterminer(LauvinkoWord):
                 pk_syllables = pks
 
         else:
-            lv_syllables: list[LauvinkoSyllable] = [
-                LauvinkoSyllable(
-                    onset=s.onset,
-                    vowel=s.vowel,
-                    coda=s.coda,
-                )
-                for s in self.determiner.surface_form.syllables
-            ]
+            lv_syllables = list(self.determiner.surface_form.syllables)
 
             if len(lv_syllables) > 0:
                 self.apply_case_ending(lv_syllables, accent_position)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List
+from typing import Optional, List, Iterable, Union
 from lauvinko.lang.shared.phonology import (
     MannerOfArticulation,
     PlaceOfArticulation,
@@ -9,10 +9,13 @@ from lauvinko.lang.shared.phonology import (
     Vowel,
     Syllable,
     SurfaceForm,
+    reduce_by_name,
 )
 
 
 class LauvinkoConsonant(Consonant, Enum):
+    __reduce_ex__ = reduce_by_name
+
     M = ("m", PlaceOfArticulation.LABIAL, MannerOfArticulation.NASAL)
     N = ("n", PlaceOfArticulation.ALVEOLAR, MannerOfArticulation.NASAL)
     NG = ("ŋ", PlaceOfArticulation.VELAR, MannerOfArticulation.NASAL)
@@ -33,6 +36,8 @@ class LauvinkoConsonant(Consonant, Enum):
 
 
 class LauvinkoVowel(Vowel, Enum):
+    __reduce_ex__ = reduce_by_name
+
     A = ('a', True, VowelFrontness.MID)
     E = ('e', True, VowelFrontness.FRONT)
     O = ('o', True, VowelFrontness.BACK)
@@ -40,7 +45,11 @@ class LauvinkoVowel(Vowel, Enum):
 
 
 
-@dataclass
+# Every valid syllable made with LauvinkoSyllable.of, keyed on its phonemes
+LV_SYLLABLES: dict[tuple[Optional[LauvinkoConsonant], LauvinkoVowel, Optional[LauvinkoConsonant]], "LauvinkoSyllable"] = {}
+
+
+@dataclass(frozen=True)
 class LauvinkoSyllable(Syllable):
     onset: Optional[LauvinkoConsonant]
     vowel: LauvinkoVowel
@@ -49,6 +58,22 @@ class LauvinkoSyllable(Syllable):
     class InvalidSyllable(ValueError):
         pass
 
+    @classmethod
+    def of(cls, onset: Optional[LauvinkoConsonant], vowel: LauvinkoVowel,
+           coda: Optional[LauvinkoConsonant] = None) -> "LauvinkoSyllable":
+        """Returns the one shared instance of a syllable, so that it is only allocated and validated once"""
+        key = (onset, vowel, coda)
+        syllable = LV_SYLLABLES.get(key)
+
+        if syllable is None:
+            syllable = LV_SYLLABLES[key] = cls(onset=onset, vowel=vowel, coda=coda)
+
+        return syllable
+
+    def __reduce_ex__(self, protocol):
+        # so that unpickled syllables are shared too
+        return LauvinkoSyllable.of, (self.onset, self.vowel, self.coda)
+
     def __post_init__(self):
         if self.onset is LauvinkoConsonant.A:
             raise LauvinkoSyllable.InvalidSyllable("ɐ̯ cannot be at the beginning of a syllable")
@@ -65,6 +90,32 @@ class LauvinkoSyllable(Syllable):
         if self.coda is LauvinkoConsonant.A and self.vowel is LauvinkoVowel.A:
             raise LauvinkoSyllable.InvalidSyllable(f"{self.vowel.ipa}{self.coda.ipa}")
 
+    def builder(self) -> "LauvinkoSyllableBuilder":
+        return LauvinkoSyllableBuilder(onset=self.onset, vowel=self.vowel, coda=self.coda)
+
+
+@dataclass
+class LauvinkoSyllableBuilder:
+    """A mutable stand-in for a LauvinkoSyllable, for code which changes a syllable over several steps.
+    It is only validated once it is built.
+    """
+    onset: Optional[LauvinkoConsonant]
+    vowel: LauvinkoVowel
+    coda: Optional[LauvinkoConsonant] = None
+
+    def builder(self) -> "LauvinkoSyllableBuilder":
+        return self
+
+    def build(self) -> LauvinkoSyllable:
+        return LauvinkoSyllable.of(onset=self.onset, vowel=self.vowel, coda=self.coda)
+
+
+def build_syllables(syllables: Iterable[Union[LauvinkoSyllable, LauvinkoSyllableBuilder]]) -> tuple[LauvinkoSyllable, ...]:
+    return tuple(
+        syllable.build() if isinstance(syllable, LauvinkoSyllableBuilder) else syllable
+        for syllable in syllables
+    )
+
 
 def broad_coda_ipa(coda: Optional[LauvinkoConsonant]):
     """A number of phonemic distinctions are unilaterally collapsed in the coda of Lauvinko syllables.
@@ -188,9 +239,18 @@ def accent_ipa(falling_accent: bool):
     return "\u0302" if falling_accent else "\u0301"
 
 
-@dataclass
+def broad_syllable_transcription(syllable: LauvinkoSyllable, falling_accent: Optional[bool] = None) -> str:
+    """falling_accent is None for an unaccented syllable"""
+    accent = '' if falling_accent is None else accent_ipa(falling_accent)
+    coda = '' if syllable.coda is None else syllable.coda.ipa
+
+    return f"{getattr(syllable.onset, 'ipa', '')}{syllable.vowel.ipa}{accent}{coda}"
+
+
+@dataclass(frozen=True)
 class LauvinkoSurfaceForm(SurfaceForm):
-    syllables: List[LauvinkoSyllable]
+    """Syllables may be given as any iterable, including of LauvinkoSyllableBuilders, but are stored as a tuple"""
+    syllables: tuple[LauvinkoSyllable, ...]
     accent_position: int
     falling_accent: bool
 
@@ -198,12 +258,11 @@ class LauvinkoSurfaceForm(SurfaceForm):
         pass
 
     def __post_init__(self):
+        object.__setattr__(self, "syllables", build_syllables(self.syllables))
+
         if self.accent_position is not None and self.accent_position >= len(self.syllables):
             raise self.InvalidLauvinkoSurfaceForm("Accent in invalid position")
 
-        for syllable in self.syllables:
-            syllable.__post_init__()
-
         for syllable in self.syllables[1:]:
             if syllable.onset is LauvinkoConsonant.H:
                 raise self.InvalidLauvinkoSurfaceForm("Lauvinko surface form cannot have h medially")
@@ -211,24 +270,10 @@ class LauvinkoSurfaceForm(SurfaceForm):
                 raise self.InvalidLauvinkoSurfaceForm("Non-initial syllables in Lauvinko must have an onset")
 
     def broad_transcription(self):
-        syllables_ipa = []
-
-        for i, syllable in enumerate(self.syllables):
-            if i == self.accent_position:
-                accent = accent_ipa(self.falling_accent)
-            else:
-                accent = ''
-
-            if syllable.coda is not None:
-                coda = syllable.coda.ipa
-            else:
-                coda = ''
-
-            syllables_ipa.append(
-                f"{getattr(syllable.onset, 'ipa', '')}{syllable.vowel.ipa}{accent}{coda}"
-            )
-
-        return ".".join(syllables_ipa)
+        return ".".join(
+            broad_syllable_transcription(syllable, self.falling_accent if i == self.accent_position else None)
+            for i, syllable in enumerate(self.syllables)
+        )
 
     def narrow_transcription(self) -> str:
         out = getattr(self.syllables[0].onset, 'ipa', '')
@@ -1,5 +1,6 @@
+from typing import Optional
 from lauvinko.lang.shared.phonology import MannerOfArticulation, PlaceOfArticulation
-from lauvinko.lang.lauvinko.phonology import LauvinkoConsonant, LauvinkoSurfaceForm
+from lauvinko.lang.lauvinko.phonology import LauvinkoConsonant, LauvinkoSyllable, LauvinkoSurfaceForm
 
 
 def coda_romanization(coda: LauvinkoConsonant, next_onset: LauvinkoConsonant) -> str:
@@ -41,19 +42,33 @@ def coda_romanization(coda: LauvinkoConsonant, next_onset: LauvinkoConsonant) ->
         return coda.name.lower()
 
 
-def romanize(sf: LauvinkoSurfaceForm):
+def romanize_syllable(syllable: LauvinkoSyllable, next_onset: Optional[LauvinkoConsonant],
+                      falling_accent: Optional[bool] = None) -> str:
+    """falling_accent is None for an unaccented syllable"""
     out = ""
 
-    for i, syllable in enumerate(sf.syllables):
-        if syllable.onset:
-            out += syllable.onset.name.lower()
+    if syllable.onset:
+        out += syllable.onset.name.lower()
+
+    out += syllable.vowel.name.lower()
+    if falling_accent is not None:
+        out += "\u0300" if falling_accent else "\u0301"
+
+    out += coda_romanization(syllable.coda, next_onset)
+
+    return out
 
-        out += syllable.vowel.name.lower()
-        if i == sf.accent_position:
-            out += "\u0300" if sf.falling_accent else "\u0301"
 
+def romanize(sf: LauvinkoSurfaceForm):
+    out = ""
+
+    for i, syllable in enumerate(sf.syllables):
         next_onset = sf.syllables[i+1].onset if i + 1 < len(sf.syllables) else None
 
-        out += coda_romanization(syllable.coda, next_onset)
+        out += romanize_syllable(
+            syllable,
+            next_onset,
+            sf.falling_accent if i == sf.accent_position else None,
+        )
 
     return out
@@ -114,7 +114,7 @@ def _random_pk_syllables(category: KasanicStemCategory) -> List[ProtoKasanicSyll
             vowel = vowel_raffle.draw()
 
         try:
-            syllables.append(ProtoKasanicSyllable(onset, vowel))
+            syllables.append(ProtoKasanicSyllable.of(onset, vowel))
         except ProtoKasanicSyllable.InvalidSyllable:
             pass  # no big deal if the onset and vowel don't match up, try try again (should be rare)
 
@@ -41,6 +41,13 @@ class ProtoKasanicMorpheme(Morpheme):
     class InvalidTranscription(ValueError):
         pass
 
+    def __reduce_ex__(self, protocol):
+        # REDUPLICATOR is recognised by identity, so it must unpickle (and copy) as the module-level object
+        if self is REDUPLICATOR:
+            return "REDUPLICATOR"
+
+        return super().__reduce_ex__(protocol)
+
     @classmethod
     def from_informal_transcription(cls, transcription: str, stress_position: Optional[int] = -1) -> "ProtoKasanicMorpheme":
         return cls(
@@ -91,7 +98,7 @@ class ProtoKasanicMorpheme(Morpheme):
             except KeyError:
                 raise ProtoKasanicMorpheme.InvalidTranscription("Invalid vowel: " + v_str)
 
-            syllables.append(ProtoKasanicSyllable(onset, vowel))
+            syllables.append(ProtoKasanicSyllable.of(onset, vowel))
 
             if s_str:
                 if stress_position == -1:
@@ -136,7 +143,7 @@ class ProtoKasanicMorpheme(Morpheme):
 
             elif i > 0 and morphemes[i-1] is REDUPLICATOR and ms[0].onset is None:
                 syllables_to_add = [
-                    ProtoKasanicSyllable(
+                    ProtoKasanicSyllable.of(
                         onset=ms[1].onset,
                         vowel=ms[0].vowel,
                     ),
@@ -148,7 +155,7 @@ class ProtoKasanicMorpheme(Morpheme):
                 syllables_to_add = [*ms]
 
             if active_mutation is not None:
-                syllables_to_add[0] = ProtoKasanicSyllable(
+                syllables_to_add[0] = ProtoKasanicSyllable.of(
                     onset=active_mutation.mutate(syllables_to_add[0].onset),
                     vowel=syllables_to_add[0].vowel,
                 )
@@ -273,7 +280,7 @@ class ProtoKasanicLemma(Lemma):
         self.check_form_allowed(primary_ta)
 
         if primary_ta not in self.forms:
-            self.forms[primary_ta] = self._generate_form(primary_ta)
+            return self.store_generated_form(primary_ta, lambda: self._generate_form(primary_ta))
 
         return self.forms[primary_ta]
 
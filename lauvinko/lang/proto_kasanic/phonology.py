@@ -9,10 +9,13 @@ from lauvinko.lang.shared.phonology import (
     Vowel,
     Syllable,
     SurfaceForm,
+    reduce_by_name,
 )
 
 
 class ProtoKasanicOnset(Consonant, Enum):
+    __reduce_ex__ = reduce_by_name
+
     K = ("k", PlaceOfArticulation.VELAR, MannerOfArticulation.PLAIN_STOP)
     KK = ("ˀk", PlaceOfArticulation.VELAR, MannerOfArticulation.PREGLOTTALIZED_STOP)
     NK = ("ᵑk", PlaceOfArticulation.VELAR, MannerOfArticulation.PRENASALIZED_STOP)
@@ -55,6 +58,8 @@ DELABIALIZE = {
 }
 
 class ProtoKasanicVowel(Vowel, Enum):
+    __reduce_ex__ = reduce_by_name
+
     A = ('ə', False, VowelFrontness.MID)
     AA = ('a', True, VowelFrontness.MID)
     I = ('i', False, VowelFrontness.FRONT)
@@ -82,7 +87,11 @@ VOWEL_POSITIONS = {
 }
 
 
-@dataclass
+# Every valid syllable made with ProtoKasanicSyllable.of, keyed on its onset and vowel
+PK_SYLLABLES: dict[tuple[Optional[ProtoKasanicOnset], ProtoKasanicVowel], "ProtoKasanicSyllable"] = {}
+
+
+@dataclass(frozen=True)
 class ProtoKasanicSyllable(Syllable):
     onset: Optional[ProtoKasanicOnset]
     vowel: ProtoKasanicVowel
@@ -90,6 +99,24 @@ class ProtoKasanicSyllable(Syllable):
     class InvalidSyllable(ValueError):
         pass
 
+    @classmethod
+    def of(cls, onset: Optional[ProtoKasanicOnset], vowel: ProtoKasanicVowel) -> "ProtoKasanicSyllable":
+        """Returns the one shared instance of a syllable, so that it is only allocated and validated once"""
+        key = (onset, vowel)
+        syllable = PK_SYLLABLES.get(key)
+
+        if syllable is None:
+            syllable = PK_SYLLABLES[key] = cls(onset=onset, vowel=vowel)
+
+        return syllable
+
+    def __reduce_ex__(self, protocol):
+        # so that unpickled syllables are shared too
+        if PK_SYLLABLES.get((self.onset, self.vowel)) is self:
+            return ProtoKasanicSyllable.of, (self.onset, self.vowel)
+
+        return super().__reduce_ex__(protocol)
+
     def __post_init__(self):
         if (self.onset is not None and
                 self.onset.poa is PlaceOfArticulation.LABIOVELAR and self.vowel is ProtoKasanicVowel.U):
@@ -106,7 +133,15 @@ class ProtoKasanicSyllable(Syllable):
         if onset is ProtoKasanicOnset.Y and vowel is ProtoKasanicVowel.I:
             onset = None
 
-        return cls(onset=onset, vowel=vowel)
+        return cls.of(onset=onset, vowel=vowel)
+
+    @classmethod
+    def unvalidated(cls, onset: Optional[ProtoKasanicOnset], vowel: ProtoKasanicVowel):
+        """For the few places that deliberately spell a syllable which is not allowed"""
+        syllable = object.__new__(cls)
+        object.__setattr__(syllable, "onset", onset)
+        object.__setattr__(syllable, "vowel", vowel)
+        return syllable
 
 
 class ProtoKasanicMutation(Enum):
@@ -140,27 +175,43 @@ class ProtoKasanicMutation(Enum):
     }
 
     def mutate(self, c: Optional[ProtoKasanicOnset]) -> ProtoKasanicOnset:
-        if c in self.value:
-            return self.value[c]
+        return MUTATION_TABLES[self][c]
+
+    def compile(self) -> dict[Optional[ProtoKasanicOnset], ProtoKasanicOnset]:
+        """What the mutation turns each onset into, from the onsets and manners of articulation in its value"""
+        table = {}
+
+        for c in (None, *ProtoKasanicOnset):
+            if c in self.value:
+                table[c] = self.value[c]
+            elif c is not None and c.moa in self.value:
+                table[c] = ProtoKasanicOnset.find_by(c.poa, self.value[c.moa]) or c
+            else:
+                table[c] = c
 
-        if c.moa in self.value:
-            out = ProtoKasanicOnset.find_by(c.poa, self.value[c.moa])
-            if out is not None:
-                return out
+        return table
 
-        return c
+
+MUTATION_TABLES = {
+    mutation: mutation.compile()
+    for mutation in ProtoKasanicMutation
+}
 
 
-@dataclass
+@dataclass(frozen=True)
 class PKSurfaceForm(SurfaceForm):
-    """Stress position must be None if len(syllables) is 0"""
-    syllables: List[ProtoKasanicSyllable]
+    """Stress position must be None if len(syllables) is 0.
+    Syllables may be given as any iterable, but are stored as a tuple.
+    """
+    syllables: tuple[ProtoKasanicSyllable, ...]
     stress_position: Optional[int]
 
     class InvalidStress(ValueError):
         pass
 
     def __post_init__(self):
+        object.__setattr__(self, "syllables", tuple(self.syllables))
+
         if (self.stress_position is not None and
                 (self.stress_position >= len(self.syllables) or self.stress_position < 0)):
             raise PKSurfaceForm.InvalidStress(f"Invalid stress: {self.stress_position} {self.syllables}")
@@ -169,6 +220,22 @@ class PKSurfaceForm(SurfaceForm):
             if syllable.vowel.frontness is VowelFrontness.UNDERSPECIFIED:
                 raise ProtoKasanicSyllable.InvalidSyllable(f"Non-initial vowel is underspecified: {self.syllables}")
 
+        # Surface forms key the evolution cache, so they are hashed far more often than they are built
+        object.__setattr__(self, "_hash", hash((self.syllables, self.stress_position)))
+
+    def __hash__(self):
+        return self._hash
+
+    def __getstate__(self):
+        """The hash is left out, since strings hash differently in every process"""
+        return {"syllables": self.syllables, "stress_position": self.stress_position}
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+        object.__setattr__(self, "_hash", hash((self.syllables, self.stress_position)))
+
     def broad_transcription(self) -> str:
         syllables_ipa = []
 
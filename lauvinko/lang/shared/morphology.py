@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Any, Optional
+from collections.abc import MutableMapping
+from typing import List, Any, Optional, Callable, Hashable
 from lauvinko.lang.shared.semantics import PrimaryTenseAspect, KasanicStemCategory
 from .phonology import SurfaceForm
 
@@ -41,6 +42,16 @@ class Lemma:
         if primary_ta not in self.category.primary_aspects:
             raise self.NonexistentForm(f"{self.category.title} stem has no {primary_ta.value} form")
 
+    def store_generated_form(self, cell: Hashable, generate: Callable[[], Any]) -> Any:
+        """Generates the form for a cell which isn't in forms yet and stores it. Once the forms have been built into
+        a paradigm row, which can't be written to, every form which exists is already in it.
+        """
+        if not isinstance(self.forms, MutableMapping):
+            raise self.NonexistentForm(f"{self.ident} has no form for {cell}")
+
+        self.forms[cell] = generate()
+        return self.forms[cell]
+
     def __post_init__(self):
         for primary_ta in self.forms.keys():
             self.check_form_allowed(primary_ta)
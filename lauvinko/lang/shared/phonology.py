@@ -1,3 +1,4 @@
+import functools
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional, List
@@ -9,6 +10,13 @@ class Phoneme:
     ipa: str
 
 
+def reduce_by_name(member: Enum, protocol: int):
+    """The __reduce_ex__ of every phoneme inventory. Members are unpickled by looking their name up, rather than
+    from their value, which would carry the hash cached in the process that pickled it into another one.
+    """
+    return getattr, (type(member), member.name)
+
+
 class PlaceOfArticulation(str, Enum):
     LABIAL = "labial"
     ALVEOLAR = "alveolar"
@@ -35,17 +43,28 @@ class Consonant(Phoneme):
     poa: PlaceOfArticulation
     moa: MannerOfArticulation
 
+    def __post_init__(self):
+        # phonemes are hashed constantly as dict keys, so the hash is only computed once
+        object.__setattr__(self, "_hash", hash((self.ipa, self.poa, self.moa)))
+
+    @classmethod
+    @functools.cache
+    def by_features(cls) -> dict[tuple[PlaceOfArticulation, MannerOfArticulation], "cls"]:
+        """The consonants of a particular inventory by poa and moa, built once per inventory"""
+        table = {}
+
+        for c in cls:
+            table.setdefault((c.poa, c.moa), c)
+
+        return table
+
     @classmethod
     def find_by(cls, poa: PlaceOfArticulation, moa: MannerOfArticulation) -> Optional["cls"]:
         """Finds a consonant with given poa and moa within a particular inventory"""
-        for c in list(cls):
-            if c.poa == poa and c.moa == moa:
-                return c
-
-        return None
+        return cls.by_features().get((poa, moa))
 
     def __hash__(self):
-        return hash(f"{self.ipa}{self.poa}{self.moa}")
+        return self._hash
 
 
 class VowelFrontness(str, Enum):
@@ -64,44 +83,50 @@ class Vowel(Phoneme):
     low: bool
     frontness: VowelFrontness
 
+    def __post_init__(self):
+        object.__setattr__(self, "_hash", hash((self.ipa, self.low, self.frontness)))
+
+    @classmethod
+    @functools.cache
+    def by_features(cls) -> dict[tuple[bool, VowelFrontness], "cls"]:
+        """The vowels of a particular inventory by height and frontness, built once per inventory"""
+        table = {}
+
+        for v in cls:
+            table.setdefault((v.low, v.frontness), v)
+
+        return table
+
     @classmethod
     def shift_height(cls, vowel: "cls", low: bool) -> "cls":
         """Finds a vowel of same height and given frontness within a particular inventory"""
-        for v in list(cls):
-            if v.low == low and v.frontness == vowel.frontness:
-                return v
-
-        return vowel
+        return cls.by_features().get((low, vowel.frontness), vowel)
 
     @classmethod
     def find_by(cls, low: bool, frontness: VowelFrontness) -> Optional["cls"]:
-        """Finds a consonant with given poa and moa within a particular inventory"""
-        for c in list(cls):
-            if c.low == low and c.frontness == frontness:
-                return c
-
-        return None
+        """Finds a vowel with given height and frontness within a particular inventory"""
+        return cls.by_features().get((low, frontness))
 
     def __hash__(self):
-        return hash(f"{self.ipa}{self.low}{self.frontness}")
+        return self._hash
 
 
-@dataclass
 class Syllable(ABC):
+    """Syllables of a particular language are frozen, so that they can be shared between surface forms and hashed"""
     pass
 
 
 @dataclass
 class GenericCVCSyllable(Syllable):
+    """A mutable syllable for sound changes to work on, which may be midway between two languages"""
     onset: Optional[Consonant]
     vowel: Vowel
     coda: Optional[Consonant]
     stressed: bool
 
 
-@dataclass
 class SurfaceForm(ABC):
-    syllables: List[Syllable]
+    syllables: tuple[Syllable, ...]
 
     def broad_transcription(self) -> str:
         raise NotImplementedError
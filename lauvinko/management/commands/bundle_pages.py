@@ -0,0 +1,24 @@
+import json
+import os
+from django.core.management.base import BaseCommand
+from lauvinko.pages import PAGES_DIR
+from lauvinko.views import PAGE_BUNDLES_DIR, bundle_page, page_bundle_filename
+
+
+class Command(BaseCommand):
+    help = 'Prebuilds every page with its glosses embedded, so that pages can be served without glossing them'
+
+    def handle(self, *args, **options):
+        os.makedirs(PAGE_BUNDLES_DIR, exist_ok=True)
+
+        for mdfile in sorted(os.listdir(PAGES_DIR)):
+            name, ext = os.path.splitext(mdfile)
+            if ext != ".md":
+                continue
+
+            bundle = bundle_page(name)
+
+            with open(page_bundle_filename(name), "w") as fh:
+                json.dump(bundle, fh)
+
+            print(f"Bundled {name}")
@@ -0,0 +1,16 @@
+import argparse
+from django.core.management.base import BaseCommand
+from lauvinko.lang.dictionary.dictionary import Dictionary, DICTIONARY_FILENAME, lexicon_filename
+
+
+class Command(BaseCommand):
+    help = 'Compiles the dictionary into a lexicon, which processes load it from without generating any forms'
+
+    def add_arguments(self, parser: argparse.ArgumentParser):
+        parser.add_argument('--processes', '-p', type=int, default=1)
+
+    def handle(self, *args, **options):
+        if Dictionary.compile_lexicon(DICTIONARY_FILENAME, processes=options['processes']):
+            print(f"Compiled {lexicon_filename(DICTIONARY_FILENAME)}")
+        else:
+            print(f"{lexicon_filename(DICTIONARY_FILENAME)} is up to date")
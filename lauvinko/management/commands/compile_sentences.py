@@ -4,28 +4,14 @@ from dataclasses import dataclass
 import mistletoe
 from mistletoe.ast_renderer import ASTRenderer
 from django.core.management.base import BaseCommand
-from .validate_links import PAGES_DIR
 from lauvinko.lang.shared.semantics import Language
 from lauvinko.lang.gloss.gloss import Gloss, normalize_word
+from lauvinko.pages import PAGES_DIR, get_outline
 
 
 SENTENCES_FILE = "lauvinko/lang/sentences.txt"
 
 
-def get_outline(block: dict):
-    lines = block["children"][0]["content"].split("\n")
-    outline = ""
-
-    i = 0
-    while lines[i] != "":
-        outline += lines[i].strip() + " "
-        i += 1
-
-    translation = ' '.join(line.strip() for line in lines[i:]).strip()
-
-    return outline, translation
-
-
 @dataclass
 class Sentence:
     words: list[str]
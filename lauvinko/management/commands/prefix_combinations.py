@@ -7,13 +7,7 @@ from lauvinko.lang.dictionary.dictionary import Dictionary, MODAL_PREFIXES, TERT
 
 ROOTS = []
 
-for entry in Dictionary.load().entries.values():
-    if entry.mstype is not MorphosyntacticType.INDEPENDENT:
-        continue
-    origin_lang, _ = entry.origin.language_and_word()
-    if origin_lang is not OriginLanguage.KASANIC:
-        continue
-
+for entry in Dictionary.load().query().where(mstype=MorphosyntacticType.INDEPENDENT, origin=OriginLanguage.KASANIC):
     lv_lemma = entry.languages[Language.LAUVINKO]
     for pta in lv_lemma.category.primary_aspects:
         abbrev = PTA2ABBREV[pta]
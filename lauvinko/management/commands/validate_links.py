@@ -7,8 +7,7 @@ from mistletoe.ast_renderer import ASTRenderer
 from django.core.management.base import BaseCommand
 from .clean_contents import CONTENTS_FILENAME
 from .clean_dict import DICTIONARY_FILENAME
-
-PAGES_DIR = "pages/"
+from lauvinko.pages import PAGES_DIR
 
 
 def get_section_names(d: dict):
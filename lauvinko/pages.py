@@ -0,0 +1,15 @@
+PAGES_DIR = "pages/"
+
+
+def get_outline(block: dict):
+    lines = block["children"][0]["content"].split("\n")
+    outline = ""
+
+    i = 0
+    while lines[i] != "":
+        outline += lines[i].strip() + " "
+        i += 1
+
+    translation = ' '.join(line.strip() for line in lines[i:]).strip()
+
+    return outline, translation
@@ -1,3 +1,4 @@
+from .shared import *
 from .proto_kasanic import *
 from .lauvinko import *
 from .dictionary import *
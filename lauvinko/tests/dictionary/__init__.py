@@ -1,2 +1,5 @@
 from .entry import DictEntryTests
 from .dictionary import DictionaryTests
+from .paradigms import ParadigmTableTests
+from .search import SearchIndexTests
+from .query import EntryQueryTests
@@ -1,7 +1,191 @@
+import json
+import os.path
+import shutil
+import tempfile
+import threading
 import unittest
-from lauvinko.lang.dictionary.dictionary import Dictionary
+from lauvinko.lang.dictionary.dictionary import Dictionary, DICTIONARY_FILENAME, lexicon_filename
+from lauvinko.lang.dictionary.lazy import LazyEntries
+from lauvinko.lang.dictionary.paradigms import ParadigmRow
+from lauvinko.lang.dictionary.search import SearchIndex
+from lauvinko.lang.shared.semantics import Language
 
 
 class DictionaryTests(unittest.TestCase):
     def test_loads(self):
         Dictionary.from_file()
+
+    def test_version(self):
+        d1 = Dictionary.from_file()
+        d2 = Dictionary.from_file()
+
+        self.assertIsNotNone(d1.version)
+        self.assertEqual(d1.version, d2.version)
+        self.assertIsNone(d1.where(lambda entry: True).version)
+
+    def test_lexicon(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, "dictionary.json")
+            shutil.copy(DICTIONARY_FILENAME, filename)
+
+            self.assertIsNone(Dictionary.from_lexicon(filename))
+
+            d = Dictionary.from_file(filename)
+            d.build_paradigms()
+            d.search_index = SearchIndex(d.entries)
+            d.write_lexicon(lexicon_filename(filename))
+
+            restored = Dictionary.from_lexicon(filename)
+
+            # nothing is decoded until it is used
+            self.assertIsNone(restored._entry_digests)
+            self.assertIsNone(restored._index)
+            self.assertIsNone(restored._search_index)
+
+            self.assertEqual(restored.version, d.version)
+            self.assertEqual(restored.entry_digests, d.entry_digests)
+            self.assertEqual(len(restored.entries.built), 0)
+
+            self.assertEqual(restored.by_id("bake").to_json(), d.by_id("bake").to_json())
+            self.assertEqual(list(restored.entries.built), ["bake"])
+
+            # the rendered entries are read from the lexicon without decoding them
+            self.assertEqual(restored.to_json_bytes(), json.dumps(d.to_json()).encode())
+            self.assertEqual(list(restored.entries.built), ["bake"])
+
+            self.assertEqual(restored.search_index.search("bake"), d.search_index.search("bake"))
+            self.assertIs(restored.search_index.index, restored.index)
+            self.assertEqual(restored.to_json(), d.to_json())
+
+            # a lexicon which another user could have written is not unpickled
+            os.chmod(lexicon_filename(filename), 0o666)
+            self.assertIsNone(Dictionary.from_lexicon(filename))
+            os.chmod(lexicon_filename(filename), 0o644)
+
+            with open(filename, "a") as fh:
+                fh.write("\n")
+
+            self.assertIsNone(Dictionary.from_lexicon(filename))
+
+    def test_compile_lexicon(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, "dictionary.json")
+            shutil.copy(DICTIONARY_FILENAME, filename)
+
+            d = Dictionary.load(filename)
+            self.assertFalse(os.path.exists(lexicon_filename(filename)))
+
+            self.assertTrue(Dictionary.compile_lexicon(filename))
+            self.assertEqual(Dictionary.from_lexicon(filename).to_json(), d.to_json())
+            self.assertFalse(Dictionary.compile_lexicon(filename))
+
+            # the dictionary is read from the lexicon from then on, without waiting for a restart
+            self.assertIsNotNone(Dictionary.load(filename).lexicon)
+
+    def test_lazy(self):
+        eager = Dictionary.from_file()
+        eager.build_paradigms()
+        lazy = Dictionary.from_file(lazy=True)
+
+        self.assertEqual(len(lazy.entries.built), 0)
+        self.assertEqual(lazy.by_id("bake").to_json(), eager.by_id("bake").to_json())
+        self.assertEqual(list(lazy.entries.built), ["bake"])
+        self.assertIsNone(lazy.by_id("nonexistent"))
+
+        self.assertEqual(sorted(lazy.entries), sorted(eager.entries))
+        self.assertEqual(lazy.to_json(), eager.to_json())
+
+        with self.assertRaises(TypeError):
+            LazyEntries([])
+
+    def test_incremental_reload(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, "dictionary.json")
+            shutil.copy(DICTIONARY_FILENAME, filename)
+
+            d1 = Dictionary.from_file(filename)
+            d1.build_paradigms()
+
+            with open(filename) as fh:
+                entries = json.load(fh)
+
+            entries["bake"]["languages"]["pk"]["definition"] = "Bake"
+
+            with open(filename, "w") as fh:
+                json.dump(entries, fh)
+
+            d2 = Dictionary.from_file(filename, previous=d1)
+            d2.build_paradigms()
+
+            self.assertNotEqual(d1.version, d2.version)
+            self.assertIsNot(d2.by_id("bake"), d1.by_id("bake"))
+            self.assertIs(d2.by_id("water"), d1.by_id("water"))
+            self.assertEqual(d2.to_json(), Dictionary.from_file(filename).to_json())
+
+    def test_single_flight_reload(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, "dictionary.json")
+            shutil.copy(DICTIONARY_FILENAME, filename)
+
+            d1 = Dictionary.load(filename)
+
+            with open(filename, "a") as fh:
+                fh.write("\n")
+
+            reloads = []
+            results = []
+            hook = lambda d: reloads.append(d)
+            Dictionary.changes(filename).subscribe(hook)
+
+            try:
+                threads = [threading.Thread(target=lambda: results.append(Dictionary.load(filename))) for _ in range(8)]
+
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            finally:
+                Dictionary.changes(filename).unsubscribe(hook)
+
+            d2 = Dictionary.load(filename)
+
+            self.assertIsNot(d2, d1)
+            self.assertEqual(reloads, [d2])
+            self.assertTrue(all(d is d1 or d is d2 for d in results))
+
+    def test_throttled_change_detection(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            filename = os.path.join(tempdir, "dictionary.json")
+            shutil.copy(DICTIONARY_FILENAME, filename)
+
+            changes = Dictionary.changes(filename)
+            changes.interval = 60
+
+            d1 = Dictionary.load(filename)
+            self.assertIs(Dictionary.load(filename), d1)
+
+            with open(filename, "a") as fh:
+                fh.write("\n")
+
+            # the file was just checked, so it isn't looked at again for a minute
+            self.assertIs(Dictionary.load(filename), d1)
+
+            changes.expire()
+            self.assertIsNot(Dictionary.load(filename), d1)
+
+    def test_pinned(self):
+        main = Dictionary.main()
+        d = Dictionary.from_file()
+
+        with Dictionary.pinned(d):
+            self.assertIs(Dictionary.main(), d)
+
+        self.assertIs(Dictionary.main(), main)
+
+    def test_closed_classes_shared(self):
+        d1 = Dictionary.from_file()
+        d2 = d1.where(lambda entry: entry.ident == "bake")
+
+        self.assertIs(d2.by_id("$tgen$"), d1.by_id("$tgen$"))
+        self.assertIs(d2.by_id("$loc$"), Dictionary.main().by_id("$loc$"))
+        self.assertIsInstance(d1.by_id("if").languages[Language.LAUVINKO].forms, ParadigmRow)
@@ -5,7 +5,7 @@ from lauvinko.lang.shared.semantics import KasanicStemCategory, PrimaryTenseAspe
 from lauvinko.lang.proto_kasanic.morphology import ProtoKasanicLemma
 from lauvinko.lang.proto_kasanic.romanize import falavay as pk_falavay
 from lauvinko.lang.lauvinko.morphology import LauvinkoLemma
-from lauvinko.lang.dictionary.entry import DictEntry
+from lauvinko.lang.dictionary.entry import DictEntry, render_markdown
 
 
 class DictEntryTests(unittest.TestCase):
@@ -72,3 +72,14 @@ class DictEntryTests(unittest.TestCase):
             lv_lemma.form(PrimaryTenseAspect.INCEPTIVE, context=MorphemeContext.NONAUGMENTED).falavay(),
             pk_falavay(pk_lemma.form(PrimaryTenseAspect.INCEPTIVE).surface_form(), False),
         )
+
+    def test_render_markdown_cache(self):
+        first = render_markdown("foo", "lv", "A *word*.")
+
+        self.assertIs(render_markdown("foo", "lv", "A *word*."), first)
+
+        changed = render_markdown("foo", "lv", "Another *word*.")
+
+        self.assertIsNot(changed, first)
+        self.assertNotEqual(changed, first)
+        self.assertIs(render_markdown("foo", "lv", "Another *word*."), changed)
@@ -0,0 +1,42 @@
+import unittest
+from lauvinko.lang.shared.semantics import Language, PrimaryTenseAspect
+from lauvinko.lang.lauvinko.diachronic.base import MorphemeContext
+from lauvinko.lang.dictionary.dictionary import Dictionary
+from lauvinko.lang.dictionary.paradigms import ParadigmRow
+
+
+class ParadigmTableTests(unittest.TestCase):
+    def test_matches_lazy_forms(self):
+        lazy = Dictionary.from_file()
+        d = Dictionary.from_file()
+        d.build_paradigms()
+
+        self.assertEqual(d.to_json(), lazy.to_json())
+
+    def test_parallel_build(self):
+        d1 = Dictionary.from_file()
+        d1.build_paradigms()
+        d2 = Dictionary.from_file()
+        d2.build_paradigms(processes=2)
+
+        self.assertEqual(d2.to_json(), d1.to_json())
+
+    def test_lookup(self):
+        d = Dictionary.from_file()
+        d.build_paradigms()
+
+        lemma = d.by_id("bake").languages[Language.LAUVINKO]
+        self.assertIsInstance(lemma.forms, ParadigmRow)
+
+        cell = (PrimaryTenseAspect.PERFECTIVE, MorphemeContext.NONAUGMENTED)
+        self.assertIs(d.paradigms.form("bake", Language.LAUVINKO, cell), lemma.form(*cell))
+        self.assertIsNone(d.paradigms.form("bake", Language.LAUVINKO, (PrimaryTenseAspect.GENERAL, MorphemeContext.NONAUGMENTED)))
+        self.assertIsNone(d.paradigms.form("nonexistent", Language.PK, PrimaryTenseAspect.PAST))
+
+        with self.assertRaises(TypeError):
+            lemma.forms[cell] = None
+
+        # forms listed explicitly, as loanwords have, only exist in the contexts they are listed for
+        book = d.by_id("book").languages[Language.LAUVINKO]
+        with self.assertRaises(book.NonexistentForm):
+            book.form(PrimaryTenseAspect.GENERAL, MorphemeContext.PREFIXED)
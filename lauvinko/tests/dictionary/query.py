@@ -0,0 +1,41 @@
+import unittest
+from lauvinko.lang.shared.morphology import MorphosyntacticType
+from lauvinko.lang.shared.semantics import KasanicStemCategory, PrimaryTenseAspect
+from lauvinko.lang.lauvinko.diachronic.base import OriginLanguage
+from lauvinko.lang.dictionary.dictionary import Dictionary
+
+
+class EntryQueryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.d = Dictionary.from_file()
+
+    def scanned(self, f) -> list[str]:
+        return [ident for ident, entry in self.d.entries.items() if f(entry)]
+
+    def test_matches_scan(self):
+        query = self.d.query().where(mstype=MorphosyntacticType.INDEPENDENT, origin=OriginLanguage.KASANIC)
+
+        self.assertEqual(
+            [entry.ident for entry in query],
+            self.scanned(lambda entry: entry.mstype is MorphosyntacticType.INDEPENDENT
+                         and entry.origin.language_and_word()[0] is OriginLanguage.KASANIC),
+        )
+        self.assertEqual(len(query), len(list(query)))
+
+    def test_composes(self):
+        fientive = self.d.query().where(category=KasanicStemCategory.FIENTIVE)
+        perfective = self.d.query().where(primary_aspect=PrimaryTenseAspect.PERFECTIVE)
+
+        self.assertIn("bake", [entry.ident for entry in fientive.where(primary_aspect=PrimaryTenseAspect.PERFECTIVE)])
+        self.assertEqual(len(fientive.where(category=KasanicStemCategory.STATIVE)), 0)
+        self.assertTrue(set(fientive.idents) <= set(perfective.idents))
+
+        self.assertEqual([entry.ident for entry in fientive.filter(lambda entry: entry.ident == "bake")], ["bake"])
+
+    def test_alphabetical(self):
+        class_words = self.d.query().where(mstype=MorphosyntacticType.CLASS_WORD).alphabetical()
+        keys = [self.d.index.alphabetization[entry.ident] for entry in class_words]
+
+        self.assertEqual(len(class_words), 24)
+        self.assertEqual(keys, sorted(keys))
@@ -0,0 +1,39 @@
+import unittest
+from lauvinko.lang.dictionary.dictionary import Dictionary
+from lauvinko.lang.dictionary.search import SearchIndex, normalize
+
+
+class SearchIndexTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.index = SearchIndex(Dictionary.from_file().entries)
+
+    def idents(self, *args, **kwargs) -> list[str]:
+        return [ident for ident, _ in self.index.search(*args, **kwargs)]
+
+    def test_definitions(self):
+        self.assertEqual(self.idents("fire clay"), ["bake"])
+        self.assertIn("water", self.idents("wat"))
+        self.assertEqual(self.idents("clay fire nonexistentword"), [])
+
+    def test_forms(self):
+        # memekure is the nonpast frequentative of bake, and emkZel the falavay of its perfective
+        self.assertEqual(self.idents("memekure")[0], "bake")
+        self.assertEqual(self.idents("MEMEKURE")[0], "bake")
+        self.assertIn("bake", self.idents("kure"))
+        self.assertIn("bake", self.idents("emkZ"))
+        self.assertEqual(normalize(" Lauvìnko "), "lauvinko")
+
+    def test_ident(self):
+        self.assertEqual(self.idents("@bake"), ["bake"])
+        self.assertIn("bake", self.idents("@ba"))
+
+    def test_filters(self):
+        everything = self.idents()
+        class_words = self.idents(mstype="class word")
+
+        self.assertEqual(len(everything), len(self.index.entries))
+        self.assertEqual(len(class_words), 24)
+        self.assertEqual(self.idents("fire clay", category="stative"), [])
+        self.assertEqual(self.idents("fire clay", origin="kasanic", category="fientive"), ["bake"])
+        self.assertEqual(self.idents(origin="nonexistent"), [])
@@ -1 +1,2 @@
 from .gloss import GlossingTests
+from .analyzer import AnalyzerTests
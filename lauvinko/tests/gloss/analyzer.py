@@ -0,0 +1,66 @@
+import unittest
+
+from lauvinko.lang.dictionary.dictionary import Dictionary
+from lauvinko.lang.gloss.analyzer import Analyzer, Transcription
+from lauvinko.lang.gloss.gloss import Gloss
+from lauvinko.lang.shared.semantics import Language
+
+OUTLINES = [
+    "if-want-$pro$-$t1s$-$tgen$-cross.$fqnp$.$na$",
+    "before-$t3as:swrf$-$tage$-pull.$inc$.$na$",
+    "$all$=$exp$-$t1s$-$tage$-go.$pf$.$na$=$lea$.$sg$.$na$",
+    "throat.$na$=$rck$.$na$-$abl$",
+    "what.$na$=much.$au$=$rck$.$au$-$loc$",
+    "marry.$gn$.$na$=$femn$=$hea$.$sg$.$na$",
+    "$loc$=sleep.$imnp$.$na$",
+]
+
+# Any number of modal prefixes can be stacked
+STACKED_OUTLINES = [
+    "if-want-before-$pro$-$t1s$-$tgen$-cross.$fqnp$.$na$",
+    "want-want-want-go.$pf$.$na$=$lea$.$sg$.$na$",
+]
+
+
+class AnalyzerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        Dictionary.load()
+        cls.analyzer = Analyzer.main()
+
+    def test_romanization(self):
+        for outline in OUTLINES:
+            word, = Gloss.parse(outline, language=Language.LAUVINKO).romanization()
+            self.assertIn(outline, self.analyzer.analyze(word))
+
+    def test_broad_transcription(self):
+        for outline in OUTLINES:
+            word, = Gloss.parse(outline, language=Language.LAUVINKO).broad_transcription()
+            self.assertIn(outline, self.analyzer.analyze(word, broad=True))
+
+    def test_stacked_modals(self):
+        for outline in STACKED_OUTLINES:
+            word, = Gloss.parse(outline, language=Language.LAUVINKO).romanization()
+            self.assertIn(outline, self.analyzer.analyze(word))
+
+    def test_every_analysis_generates_the_word(self):
+        for outline in OUTLINES[:3] + STACKED_OUTLINES:
+            word, = Gloss.parse(outline, language=Language.LAUVINKO).romanization()
+
+            for analysis in self.analyzer.analyze(word):
+                generated, = Gloss.parse(analysis, language=Language.LAUVINKO).romanization()
+                self.assertEqual(Transcription.read(generated), Transcription.read(word))
+
+    def test_compile(self):
+        analyzer = Analyzer(Dictionary.main())
+        analyzer.compile()
+
+        for outline in OUTLINES[:2]:
+            word, = Gloss.parse(outline, language=Language.LAUVINKO).romanization()
+            self.assertEqual(analyzer.analyze(word), self.analyzer.analyze(word))
+
+    def test_accents_and_breaks(self):
+        self.assertIn("stone.$au$=$rck$.$au$-$loc$", self.analyzer.analyze("Ngí.u"))
+        self.assertIn("before-$t3as:swrf$-$tage$-pull.$inc$.$na$", self.analyzer.analyze("tayimpeh"))
+        self.assertEqual(self.analyzer.analyze("tayimpèh"), [])
+        self.assertEqual(self.analyzer.analyze("qqq"), [])
@@ -2,7 +2,7 @@ from typing import List, Tuple
 from unittest import TestCase
 
 from lauvinko.lang.shared.semantics import Language
-from lauvinko.lang.gloss.gloss import Gloss
+from lauvinko.lang.gloss.gloss import Gloss, GLOSS_CACHE, InvalidGloss
 
 TESTS: List[Tuple[str, List[str], List[str], List[str], List[str]]] = [
     # ("see.impt.na", "jôj.ŋa", "jʊ̂jŋɐ", "eyohqXga", "yòynga"),
@@ -59,3 +59,37 @@ class GlossingTests(TestCase):
                 gloss.romanization(),
                 romanization,
             )
+
+    def test_shared_sources(self):
+        sources = {}
+
+        for source, _, _, _, romanization in TESTS:
+            gloss = Gloss.parse(source, language=Language.LAUVINKO, sources=sources)
+
+            self.assertEqual(
+                gloss.romanization(),
+                romanization,
+            )
+
+        first = Gloss.parse(TESTS[0][0], language=Language.LAUVINKO, sources=sources)
+        second = Gloss.parse(TESTS[0][0], language=Language.LAUVINKO, sources=sources)
+
+        self.assertIs(
+            first.pwords[0].swords[0].morpheme_sources[0],
+            second.pwords[0].swords[0].morpheme_sources[0],
+        )
+
+    def test_cached_json(self):
+        source = TESTS[1][0]
+
+        first = Gloss.cached_json(source, language=Language.LAUVINKO)
+        hits = GLOSS_CACHE.hits
+
+        self.assertEqual(first, Gloss.parse(source, language=Language.LAUVINKO).as_json())
+        self.assertIs(Gloss.cached_json(source, language=Language.LAUVINKO), first)
+        self.assertEqual(GLOSS_CACHE.hits, hits + 1)
+
+    def test_invalid_outlines(self):
+        for source in ["$$$", "see.pst-see", "go.$$", "go.$pf$.$xx$"]:
+            with self.assertRaises(InvalidGloss):
+                Gloss.parse(source, language=Language.LAUVINKO)
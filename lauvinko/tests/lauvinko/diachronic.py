@@ -9,6 +9,8 @@ from lauvinko.lang.proto_kasanic.phonology import ProtoKasanicOnset, ProtoKasani
 from lauvinko.lang.proto_kasanic.morphology import ProtoKasanicMorpheme, pkm, ProtoKasanicLemma
 from lauvinko.lang.proto_kasanic.romanize import romanize as pk_romanize
 from lauvinko.lang.lauvinko.morphology import LauvinkoMorpheme, LauvinkoLemma
+from lauvinko.lang.lauvinko.diachronic.from_pk import ProtoKasanicOrigin, EVOLUTION_CACHE
+from lauvinko.lang.lauvinko.diachronic import encoded, vectorized
 from lauvinko.lang.lauvinko.romanize import romanize as lv_romanize
 
 
@@ -156,6 +158,84 @@ class LauvinkoDiachronicTests(unittest.TestCase):
                     lv_morpheme.original_initial_consonant(),
                 )
 
+    def test_evolution_cache(self):
+        for pk_morpheme, *_ in PK_TESTS:
+            pk_sf = pk_morpheme.surface_form
+
+            for context in MorphemeContext:
+                evolved = ProtoKasanicOrigin.evolve_surface_form(pk_sf, context)
+
+                self.assertEqual(evolved, ProtoKasanicOrigin._evolve_surface_form(pk_sf, context))
+
+                hits = EVOLUTION_CACHE.hits
+                self.assertIs(ProtoKasanicOrigin.evolve_surface_form(pk_sf, context), evolved)
+                self.assertEqual(EVOLUTION_CACHE.hits, hits + 1)
+
+    def test_evolve_batch(self):
+        EVOLUTION_CACHE.clear()
+        jobs = [(pk_morpheme.surface_form, context) for pk_morpheme, *_ in PK_TESTS for context in MorphemeContext]
+        cached = jobs[0]
+        ProtoKasanicOrigin.evolve_surface_form(*cached)
+
+        evolved = ProtoKasanicOrigin.evolve_surface_forms(jobs + jobs)
+
+        self.assertEqual(evolved[:len(jobs)], [ProtoKasanicOrigin._evolve_surface_form(*job) for job in jobs])
+        for lv_sf, duplicate in zip(evolved, evolved[len(jobs):]):
+            self.assertIs(lv_sf, duplicate)
+
+        # forms are taken from the evolution cache, and put in it
+        self.assertIs(evolved[0], ProtoKasanicOrigin.evolve_surface_form(*cached))
+        self.assertIs(evolved[-1], ProtoKasanicOrigin.evolve_surface_form(*jobs[-1]))
+
+        # a form the vectorized passes can't evolve raises as it does on its own
+        with self.assertRaises(KeyError):
+            ProtoKasanicOrigin.evolve_surface_forms(jobs + [(pkm("ngw~").surface_form, MorphemeContext.AUGMENTED)])
+
+    def test_encoded_engine(self):
+        """The encoded sound changes must agree with the reference implementation, and the vectorized ones with
+        them, on every two syllable form, and on every form of the tense/aspect tests
+        """
+        def evolve(engine, pk_sf: PKSurfaceForm, context: MorphemeContext):
+            try:
+                return engine(pk_sf, context)
+            except (ValueError, AssertionError, KeyError) as e:
+                return type(e)
+
+        pk_sfs = [
+            PKSurfaceForm(syllables=sylls, stress_position=stress_position)
+            for sylls in all_pk_sylls(2)
+            for stress_position in (None, *range(len(sylls)))
+        ]
+
+        for pk_morpheme, *_ in FULL_TENSE_ASPECT_TESTS:
+            pk_lemma = ProtoKasanicLemma(
+                ident="",
+                definition="",
+                category=KasanicStemCategory.FIENTIVE,
+                mstype=MorphosyntacticType.INDEPENDENT,
+                forms={},
+                generic_morph=pk_morpheme,
+            )
+
+            pk_sfs += [pk_lemma.form(primary_ta).surface_form() for primary_ta in pk_lemma.category.primary_aspects]
+
+        jobs = [(pk_sf, context) for pk_sf in pk_sfs for context in MorphemeContext]
+
+        for (pk_sf, context), evolved in zip(jobs, vectorized.evolve(jobs).decoded()):
+            expected = evolve(encoded.evolve_syllables, pk_sf, context)
+
+            self.assertEqual(
+                expected,
+                evolve(ProtoKasanicOrigin.evolve_syllables, pk_sf, context),
+                pk_sf.broad_transcription(),
+            )
+
+            # forms the vectorized passes leave to the encoded ones are those they can't evolve
+            if evolved is None:
+                self.assertTrue(expected is None or isinstance(expected, type), pk_sf.broad_transcription())
+            else:
+                self.assertEqual(evolved, expected, pk_sf.broad_transcription())
+
     def test_tense_aspect(self):
         for pk_morpheme, *forms in FULL_TENSE_ASPECT_TESTS:
             pk_lemma = ProtoKasanicLemma(
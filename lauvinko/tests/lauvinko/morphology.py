@@ -1,3 +1,4 @@
+from dataclasses import replace
 import unittest
 from random import randrange, seed
 
@@ -7,7 +8,15 @@ from lauvinko.lang.shared.semantics import KasanicStemCategory
 from lauvinko.lang.proto_kasanic.morphology import ProtoKasanicMorpheme, pkm, ProtoKasanicLemma
 from lauvinko.lang.proto_kasanic.generate import random_pk_lemma
 from lauvinko.lang.lauvinko.phonology import LauvinkoSyllable
-from lauvinko.lang.lauvinko.morphology import LauvinkoLemma, LauvinkoMorpheme, LauvinkoWord, LauvinkoContentWord
+from lauvinko.lang.lauvinko.morphology import (
+    LauvinkoLemma,
+    LauvinkoMorpheme,
+    LauvinkoWord,
+    LauvinkoContentWord,
+    JOIN_CACHE,
+    PREFIX_JOIN_CACHE,
+    EMPTY_JOIN,
+)
 from lauvinko.lang.lauvinko.diachronic.from_pk import ProtoKasanicOrigin
 
 lm = LauvinkoMorpheme.from_informal_transcription
@@ -48,6 +57,39 @@ class LauvinkoMorphologyTests(unittest.TestCase):
                 actual_join.romanization(),
             )
 
+    def test_join_cache(self):
+        for m1, m2, accented, _ in JOINS + CLITICS:
+            joined = LauvinkoMorpheme.join([m1, m2], accented)
+            lv_sf, pk_sf = EMPTY_JOIN.attach(m1, accented == 0).attach(m2, accented == 1).surface_forms()
+
+            self.assertEqual(joined.surface_form, lv_sf)
+            self.assertEqual(joined.virtual_original_form.surface_form, pk_sf)
+
+            # equal morphemes which are not the same objects share the same join
+            hits = JOIN_CACHE.hits
+            rejoined = LauvinkoMorpheme.join([replace(m1), replace(m2)], accented)
+
+            self.assertEqual(JOIN_CACHE.hits, hits + 1)
+            self.assertIs(rejoined.surface_form, joined.surface_form)
+            self.assertIsNot(rejoined, joined)
+
+    def test_prefix_join(self):
+        prefixes = [lm("po/a"), lm("ti")]
+        stems = [lm("tta/"), lm("i/r"), lm("a/r"), lm("soatine\\ni")]
+
+        block = LauvinkoMorpheme.join_prefixes(prefixes)
+
+        for stem in stems:
+            expected = EMPTY_JOIN.attach(prefixes[0], False).attach(prefixes[1], False).attach(stem, True)
+            self.assertEqual(block.attach(stem, True).surface_forms(), expected.surface_forms())
+
+            # joining the whole word reuses the block of prefixes
+            hits = PREFIX_JOIN_CACHE.hits
+            joined = LauvinkoMorpheme.join([*prefixes, stem], 2)
+
+            self.assertEqual(PREFIX_JOIN_CACHE.hits, hits + 1)
+            self.assertEqual(joined.surface_form, expected.surface_forms()[0])
+
     def test_diachronic_join_equivalence(self):
         for pk_morph_1, pk_morph_2, lv_morph in PK_JOINS:
             kwargs = {
@@ -92,7 +134,7 @@ class LauvinkoMorphologyTests(unittest.TestCase):
 
         for _ in range(num_trials):
             pk_lemma_1 = random_pk_lemma(KasanicStemCategory.UNINFLECTED)
-            pk_lemma_1.generic_morph.surface_form.stress_position = None
+            pk_lemma_1.generic_morph.surface_form = replace(pk_lemma_1.generic_morph.surface_form, stress_position=None)
             pk_lemma_2 = random_pk_lemma(KasanicStemCategory.UNINFLECTED)
             augment = randrange(2) == 0
 
@@ -1,6 +1,9 @@
+import dataclasses
+import pickle
 import unittest
 
 from lauvinko.lang.proto_kasanic.phonology import ProtoKasanicOnset, ProtoKasanicMutation
+from lauvinko.lang.lauvinko.phonology import LauvinkoSyllable, LauvinkoVowel, LauvinkoConsonant
 from lauvinko.lang.lauvinko.morphology import LauvinkoMorpheme
 
 
@@ -51,3 +54,33 @@ class LauvinkoPhonologyTests(unittest.TestCase):
                 morpheme.virtual_original_form.end_mutation,
                 mutation,
             )
+
+    def test_immutable(self):
+        for morpheme, *_ in TESTS:
+            sf = morpheme.surface_form
+            self.assertIsInstance(sf.syllables, tuple)
+
+            copy = dataclasses.replace(sf)
+            self.assertEqual(hash(copy), hash(sf))
+
+            with self.assertRaises(dataclasses.FrozenInstanceError):
+                sf.syllables[0].coda = None
+
+    def test_builder(self):
+        syllable = LauvinkoSyllable(onset=LauvinkoConsonant.V, vowel=LauvinkoVowel.O)
+
+        builder = syllable.builder()
+        builder.coda = LauvinkoConsonant.V
+
+        with self.assertRaises(LauvinkoSyllable.InvalidSyllable):
+            builder.build()
+
+        builder.vowel = LauvinkoVowel.A
+        self.assertEqual(builder.build(), LauvinkoSyllable(LauvinkoConsonant.V, LauvinkoVowel.A, LauvinkoConsonant.V))
+        self.assertIsNone(syllable.coda)
+
+    def test_pickled_phonemes(self):
+        for phoneme in (*LauvinkoConsonant, *LauvinkoVowel):
+            pickled = pickle.dumps(phoneme)
+            self.assertNotIn(b"_hash", pickled)
+            self.assertIs(pickle.loads(pickled), phoneme)
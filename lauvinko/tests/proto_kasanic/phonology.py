@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from lauvinko.lang.proto_kasanic.phonology import (
@@ -6,6 +7,7 @@ from lauvinko.lang.proto_kasanic.phonology import (
     ProtoKasanicMutation,
     ProtoKasanicSyllable,
     PKSurfaceForm,
+    PK_SYLLABLES,
 )
 from lauvinko.lang.proto_kasanic.morphology import pkm, ProtoKasanicMorpheme
 
@@ -42,13 +44,37 @@ class ProtoKasanicPhonologyTests(unittest.TestCase):
         m = pkm("rauwaso+N")
         self.assertIs(m.end_mutation, ProtoKasanicMutation.NASALIZATION)
 
+    def test_mutation_tables(self):
+        for mutation, c, expected in [
+            (ProtoKasanicMutation.FORTITION, ProtoKasanicOnset.S, ProtoKasanicOnset.C),
+            (ProtoKasanicMutation.FORTITION, ProtoKasanicOnset.KW, ProtoKasanicOnset.KKW),
+            (ProtoKasanicMutation.FORTITION, ProtoKasanicOnset.M, ProtoKasanicOnset.M),
+            (ProtoKasanicMutation.LENITION, ProtoKasanicOnset.KW, ProtoKasanicOnset.W),
+            (ProtoKasanicMutation.LENITION, ProtoKasanicOnset.NC, ProtoKasanicOnset.NC),
+            (ProtoKasanicMutation.LENITION, ProtoKasanicOnset.NT, ProtoKasanicOnset.N),
+            (ProtoKasanicMutation.LENITION, ProtoKasanicOnset.CC, ProtoKasanicOnset.C),
+            (ProtoKasanicMutation.LENITION, None, None),
+            (ProtoKasanicMutation.NASALIZATION, None, ProtoKasanicOnset.N),
+            (ProtoKasanicMutation.NASALIZATION, ProtoKasanicOnset.W, ProtoKasanicOnset.NGW),
+            (ProtoKasanicMutation.NASALIZATION, ProtoKasanicOnset.P, ProtoKasanicOnset.MP),
+            (ProtoKasanicMutation.NASALIZATION, ProtoKasanicOnset.H, ProtoKasanicOnset.H),
+        ]:
+            self.assertIs(mutation.mutate(c), expected)
+
+    def test_pickled_phonemes(self):
+        # a pickle from another process, where strings hash differently, must unpickle to the same members
+        for phoneme in (*ProtoKasanicOnset, *ProtoKasanicVowel):
+            pickled = pickle.dumps(phoneme)
+            self.assertNotIn(b"_hash", pickled)
+            self.assertIs(pickle.loads(pickled), phoneme)
+
     def test_zero_morpheme(self):
         m = pkm("")
-        self.assertEqual(m.surface_form.syllables, [])
+        self.assertEqual(m.surface_form.syllables, ())
         self.assertIs(m.end_mutation, None)
 
         m = pkm("+F")
-        self.assertEqual(m.surface_form.syllables, [])
+        self.assertEqual(m.surface_form.syllables, ())
         self.assertIs(m.end_mutation, ProtoKasanicMutation.FORTITION)
 
     def test_invalid_transcriptions(self):
@@ -72,6 +98,23 @@ class ProtoKasanicPhonologyTests(unittest.TestCase):
         with self.assertRaises(ProtoKasanicSyllable.InvalidSyllable):
             pkm("war@")
 
+    def test_interning(self):
+        s1 = pkm("kata").surface_form.syllables[0]
+        s2 = pkm("maka").surface_form.syllables[1]
+
+        self.assertIs(s1, s2)
+        self.assertIs(s1, ProtoKasanicSyllable.of(ProtoKasanicOnset.K, ProtoKasanicVowel.A))
+        self.assertIs(pickle.loads(pickle.dumps(s1)), s1)
+
+        with self.assertRaises(ProtoKasanicSyllable.InvalidSyllable):
+            ProtoKasanicSyllable.of(ProtoKasanicOnset.Y, ProtoKasanicVowel.I)
+
+        # the invalid syllable isn't interned, so asking for it again still raises
+        self.assertNotIn((ProtoKasanicOnset.Y, ProtoKasanicVowel.I), PK_SYLLABLES)
+
+        yi = ProtoKasanicSyllable.unvalidated(ProtoKasanicOnset.Y, ProtoKasanicVowel.I)
+        self.assertEqual(pickle.loads(pickle.dumps(yi)), yi)
+
     def test_surface_forms(self):
         sf = ProtoKasanicMorpheme.join(
             [pkm("iso"), pkm("aro")],
@@ -87,6 +130,14 @@ class ProtoKasanicPhonologyTests(unittest.TestCase):
 
         self.assertEqual(sf, pkm("yoyo", stress_position=None).surface_form)
 
+    def test_surface_form_pickling(self):
+        sf = pkm("kanaa").surface_form
+        pickled = pickle.dumps(sf)
+
+        self.assertNotIn(b"_hash", pickled)
+        self.assertEqual(pickle.loads(pickled), sf)
+        self.assertEqual(hash(pickle.loads(pickled)), hash(sf))
+
     def test_invalid_stress(self):
         with self.assertRaises(PKSurfaceForm.InvalidStress):
             pkm("a", stress_position=1)
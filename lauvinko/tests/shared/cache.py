@@ -0,0 +1,33 @@
+import unittest
+
+from lauvinko.lang.shared.cache import LRUCache
+
+
+class LRUCacheTests(unittest.TestCase):
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        self.assertEqual(cache.get("a"), 1)
+
+        cache.put("c", 3)
+
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_stats(self):
+        cache = LRUCache(maxsize=4)
+
+        self.assertEqual(cache.get_or_compute("a", lambda: 1), 1)
+        self.assertEqual(cache.get_or_compute("a", lambda: 2), 1)
+        self.assertIsNone(cache.get("b"))
+
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
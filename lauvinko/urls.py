@@ -7,6 +7,9 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('page/<slug:name>', views.page_content, name="page_content"),
     path('api/gloss', views.gloss, name="gloss"),
+    path('api/gloss/batch', views.gloss_batch, name="gloss_batch"),
     path('api/dict', views.dictionary, name="dictionary"),
+    path('api/dict/search', views.dictionary_search, name="dictionary_search"),
+    path('api/analyze', views.analyze, name="analyze"),
     re_path(r'^.*$', views.react_index, name="react_index")
 ]
@@ -1,12 +1,24 @@
-from django.http import JsonResponse, HttpRequest
+from django.http import JsonResponse, HttpRequest, HttpResponse, Http404
 from django.shortcuts import render
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition, require_POST
+from typing import Optional
+import functools
+import hashlib
 import json
+import logging
+import os.path
 import mistletoe
 from mistletoe.ast_renderer import ASTRenderer
 from lauvinko.lang.dictionary import Dictionary
 from lauvinko.lang.gloss.gloss import Gloss, InvalidGloss
-from lauvinko.lang.lauvinko.morphology import InvalidSyntacticWordSequence
+from lauvinko.lang.gloss.analyzer import Analyzer
+from lauvinko.lang.lauvinko.morphology import InvalidSyntacticWordSequence, LauvinkoMorpheme
+from lauvinko.lang.shared.morphology import MorphemeOrderError
 from lauvinko.lang.shared.semantics import Language
+from lauvinko.pages import PAGES_DIR, get_outline
+
+logger = logging.getLogger(__name__)
 
 
 def json_success(response: dict):
@@ -17,42 +29,302 @@ def unprocessable_entity(message: str):
     return JsonResponse({"success": False, "message": message}, status=422)
 
 
+def pin_dictionary(view):
+    """Loads the dictionary, and has the view use that one dictionary throughout, even if it is reloaded meanwhile"""
+    @functools.wraps(view)
+    def wrapped(request: HttpRequest, *args, **kwargs):
+        with Dictionary.pinned(Dictionary.load()):
+            return view(request, *args, **kwargs)
+
+    return wrapped
+
+
 def react_index(request: HttpRequest):
     return render(request, 'react_index.html')
 
 
-def page_content(_request: HttpRequest, name):
-    with open(f"pages/{name}.md", "r") as fh:
-        blob = json.loads(
-            mistletoe.markdown(fh, renderer=ASTRenderer)
-        )
-        return JsonResponse(blob)
+def gloss_result(outline: str, language_code: str, sources: Optional[dict] = None) -> dict:
+    if language_code not in [l.value for l in Language]:
+        return {"success": False, "message": f"Invalid language: {language_code}"}
 
+    language = Language(language_code)
 
-def gloss(request: HttpRequest):
-    Dictionary.load()
+    try:
+        return {"success": True, "response": Gloss.cached_json(outline, language=language, sources=sources)}
 
-    language_code = request.GET.get("language", Language.LAUVINKO.value)
+    except InvalidGloss as e:
+        return {"success": False, "message": f"Invalid gloss: {e}"}
 
-    if language_code not in [l.value for l in Language]:
-        return unprocessable_entity(f"Invalid language: {language_code}")
+    except InvalidSyntacticWordSequence as e:
+        return {"success": False, "message": f"Invalid syntactic word sequence: {e}"}
+
+    except MorphemeOrderError as e:
+        return {"success": False, "message": f"Invalid morpheme order: {e}"}
+
+    except LauvinkoMorpheme.InvalidAccent as e:
+        return {"success": False, "message": f"Invalid accent: {e}"}
+
+
+def isolated_gloss_result(outline: str, language_code: str, sources: Optional[dict] = None) -> dict:
+    """Like gloss_result, but any other error only fails this one gloss, rather than every other one in the same
+    batch or page. It is logged, since it is a bug rather than a mistake in the outline.
+    """
+    try:
+        return gloss_result(outline, language_code, sources=sources)
+
+    except Exception:
+        logger.exception("Could not gloss outline %r", outline)
+        return {"success": False, "message": "Could not gloss outline"}
+
+
+@pin_dictionary
+def gloss(request: HttpRequest):
+    language_code = request.GET.get("language", Language.LAUVINKO.value)
 
     if "outline" not in request.GET:
         return unprocessable_entity("Must include outline")
 
-    language = Language(language_code)
-    outline = request.GET["outline"]
+    result = gloss_result(request.GET["outline"], language_code)
 
+    return JsonResponse(result, status=(200 if result["success"] else 422))
+
+
+MAX_GLOSS_BATCH_SIZE = 500
+
+
+@pin_dictionary
+@csrf_exempt
+@require_POST
+def gloss_batch(request: HttpRequest):
+    """Glosses a JSON list of {outline, language} items, sharing morpheme lookups between them.
+    Results are returned in the same order, each shaped like a response from the single gloss endpoint.
+    """
     try:
-        gloss = Gloss.parse(outline, language=language)
-        return json_success(gloss.as_json())
+        items = json.loads(request.body)
+    except ValueError:
+        return unprocessable_entity("Request body must be JSON")
 
-    except InvalidGloss as e:
-        return unprocessable_entity(f"Invalid gloss: {e}")
+    if not isinstance(items, list):
+        return unprocessable_entity("Request body must be a list")
 
-    except InvalidSyntacticWordSequence as e:
-        return unprocessable_entity(f"Invalid syntactic word sequence: {e}")
+    if len(items) > MAX_GLOSS_BATCH_SIZE:
+        return unprocessable_entity(f"Cannot gloss more than {MAX_GLOSS_BATCH_SIZE} outlines at once")
+
+    sources = {}
+    results = []
+
+    for item in items:
+        if not isinstance(item, dict) or not isinstance(item.get("outline"), str):
+            results.append({"success": False, "message": "Must include outline"})
+            continue
+
+        results.append(isolated_gloss_result(
+            item["outline"],
+            item.get("language", Language.LAUVINKO.value),
+            sources=sources,
+        ))
+
+    return json_success(results)
+
+
+# Maps a dictionary version to the serialized /api/dict response and its ETag
+DICTIONARY_PAYLOAD_CACHE: dict[str, tuple[bytes, str]] = {}
 
 
+def dictionary_payload() -> tuple[bytes, str]:
+    d = Dictionary.main()
+    cached = DICTIONARY_PAYLOAD_CACHE.get(d.version)
+
+    if cached is None:
+        # the same as json.dumps({"success": True, "response": {"entries": d.to_json()}}), without rendering the
+        # entries read from a lexicon again
+        payload = b'{"success": true, "response": {"entries": %b}}' % d.to_json_bytes()
+        cached = (payload, hashlib.sha1(payload).hexdigest())
+
+        # Another thread may be storing the payload of a different version meanwhile, so this thread
+        # returns its own copy rather than reading it back
+        DICTIONARY_PAYLOAD_CACHE.clear()
+        DICTIONARY_PAYLOAD_CACHE[d.version] = cached
+
+    return cached
+
+
+def dictionary_etag(_request: HttpRequest) -> str:
+    _, etag = dictionary_payload()
+    return etag
+
+
+@pin_dictionary
+@condition(etag_func=dictionary_etag)
 def dictionary(_request: HttpRequest):
-    return json_success({"entries": Dictionary.from_file().to_json()})
+    payload, _ = dictionary_payload()
+    return HttpResponse(payload, content_type="application/json")
+
+
+SEARCH_PAGE_SIZE = 20
+MAX_SEARCH_PAGE_SIZE = 100
+
+
+@pin_dictionary
+def dictionary_search(request: HttpRequest):
+    """Searches entries by definition, notes and the romanization or falavay of any form.
+    Optional origin, category and mstype parameters filter the results, which are paginated with page and page_size.
+    """
+    d = Dictionary.main()
+
+    try:
+        page = int(request.GET.get("page", 1))
+        page_size = int(request.GET.get("page_size", SEARCH_PAGE_SIZE))
+    except ValueError:
+        return unprocessable_entity("page and page_size must be integers")
+
+    if page < 1 or not (1 <= page_size <= MAX_SEARCH_PAGE_SIZE):
+        return unprocessable_entity(f"page must be positive and page_size between 1 and {MAX_SEARCH_PAGE_SIZE}")
+
+    results = d.search_index.search(
+        request.GET.get("q", ""),
+        origin=request.GET.get("origin"),
+        category=request.GET.get("category"),
+        mstype=request.GET.get("mstype"),
+    )
+
+    start = (page - 1) * page_size
+
+    return json_success({
+        "total": len(results),
+        "page": page,
+        "page_size": page_size,
+        "results": [
+            {
+                "ident": ident,
+                "score": score,
+                "entry": d.by_id(ident).to_json(),
+            }
+            for ident, score in results[start:start + page_size]
+        ],
+    })
+
+
+# Each character of a word the analyzer hasn't read the start of before adds to its machine, so words are limited to a
+# length well beyond that of a phonological word with a few prefixes stacked
+MAX_ANALYZED_WORD_LENGTH = 64
+
+
+@pin_dictionary
+def analyze(request: HttpRequest):
+    """Finds the outlines which generate a romanized word, or one in broad IPA if transcription=broad,
+    each with its gloss as returned by the gloss endpoint.
+    """
+    if "word" not in request.GET:
+        return unprocessable_entity("Must include word")
+
+    word = request.GET["word"]
+
+    if len(word) > MAX_ANALYZED_WORD_LENGTH:
+        return unprocessable_entity(f"Cannot analyze words longer than {MAX_ANALYZED_WORD_LENGTH} characters")
+
+    outlines = Analyzer.main().analyze(word, broad=(request.GET.get("transcription") == "broad"))
+
+    return json_success({
+        "word": word,
+        "analyses": [
+            {
+                "outline": outline,
+                "gloss": gloss_result(outline, Language.LAUVINKO.value),
+            }
+            for outline in outlines
+        ],
+    })
+
+
+PAGE_BUNDLES_DIR = "page_bundles/"
+
+
+def page_filename(name: str) -> str:
+    return os.path.join(PAGES_DIR, f"{name}.md")
+
+
+def page_bundle_filename(name: str) -> str:
+    return os.path.join(PAGE_BUNDLES_DIR, f"{name}.json")
+
+
+def gloss_block_language(spec: str) -> str:
+    """Mirrors parseGlossSpec on the frontend"""
+    return spec.split(";")[0] or Language.LAUVINKO.value
+
+
+def embed_glosses(block: dict, sources: dict):
+    if block["type"] == "CodeFence":
+        language_code = gloss_block_language(block["language"])
+
+        if language_code == Language.LAUVINKO.value:
+            try:
+                outline, _ = get_outline(block)
+            except (KeyError, IndexError, TypeError):
+                block["gloss"] = {"success": False, "message": "Could not read outline"}
+            else:
+                block["gloss"] = isolated_gloss_result(outline, language_code, sources=sources)
+
+    for child in block.get("children", []):
+        if isinstance(child, dict):
+            embed_glosses(child, sources)
+
+
+def bundle_page(name: str) -> dict:
+    """Renders a page to the mistletoe AST, with the result of glossing each Lauvinko code fence stored in its "gloss"
+    key. The bundle also records what it was built from, so that stale bundles can be detected.
+    """
+    with open(page_filename(name), "rb") as fh:
+        source = fh.read()
+
+    document = json.loads(mistletoe.markdown(source.decode(), renderer=ASTRenderer))
+    embed_glosses(document, sources={})
+
+    return {
+        "source_digest": hashlib.sha1(source).hexdigest(),
+        "dictionary_version": Dictionary.main().version,
+        "document": document,
+    }
+
+
+def load_page_bundle(name: str) -> Optional[dict]:
+    """Returns the prebuilt bundle for a page, as written by the bundle_pages command, if it is still up to date"""
+    try:
+        with open(page_bundle_filename(name), "r") as fh:
+            bundle = json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+    with open(page_filename(name), "rb") as fh:
+        source_digest = hashlib.sha1(fh.read()).hexdigest()
+
+    if bundle.get("source_digest") != source_digest or bundle.get("dictionary_version") != Dictionary.main().version:
+        return None
+
+    return bundle
+
+
+# Maps a page name to (page source mtime, dictionary version, serialized document)
+PAGE_CACHE: dict[str, tuple[float, str, bytes]] = {}
+
+
+def page_payload(name: str) -> bytes:
+    try:
+        mtime = os.path.getmtime(page_filename(name))
+    except OSError:
+        raise Http404(f"No page named {name}")
+
+    version = Dictionary.main().version
+    cached = PAGE_CACHE.get(name)
+
+    if cached is None or cached[:2] != (mtime, version):
+        bundle = load_page_bundle(name) or bundle_page(name)
+        cached = (mtime, version, json.dumps(bundle["document"]).encode())
+        PAGE_CACHE[name] = cached
+
+    return cached[2]
+
+
+@pin_dictionary
+def page_content(_request: HttpRequest, name):
+    return HttpResponse(page_payload(name), content_type="application/json")
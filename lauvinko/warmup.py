@@ -0,0 +1,34 @@
+import gc
+import os
+
+from lauvinko.lang.dictionary import Dictionary
+from lauvinko.lang.gloss.analyzer import Analyzer
+from lauvinko.pages import PAGES_DIR
+from lauvinko.views import dictionary_payload, page_payload
+
+
+def warm_up():
+    """Builds everything that requests would otherwise build on first use: the dictionary with every form and index,
+    the /api/dict payload, the analyzer's tables and every page. Indexes restored from a lexicon are decoded here too,
+    so that the workers share them rather than each decoding its own. The /api/dict payload is copied from the entries
+    rendered in a lexicon, so it doesn't decode them. Only the analyzer's tables are built from every lemma, which
+    decodes every entry.
+    """
+    with Dictionary.pinned(Dictionary.load()) as dictionary:
+        dictionary_payload()
+        dictionary.search_index
+        Analyzer.main().compile()
+
+        for mdfile in sorted(os.listdir(PAGES_DIR)):
+            name, ext = os.path.splitext(mdfile)
+
+            if ext == ".md":
+                page_payload(name)
+
+
+def freeze():
+    """Moves everything allocated so far out of reach of the garbage collector, which would otherwise write to every
+    object it tracks, so that worker processes forked afterwards keep sharing the pages it is in
+    """
+    gc.collect()
+    gc.freeze()
@@ -1,7 +1,15 @@
 import React, { Component } from "react";
 
-import { MarkdownBlock } from "./types";
-import {LoadedBlockGlossProps, getGlossJson, getPreParts, parseGlossSpec, LoadedBlockGloss} from "./Gloss";
+import { MarkdownBlock, MarkdownPreformatted } from "./types";
+import {
+  GlossResponse,
+  LoadedBlockGlossProps,
+  getGlossBatchJson,
+  getPreParts,
+  glossState,
+  parseGlossSpec,
+  LoadedBlockGloss,
+} from "./Gloss";
 import {renderMarkdownBlock} from "./markdown";
 
 type Props = {
@@ -30,24 +38,48 @@ export default class Document extends Component<Props, State> {
   }
 
   componentDidMount() {
-    this.state.cachedBlocks.forEach(cb => {
-      if (cb.block.type == "CodeFence") {
-        const {language, rows} = parseGlossSpec(cb.block.language);
-        const {outline, translation} = getPreParts(cb.block);
-
-        getGlossJson({language, outline}).then(res => {
-          cb.data = {
-            rows,
-            translation,
-            outline,
-            language,
-            errorMessage: (res.success ? undefined : res.message),
-            content: (res.success ? res.response : undefined),
-          }
-          this.refresh();
-        });
+    const glossBlocks = this.state.cachedBlocks.filter(cb => cb.block.type == "CodeFence");
+
+    const specs = glossBlocks.map(cb => {
+      const block = cb.block as MarkdownPreformatted;
+      return {
+        ...parseGlossSpec(block.language),
+        ...getPreParts(block),
+        gloss: block.gloss,
+      };
+    });
+
+    const setData = (i: number, res: GlossResponse) => {
+      const {language, rows, outline, translation} = specs[i];
+
+      glossBlocks[i].data = {
+        rows,
+        translation,
+        outline,
+        language,
+        ...glossState(res),
+      }
+    };
+
+    // Pages are usually served with their glosses already embedded, so only the rest need fetching
+    const missing = specs.flatMap((spec, i) => spec.gloss === undefined ? [i] : []);
+
+    specs.forEach((spec, i) => {
+      if (spec.gloss !== undefined) {
+        setData(i, spec.gloss);
       }
-    })
+    });
+
+    this.refresh();
+
+    if (missing.length === 0) {
+      return;
+    }
+
+    getGlossBatchJson(missing.map(i => ({language: specs[i].language, outline: specs[i].outline}))).then(results => {
+      results.forEach((res, j) => setData(missing[j], res));
+      this.refresh();
+    });
   }
 
   refresh() {
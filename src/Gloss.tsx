@@ -71,6 +71,22 @@ export function getGlossJson(params: GlossParams): Promise<GlossResponse> {
     .catch(_e => ({success: false, message: "Unknown error"}));
 }
 
+export function getGlossBatchJson(paramsList: GlossParams[]): Promise<GlossResponse[]> {
+  return fetch('/api/gloss/batch', {
+    method: 'POST',
+    headers: {'Content-Type': 'application/json'},
+    body: JSON.stringify(paramsList),
+  })
+    .then(response => response.json())
+    .then((res: ApiResponse<GlossResponse[]>) => {
+      if (res.success) {
+        return res.response;
+      }
+      return paramsList.map(_p => res);
+    })
+    .catch(_e => paramsList.map(_p => ({success: false, message: "Unknown error"} as GlossResponse)));
+}
+
 type AnalysisLabel = {
   text: string,
   link: string,
@@ -86,6 +102,13 @@ export type GlossData = {
 
 export type GlossResponse = ApiResponse<GlossData>;
 
+export function glossState(res: GlossResponse): GlossState {
+  return {
+    errorMessage: (res.success ? undefined : res.message),
+    content: (res.success ? res.response : undefined),
+  };
+}
+
 type InlineGlossProps = GlossParams & {
   rows: GlossRow[],
 }
@@ -454,6 +477,10 @@ function renderMarkdownPreformatted(pre: MarkdownPreformatted) {
   const {language, rows} = parseGlossSpec(pre.language);
   const {outline, translation} = getPreParts(pre)
 
+  if (pre.gloss !== undefined) {
+    return <LoadedBlockGloss {...{language, rows, outline, translation}} {...glossState(pre.gloss)}/>;
+  }
+
   return <BlockGloss {...{language, rows, outline, translation}}/>;
 }
 
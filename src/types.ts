@@ -1,3 +1,5 @@
+import type { GlossResponse } from "./Gloss";
+
 export type SectionDefinition = {
   name: string,
   title: string,
@@ -88,6 +90,7 @@ export type MarkdownPreformatted = {
   type: "CodeFence",
   language: string,
   children: RawText[],
+  gloss?: GlossResponse,
 }
 
 export type MarkdownList = {